@@ -1,5 +1,27 @@
-"""Data types for non-molecular chemical information."""
+"""Data types for non-molecular chemical information.
 
-from . import rate, therm, unit_, util
+Submodules are loaded on first access, so that importing the package is cheap.
+"""
+
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import rate, therm, unit_, util
 
 __all__ = ["rate", "therm", "unit_", "util"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Load submodules on first access (PEP 562)."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List public attributes, including submodules that are not yet loaded."""
+    return sorted(__all__)
@@ -1,16 +1,24 @@
 """Rate constants."""
 
-from . import blend, data
+from . import blend, data, set_
 from ._reaction import (
+    MessOutputReactions,
     Reaction,
     chemkin_equation,
     chemkin_string,
     display,
     expand_lumped,
+    fit_cheb,
+    fit_duplicate_plogs,
+    fit_error,
     fit_high,
     fit_plog,
+    fit_plogs,
+    from_chemkin_file,
+    from_chemkin_lines,
     from_chemkin_string,
     from_mess_channel_output,
+    from_mess_output_file,
 )
 from .blend import (
     BlendingFunction,
@@ -27,6 +35,7 @@ from .data import (
     Rate,
     RateFit,
 )
+from .set_ import ReactionSet
 
 __all__ = [
     # Types
@@ -40,6 +49,9 @@ __all__ = [
     "FalloffRateFit",
     "PlogRateFit",
     "ChebRateFit",
+    #  - Set
+    "ReactionSet",
+    "MessOutputReactions",
     #  - Blend
     "BlendingFunction",
     "LindemannBlendingFunction",
@@ -50,11 +62,18 @@ __all__ = [
     "chemkin_equation",
     #  - Conversions
     "chemkin_string",
+    "from_chemkin_file",
+    "from_chemkin_lines",
     "from_chemkin_string",
     "from_mess_channel_output",
+    "from_mess_output_file",
     #  - Fitting
     "fit_high",
     "fit_plog",
+    "fit_plogs",
+    "fit_duplicate_plogs",
+    "fit_cheb",
+    "fit_error",
     #  - Expansions
     "expand_lumped",
     #  - Display
@@ -62,4 +81,5 @@ __all__ = [
     # Submodules
     "blend",
     "data",
+    "set_",
 ]
@@ -2,18 +2,22 @@
 
 import itertools
 import math
-from collections.abc import Mapping, Sequence
-from typing import ClassVar
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Self
 
-import altair as alt
 import numpy as np
 import pydantic
+from numpy.typing import ArrayLike, NDArray
 
 from ..unit_ import UnitsData
 from ..util import chemkin, mess, plot
 from ..util.type_ import Scalable, Scalers
 from . import data
-from .data import ArrheniusRateFit, PlogRateFit, Rate, Rate_, RateFit
+from .data import ArrheniusRateFit, ChebRateFit, PlogRateFit, Rate, Rate_, RateFit
+
+if TYPE_CHECKING:
+    import altair as alt
 
 
 class Reaction(Scalable):
@@ -53,7 +57,56 @@ def from_chemkin_string(
     """
     # Parse string
     res = chemkin.parse_rate(rxn_str)
+    return from_chemkin_parse_results(res, units=units, strict=strict)
+
+
+def from_chemkin_lines(
+    lines: Iterable[str],
+    *,
+    units: UnitsData | None = None,
+    strict: bool = True,
+) -> Iterator[Reaction]:
+    """Lazily read rates from the lines of a Chemkin REACTIONS block.
+
+    :param lines: Lines of a Chemkin REACTIONS block
+    :param units: Units
+    :param strict: Whether to fail if there are unused aux keys
+    :yield: Rates
+    """
+    for res in chemkin.iter_rates(lines):
+        yield from_chemkin_parse_results(res, units=units, strict=strict)
+
+
+def from_chemkin_file(
+    path: str | Path,
+    *,
+    units: UnitsData | None = None,
+    strict: bool = True,
+) -> Iterator[Reaction]:
+    """Lazily read rates from a Chemkin REACTIONS file.
+
+    :param path: Path to a file containing a Chemkin REACTIONS block
+    :param units: Units
+    :param strict: Whether to fail if there are unused aux keys
+    :yield: Rates
+    """
+    with Path(path).open() as file:
+        yield from from_chemkin_lines(file, units=units, strict=strict)
+
+
+def from_chemkin_parse_results(
+    res: chemkin.ChemkinRateParseResults,
+    *,
+    units: UnitsData | None = None,
+    strict: bool = True,
+) -> Reaction:
+    """Extract rate from Chemkin parse results.
 
+    :param res: Chemkin rate parse results
+    :param units: Units
+    :param strict: Whether to fail if there are unused aux keys
+    :return: Rate
+    """
     # Extract rate constant
     rate_fit = data.from_chemkin_parse_results(res, units=units)
 
@@ -82,6 +135,76 @@ def from_mess_channel_output(
     :return: Rate data
     """
     res = mess.parse_output_channel(mess_chan_out)
+    return from_mess_channel_output_parse_results(res, reversible=reversible)
+
+
+def from_mess_output_file(
+    path: str | Path, *, reversible: bool = True
+) -> "MessOutputReactions":
+    """Read the rates of all channels in a MESS output file.
+
+    The file is scanned once for channel blocks, and each channel is only parsed when
+    it is first accessed.
+
+    :param path: Path to the MESS output file
+    :param reversible: Whether the reactions are reversible
+    :return: Reactions, by (id1, id2) channel
+    """
+    return MessOutputReactions(mess.MessOutputFile(path), reversible=reversible)
+
+
+class MessOutputReactions(Mapping[tuple[str, str], Reaction]):
+    """Reactions of a MESS output file, by (id1, id2) channel, read on first access.
+
+    :param output: MESS output file
+    :param reversible: Whether the reactions are reversible
+    """
+
+    def __init__(self, output: mess.MessOutputFile, *, reversible: bool = True) -> None:
+        """Initialize reactions."""
+        self.output = output
+        self.reversible = reversible
+        self._rxns: dict[tuple[str, str], Reaction] = {}
+
+    def __getitem__(self, key: tuple[str, str]) -> Reaction:
+        """Get the reaction of a channel."""
+        if key not in self._rxns:
+            res = self.output[key]
+            self._rxns[key] = from_mess_channel_output_parse_results(
+                res, reversible=self.reversible
+            )
+        return self._rxns[key]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over channels, in order of appearance."""
+        return iter(self.output)
+
+    def __len__(self) -> int:
+        """Count channels."""
+        return len(self.output)
+
+    def close(self) -> None:
+        """Close the file; reactions that were already read remain available."""
+        self.output.close()
+
+    def __enter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit context, closing the file."""
+        self.close()
+
+
+def from_mess_channel_output_parse_results(
+    res: mess.MessOutputChannelParseResults, *, reversible: bool = True
+) -> Reaction:
+    """Extract rate data from MESS output parse results.
+
+    :param res: MESS output channel parse results
+    :param reversible: Whether the reaction is reversible
+    :return: Reaction
+    """
     assert res.id1 is not None, res
     assert res.id2 is not None, res
 
@@ -248,6 +371,152 @@ def fit_plog(rxn: Reaction, *, sanitize: bool = False) -> Reaction:
     return rxn
 
 
+def fit_plogs(rxns: Sequence[Reaction], *, sanitize: bool = False) -> list[Reaction]:
+    """Fit the rate data of many reactions to Plog.
+
+    The data of all reactions on the same temperature grid, such as all channels of a
+    MESS output file, are fit together in one batch.
+
+    :param rxns: Reactions with rate data
+    :param sanitize: Whether to drop temperatures with missing data first
+    :return: Reactions with rate fits
+    """
+    rates = [plog_fit_data(rxn, sanitize=sanitize) for rxn in rxns]
+    params = plog_fit_parameters(rates, data.arrhenius_fit)
+    return [
+        rxn.model_copy(update={"rate": plog_fit(rate, *ps)})
+        for rxn, rate, ps in zip(rxns, rates, params, strict=True)
+    ]
+
+
+def fit_duplicate_plogs(
+    rxns: Sequence[Reaction], *, sanitize: bool = False
+) -> list[tuple[Reaction, Reaction]]:
+    """Fit the rate data of many reactions to pairs of duplicate Plogs.
+
+    Each pressure is fit to a double Arrhenius expression, whose two terms make up the
+    two Plogs. These should be written with `chemkin_string(..., dup=True)`.
+
+    :param rxns: Reactions with rate data
+    :param sanitize: Whether to drop temperatures with missing data first
+    :return: Pairs of duplicate reactions with rate fits
+    """
+    rates = [plog_fit_data(rxn, sanitize=sanitize) for rxn in rxns]
+    params = plog_fit_parameters(rates, data.double_arrhenius_fit)
+    return [
+        (
+            rxn.model_copy(update={"rate": plog_fit(rate, A[:, 0], b[:, 0], E[:, 0])}),
+            rxn.model_copy(update={"rate": plog_fit(rate, A[:, 1], b[:, 1], E[:, 1])}),
+        )
+        for rxn, rate, (A, b, E) in zip(rxns, rates, params, strict=True)
+    ]
+
+
+def fit_cheb(
+    rxn: Reaction,
+    n_T: int | None = None,  # noqa: N803
+    n_P: int | None = None,  # noqa: N803
+    *,
+    tol: float = data.CHEB_FIT_TOLERANCE,
+    sanitize: bool = False,
+) -> Reaction:
+    """Fit rate data to Chebyshev.
+
+    Orders that are not given are chosen as the smallest that fit the data to within
+    the tolerance; see `fit_error` for the error of the result.
+
+    :param rxn: Reaction with rate data
+    :param n_T: Number of temperature basis functions
+    :param n_P: Number of pressure basis functions
+    :param tol: Tolerance on the maximum absolute error in ln k
+    :param sanitize: Whether to drop temperatures with missing data first
+    :return: Reaction with rate fit
+    """
+    rate = plog_fit_data(rxn, sanitize=sanitize)
+    rate_fit = ChebRateFit.fit(
+        T=rate.T,
+        P=rate.P,
+        k_data=rate.k_data,
+        order=rate.order,
+        n_T=n_T,
+        n_P=n_P,
+        tol=tol,
+    )
+    return rxn.model_copy(update={"rate": rate_fit})
+
+
+def fit_error(rxn_fit: Reaction, rxn: Reaction) -> float:
+    """Get the maximum absolute error in ln k of a fit over rate data.
+
+    :param rxn_fit: Reaction with rate fit
+    :param rxn: Reaction with rate data
+    :return: Error, ignoring missing data
+    """
+    rate = rxn.rate
+    assert isinstance(rate, Rate), rate
+    k = np.transpose(rate.k_data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        err = np.abs(np.log(rxn_fit.rate(rate.T, rate.P) / k))
+    return float(np.nanmax(err, initial=0.0))
+
+
+# Fitting helpers
+def plog_fit_data(rxn: Reaction, *, sanitize: bool = False) -> Rate:
+    """Get the rate data of a reaction for a Plog fit.
+
+    :param rxn: Reaction with rate data
+    :param sanitize: Whether to drop temperatures with missing data
+    :return: Rate data
+    """
+    rate = rxn.rate
+    assert isinstance(rate, Rate), rate
+    return rate.without_nan() if sanitize else rate
+
+
+def plog_fit_parameters(
+    rates: Sequence[Rate],
+    fit: Callable[[ArrayLike, ArrayLike], data.ArrheniusParameters],
+) -> list[data.ArrheniusParameters]:
+    """Fit the pressures of many rates, in one batch per temperature grid.
+
+    :param rates: Rate data
+    :param fit: Arrhenius fitting kernel, mapping temperatures and rows of rate
+        constants to parameters for each row
+    :return: Arrhenius parameters for each rate, by pressure
+    """
+    groups: dict[tuple[float, ...], list[int]] = {}
+    for i, rate in enumerate(rates):
+        groups.setdefault(tuple(rate.T), []).append(i)
+
+    params: list[data.ArrheniusParameters] = [None] * len(rates)  # type: ignore[list-item]
+    for T, idxs in groups.items():  # noqa: N806
+        k = np.concatenate([rates[i].k_data for i in idxs])
+        splits = np.cumsum([len(rates[i].P) for i in idxs])[:-1]
+        params_ = zip(*(np.split(x, splits) for x in fit(T, k)), strict=True)
+        for i, ps in zip(idxs, params_, strict=True):
+            params[i] = ps
+    return params
+
+
+def plog_fit(
+    rate: Rate,
+    A: NDArray[np.float64],  # noqa: N803
+    b: NDArray[np.float64],
+    E: NDArray[np.float64],  # noqa: N803
+) -> PlogRateFit:
+    """Build a Plog rate fit for rate data from Arrhenius parameters by pressure.
+
+    :param rate: Rate data
+    :param A: Pre-exponential factors
+    :param b: Temperature exponents
+    :param E: Activation energies
+    :return: Rate fit
+    """
+    return PlogRateFit(
+        order=rate.order, As=A.tolist(), bs=b.tolist(), Es=E.tolist(), Ps=rate.P
+    )
+
+
 # Display
 def display(  # noqa: PLR0913
     rxn: Reaction | Sequence[Reaction],
@@ -259,7 +528,7 @@ def display(  # noqa: PLR0913
     color: str | Sequence[str] | None = None,
     x_label: str = "1000/𝑇",  # noqa: RUF001
     y_label: str = "𝑘",  # noqa: RUF001
-) -> alt.Chart:
+) -> "alt.Chart":
     """Display one or more reaction rates on an Arrhenius plot.
 
     :param rxn_: Reaction rate(s)
@@ -270,6 +539,8 @@ def display(  # noqa: PLR0913
     :param x_label: X-axis label
     :param y_label: Y-axis label
     """
+    import altair as alt  # noqa: PLC0415
+
     rxns = [rxn] if isinstance(rxn, Reaction) else rxn
     labels = [label] if isinstance(label, str) else label
     colors = [color] if isinstance(color, str) else color
@@ -289,7 +560,7 @@ def display(  # noqa: PLR0913
         labels: Sequence[str] | None,
         colors: Sequence[str] | None,
         mark: str,
-    ) -> alt.Chart:
+    ) -> "alt.Chart":
         rates_ = [rates[i] for i in ixs]
         labels_ = None if labels is None else [labels[i] for i in ixs]
         colors_ = None if colors is None else [colors[i] for i in ixs]
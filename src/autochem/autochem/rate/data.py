@@ -1,28 +1,39 @@
 """Rate constant models."""
 
 import abc
+import functools
+import itertools
 import warnings
 from collections.abc import Mapping
-from typing import Annotated, ClassVar
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal
 
-import altair as alt
 import more_itertools as mit
 import numpy as np
 import pint
 import pydantic
-import xarray
 from numpy.polynomial import chebyshev
 from numpy.typing import ArrayLike, NDArray
 from pydantic import BeforeValidator
 from pydantic_core import core_schema
 
 from .. import unit_
-from ..unit_ import UNITS, C, D, Dimension, UnitManager, Units, UnitsData, const
+from ..unit_ import UNITS, C, D, Dimension, UnitManager, UnitsData, const
 from ..util import chemkin, mess, plot
 from ..util.type_ import Frozen, NDArray_, Scalable, Scalers, SubclassTyped
 from . import blend
 from .blend import BlendingFunction_
 
+if TYPE_CHECKING:
+    import altair as alt
+    import xarray
+
+Interpolation = Literal["nearest", "linear", "cubic"]
+
+# Tolerance on the maximum absolute error in ln k of a Chebyshev fit
+CHEB_FIT_TOLERANCE = 0.05
+# Largest numbers of temperature and pressure basis functions tried in a Chebyshev fit
+CHEB_MAX_ORDERS = (10, 6)
+
 
 class Key:
     """Attribute keys."""
@@ -76,7 +87,7 @@ class BaseRate(UnitManager, Frozen, Scalable, SubclassTyped, abc.ABC):
         """
         T = np.array(T, dtype=np.float128)  # noqa: N806
         P = np.array(P, dtype=np.float128)  # noqa: N806
-        T, P = np.meshgrid(T, P)  # noqa: N806
+        T, P = np.meshgrid(T, P, indexing="ij")  # noqa: N806
         return T, P
 
     def process_output(
@@ -124,7 +135,7 @@ class BaseRate(UnitManager, Frozen, Scalable, SubclassTyped, abc.ABC):
         color: str | None = None,
         x_label: str = "1000/𝑇",  # noqa: RUF001
         y_label: str = "𝑘",  # noqa: RUF001
-    ) -> alt.Chart:
+    ) -> "alt.Chart":
         """Display as an Arrhenius plot.
 
         :param T_range: Temperature range
@@ -192,9 +203,33 @@ class Rate(BaseRate):
         "k_high": D.rate_constant,
     }
 
+    @functools.cached_property
+    def inverse_temperatures(self) -> NDArray[np.float64]:
+        """Inverse temperatures of the grid, in increasing order."""
+        return np.sort(np.reciprocal(np.array(self.T, dtype=np.float64)))
+
+    @functools.cached_property
+    def log_pressures(self) -> NDArray[np.float64]:
+        """Log pressures of the grid, in increasing order, then inf for k_high."""
+        log_P = np.sort(np.log(np.array(self.P, dtype=np.float64)))  # noqa: N806
+        return log_P if self.k_high is None else np.append(log_P, np.inf)
+
+    @functools.cached_property
+    def log_rates(self) -> NDArray[np.float64]:
+        """Log rate constants on the grid, by log pressure and inverse temperature."""
+        k_data = np.array(self.k_data, dtype=np.float64)
+        k_data = k_data[np.argsort(self.P)][:, np.argsort(np.reciprocal(self.T))]
+        if self.k_high is not None:
+            k_high = np.array(self.k_high, dtype=np.float64)
+            k_data = np.vstack((k_data, k_high[np.argsort(np.reciprocal(self.T))]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log(k_data)
+
     @property
-    def data_array(self) -> xarray.DataArray:
+    def data_array(self) -> "xarray.DataArray":
         """Return data as an xarray.DataArray."""
+        import xarray  # noqa: PLC0415
+
         P = self.P  # noqa: N806
         k_data = self.k_data
         if self.k_high is not None:
@@ -233,13 +268,38 @@ class Rate(BaseRate):
         T: ArrayLike,  # noqa: N803
         P: ArrayLike = 1,  # noqa: N803
         units: UnitsData | None = None,  # noqa: ARG002
-    ) -> NDArray[np.float128]:
-        """Evaluate rate constant."""
-        kTP: NDArray[np.float128] = self.data_array.sel(  # noqa: N806
-            {Key.T: T, Key.P: P},
-            method="ffill",
-        ).data
-        return self.process_output(kTP, T, P)
+        method: Interpolation = "linear",
+    ) -> NDArray[np.float64]:
+        """Evaluate rate constant, interpolating log k between grid points.
+
+        Interpolation is in inverse temperature and log pressure. Pressures above the
+        highest finite pressure take its values, unless infinite, in which case they
+        take the high-pressure limit. Other points outside of the grid are NaN.
+
+        :param T: Temperature(s)
+        :param P: Pressure(s)
+        :param units: Input units and desired output units
+        :param method: Interpolation method: nearest, linear, or monotone cubic
+        :return: Value(s)
+        """
+        x_T = np.reciprocal(np.ravel(np.asarray(T, dtype=np.float64)))  # noqa: N806
+        x_P = np.log(np.ravel(np.asarray(P, dtype=np.float64)))  # noqa: N806
+        log_P = self.log_pressures  # noqa: N806
+        log_k = self.log_rates
+
+        # Interpolate in temperature along each pressure, then in pressure
+        log_kPT = interpolate(self.inverse_temperatures, log_k, x_T, method=method)  # noqa: N806
+        log_kTP = np.full((x_T.size, x_P.size), np.nan)  # noqa: N806
+        finite = np.isfinite(log_P)
+        is_high = np.isposinf(x_P)
+        if np.any(finite):
+            x_P_ = np.minimum(x_P[~is_high], log_P[finite][-1])  # noqa: N806
+            log_kTP[:, ~is_high] = interpolate(
+                log_P[finite], log_kPT[finite].T, x_P_, method=method
+            )
+        if not np.all(finite):
+            log_kTP[:, is_high] = log_kPT[~finite].T
+        return self.process_output(np.exp(log_kTP), T, P)
 
     def __add__(self, other: "Rate") -> "Rate":
         """Add rates."""
@@ -331,8 +391,7 @@ class ArrheniusRateFit(RateFit):
     ) -> NDArray[np.float128]:
         """Evaluate rate constant."""
         T_, _ = self.process_input(T, P)  # noqa: N806
-        R = const.value(C.gas, UNITS)  # noqa: N806
-        kTP = self.A * (T_**self.b) * np.exp(-self.E / (R * T_))  # noqa: N806
+        kTP = arrhenius_values(self.A, self.b, self.E, T_)  # noqa: N806
         return self.process_output(kTP, T, P)
 
     @classmethod
@@ -350,19 +409,8 @@ class ArrheniusRateFit(RateFit):
         :param k: Rates
         :return: Rate fit
         """
-        T = np.array(T, dtype=np.float64)  # noqa: N806
-        _1 = np.ones_like(T)
-
-        R = unit_.const.value(C.gas, UNITS)  # noqa: N806
-        M = np.column_stack([_1, np.log(T), -1 / (R * T)])  # noqa: N806
-        v = np.log(k)
-
-        ok = np.isfinite(v)
-        M = M[ok, :]  # noqa: N806
-        v = v[ok]
-
-        (lnA, b, E), *_ = np.linalg.lstsq(M, v, rcond=1e-24)  # noqa: N806
-        return cls(order=order, A=np.exp(lnA), b=b, E=E)
+        A, b, E = arrhenius_fit(T, k)  # noqa: N806
+        return cls(order=order, A=float(A), b=float(b), E=float(E))
 
 
 class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
@@ -396,13 +444,12 @@ class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
     ) -> NDArray[np.float128]:
         """Evaluate rate constant."""
         T_, P_ = self.process_input(T, P)  # noqa: N806
-        P_r = self.effective_reduced_pressure(T_, P_)  # noqa: N806
+        k_low, k_high = self.arrhenius_values(T_)
+        P_r = k_low * self.effective_concentration(T_, P_) / k_high  # noqa: N806
         if self.activated:
-            k_low, _ = self.arrhenius_functions
-            kTP = k_low(T_) / (1 + P_r) * self.function(T_, P_r)  # noqa: N806
+            kTP = k_low / (1 + P_r) * self.function(T_, P_r)  # noqa: N806
         else:
-            _, k_high = self.arrhenius_functions
-            kTP = k_high(T_) * P_r / (1 + P_r) * self.function(T_, P_r)  # noqa: N806
+            kTP = k_high * P_r / (1 + P_r) * self.function(T_, P_r)  # noqa: N806
         return self.process_output(kTP, T, P)
 
     @property
@@ -411,10 +458,10 @@ class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
     ) -> tuple[ArrheniusRateFit, ArrheniusRateFit]:
         """Get low and high temperature arrhenius rate fits."""
         k_low = ArrheniusRateFit(
-            A=self.A_high,
-            b=self.b_high,
-            E=self.E_high,
-            order=self.order,
+            A=self.A_low,
+            b=self.b_low,
+            E=self.E_low,
+            order=self.order + 1,
         )
         k_high = ArrheniusRateFit(
             A=self.A_high,
@@ -424,6 +471,19 @@ class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
         )
         return k_low, k_high
 
+    def arrhenius_values(
+        self,
+        T: NDArray[np.float128],  # noqa: N803
+    ) -> tuple[NDArray[np.float128], NDArray[np.float128]]:
+        """Evaluate low- and high-pressure Arrhenius rate constants.
+
+        :param T: Temperature(s)
+        :return: Low- and high-pressure rate constant(s)
+        """
+        k_low = arrhenius_values(self.A_low, self.b_low, self.E_low, T)
+        k_high = arrhenius_values(self.A_high, self.b_high, self.E_high, T)
+        return k_low, k_high
+
     def effective_concentration(
         self,
         T: NDArray[np.float128],  # noqa: N803
@@ -437,14 +497,7 @@ class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
         :param P: Pressure(s)
         :return: Effective concentration(s)
         """
-        # Evaluate, using pint to handle units
-        R_ = const.quantity(C.gas)  # noqa: N806
-        T_ = pint.Quantity(T, UNITS.temperature)  # noqa: N806
-        P_ = pint.Quantity(P, UNITS.pressure)  # noqa: N806
-        m_ = P_ / (R_ * T_)
-
-        # Return value in concentration units
-        return m_.m_as(UNITS.concentration)
+        return concentration_factor() * np.divide(P, T)
 
     def effective_reduced_pressure(
         self,
@@ -460,8 +513,8 @@ class FalloffRateFit(RateFit, abc.ABC):  # type: ignore[misc]
         :return: Effective reduced pressure(s)
         """
         m_eff = self.effective_concentration(T, P)
-        k_low, k_high = self.arrhenius_functions
-        return k_low(T) * m_eff / k_high(T)
+        k_low, k_high = self.arrhenius_values(T)
+        return k_low * m_eff / k_high
 
 
 class PlogRateFit(RateFit):
@@ -490,10 +543,12 @@ class PlogRateFit(RateFit):
     ) -> NDArray[np.float128]:
         """Evaluate rate constant for a single pressure."""
         T_, P_ = self.process_input(T, P)  # noqa: N806
-        P0 = self.nearest_pressure(P_, which=0)  # noqa: N806
-        P1 = self.nearest_pressure(P_, which=1)  # noqa: N806
-        kT0 = self.nearest_arrhenius_values(T_, P_, which=0)  # noqa: N806
-        kT1 = self.nearest_arrhenius_values(T_, P_, which=1)  # noqa: N806
+        iP0 = self.nearest_index(P_, which=0)  # noqa: N806
+        iP1 = iP0 + 1  # noqa: N806
+        P0 = self.pressure_values(iP0)  # noqa: N806
+        P1 = self.pressure_values(iP1)  # noqa: N806
+        kT0 = self.arrhenius_values(T_, iP0)  # noqa: N806
+        kT1 = self.arrhenius_values(T_, iP1)  # noqa: N806
 
         # Evaluate intermediate pressures
         log_P, log_P0, log_P1 = map(np.log, (P_, P0, P1))  # noqa: N806
@@ -515,16 +570,47 @@ class PlogRateFit(RateFit):
             for A, b, E in zip(self.As, self.bs, self.Es, strict=True)
         ]
 
-    @property
+    @functools.cached_property
     def pressures(self) -> NDArray[np.float128]:
         """Pressures."""
         return np.array(self.Ps, dtype=np.float128)
 
+    @functools.cached_property
+    def arrhenius_parameters(self) -> NDArray[np.float128]:
+        """Arrhenius parameters (A, b, E) for each pressure, 3 x n_P."""
+        return np.array([self.As, self.bs, self.Es], dtype=np.float128)
+
     @property
     def pressure_indices(self) -> list[int]:
         """Pressure indices."""
         return list(range(self.pressures.shape[0]))
 
+    def arrhenius_values(
+        self,
+        T: ArrayLike,  # noqa: N803
+        iP: ArrayLike,  # noqa: N803
+    ) -> NDArray[np.float128]:
+        """Evaluate Arrhenius rate constants at given pressure indices.
+
+        Only the selected Arrhenius function is evaluated at each point.
+
+        :param T: Temperature(s)
+        :param iP: Pressure index (indices), matching the shape of T
+        :return: Rate constant(s), NaN where the index is out of range
+        """
+        valid = np.logical_and(np.greater_equal(iP, 0), np.less(iP, len(self.Ps)))
+        A, b, E = np.take(self.arrhenius_parameters, iP, axis=-1, mode="clip")  # noqa: N806
+        return np.where(valid, arrhenius_values(A, b, E, T), np.nan)
+
+    def pressure_values(self, iP: ArrayLike) -> NDArray[np.float128]:  # noqa: N803
+        """Get pressures at given pressure indices.
+
+        :param iP: Pressure index (indices)
+        :return: Pressure(s), NaN where the index is out of range
+        """
+        valid = np.logical_and(np.greater_equal(iP, 0), np.less(iP, len(self.Ps)))
+        return np.where(valid, np.take(self.pressures, iP, mode="clip"), np.nan)
+
     def nearest_arrhenius_values(
         self,
         T: ArrayLike,  # noqa: N803
@@ -538,12 +624,7 @@ class PlogRateFit(RateFit):
         :return: Nearest function(s)
         """
         iP = self.nearest_index(P, which=which)  # noqa: N806
-        kTs = [k(T) for k in self.arrhenius_functions]  # noqa: N806
-        return np.where(
-            np.isin(iP, self.pressure_indices),
-            np.choose(iP, kTs, mode="clip"),
-            np.nan,
-        )
+        return self.arrhenius_values(T, iP)
 
     def nearest_pressure(
         self,
@@ -557,12 +638,7 @@ class PlogRateFit(RateFit):
         :return: Nearest pressure(s)
         """
         iP = self.nearest_index(P, which=which)  # noqa: N806
-        ps = self.pressures
-        return np.where(
-            np.isin(iP, self.pressure_indices),
-            np.take(ps, iP, mode="clip"),
-            np.nan,
-        )
+        return self.pressure_values(iP)
 
     def nearest_index(
         self,
@@ -575,7 +651,7 @@ class PlogRateFit(RateFit):
         :param which: 0=lower, 1=higher
         :return: Nearest index (indices)
         """
-        return np.searchsorted(self.Ps, P, side="right") - 1 + which
+        return np.searchsorted(self.pressures, P, side="right") - 1 + which
 
     @classmethod
     @unit_.manage_units([D.temperature, D.rate_constant])
@@ -596,26 +672,35 @@ class PlogRateFit(RateFit):
         :param k_high: High-pressure-limit rates
         :return: Rate fit
         """
-        k_data_fits = [
-            ArrheniusRateFit.fit(T=T, k=k, order=order, units=units) for k in k_data
-        ]
-        k_high_fit = None
+        As, bs, Es = arrhenius_fit(T, k_data)  # noqa: N806
         if k_high is not None:
             k_high_fit = ArrheniusRateFit.fit(T=T, k=k_high, order=order, units=units)
             msg = f"Currently not fitting high-pressure limit {k_high_fit}"
             warnings.warn(msg, stacklevel=2)
 
-        return cls(
-            order=order,
-            As=[f.A for f in k_data_fits],
-            bs=[f.b for f in k_data_fits],
-            Es=[f.E for f in k_data_fits],
-            Ps=P,
-        )
+        return cls(order=order, As=As.tolist(), bs=bs.tolist(), Es=Es.tolist(), Ps=P)
+
+
+def cheb_scaled_coefficients(c: ArrayLike, coeffs: ArrayLike) -> NDArray[np.float64]:
+    """Scale the rate constant of a Chebyshev series by a factor.
+
+    Since T_0 = 1, only the constant term of the series for log10 k changes.
+
+    :param c: Scale factor
+    :param coeffs: Coefficients, n_T x n_P
+    :return: Scaled coefficients
+    """
+    coeffs = np.array(coeffs, dtype=np.float64)
+    coeffs[0, 0] += np.log10(c)
+    return coeffs
 
 
 class ChebRateFit(RateFit):
-    """Chebyshev rate fit."""
+    """Chebyshev rate fit.
+
+    The coefficients give log10 k as a Chebyshev series in reduced inverse temperature
+    and log pressure, n_T x n_P, as in Chemkin.
+    """
 
     coeffs: NDArray_
     T_range: tuple[float, float]
@@ -623,13 +708,28 @@ class ChebRateFit(RateFit):
 
     # Private attributes
     type_: ClassVar[str] = "cheb"
-    _scalers: ClassVar[Scalers] = {"coeffs": np.multiply}
+    _scalers: ClassVar[Scalers] = {"coeffs": cheb_scaled_coefficients}
     _dimensions: ClassVar[dict[str, Dimension]] = {
-        "coeffs": D.rate_constant,
         "T_range": D.temperature,
         "P_range": D.pressure,
     }
 
+    def __init__(self, units: UnitsData | None = None, **kwargs: object) -> None:
+        """Instantiate rate.
+
+        The coefficients are logarithmic, so their units are converted by shifting
+        the constant term, rather than by scaling.
+        """
+        if units is not None and kwargs.get("coeffs") is not None:
+            factor = unit_.dim.conversion_factor(
+                unit_.system.validate(units),
+                UNITS,
+                D.rate_constant,
+                order=kwargs.get("order", 1),
+            )
+            kwargs["coeffs"] = cheb_scaled_coefficients(factor, kwargs["coeffs"])
+        super().__init__(units=units, **kwargs)
+
     @unit_.manage_units([D.temperature, D.pressure], D.rate_constant)
     def __call__(
         self,
@@ -638,19 +738,362 @@ class ChebRateFit(RateFit):
         units: UnitsData | None = None,  # noqa: ARG002
     ) -> NDArray[np.float128]:
         """Evaluate rate constant for a single pressure."""
-        # Skip input processing, since chebgrid2d automatically forms the grid
-        T0, T1 = self.T_range  # noqa: N806
-        P0, P1 = self.P_range  # noqa: N806
+        # Skip grid formation, since chebgrid2d automatically forms the grid
+        T_r, P_r = cheb_reduced_coordinates(T, P, self.T_range, self.P_range)  # noqa: N806
+        kTP = np.power(10, chebyshev.chebgrid2d(T_r, P_r, self.coeffs))  # noqa: N806
+        return self.process_output(kTP, T, P)
+
+    @classmethod
+    @unit_.manage_units([D.temperature, D.pressure, D.rate_constant])
+    def fit(  # noqa: PLR0913
+        cls,
+        T: ArrayLike,  # noqa: N803
+        P: ArrayLike,  # noqa: N803
+        k_data: ArrayLike,
+        order: int = 1,
+        n_T: int | None = None,  # noqa: N803
+        n_P: int | None = None,  # noqa: N803
+        tol: float = CHEB_FIT_TOLERANCE,
+        units: UnitsData | None = None,  # noqa: ARG003
+    ) -> "ChebRateFit":
+        """Fit data to Chebyshev rate fit.
 
-        inv_ = np.reciprocal
-        log_ = np.log10
+        Orders that are not given are chosen as the smallest that fit the data to
+        within the tolerance, if possible.
 
-        T_r = (2 * inv_(T) - inv_(T0) - inv_(T1)) / (inv_(T1) - inv_(T0))  # noqa: N806
-        P_r = (2 * log_(P) - log_(P0) - log_(P1)) / (log_(P1) - log_(P0))  # noqa: N806
+        :param T: Temperatures
+        :param P: Pressures
+        :param k_data: Finite pressure rates, n_P x n_T
+        :param order: Reaction order
+        :param n_T: Number of temperature basis functions
+        :param n_P: Number of pressure basis functions
+        :param tol: Tolerance on the maximum absolute error in ln k
+        :return: Rate fit
+        """
+        coeffs, err = cheb_fit(T, P, k_data, n_T=n_T, n_P=n_P, tol=tol)
+        if err > tol:
+            msg = f"Chebyshev fit error {err:.3g} exceeds tolerance {tol:.3g}"
+            warnings.warn(msg, stacklevel=2)
 
-        # AVC: I don't understand why I need to transpose the coefficient matrix here
-        kTP = chebyshev.chebgrid2d(T_r, P_r, self.coeffs.T)  # noqa: N806
-        return self.process_output(kTP, T, P)
+        T_range = (float(np.min(T)), float(np.max(T)))  # noqa: N806
+        P_range = (float(np.min(P)), float(np.max(P)))  # noqa: N806
+        return cls(order=order, coeffs=coeffs, T_range=T_range, P_range=P_range)
+
+
+# Kernels
+def arrhenius_values(
+    A: ArrayLike,  # noqa: N803
+    b: ArrayLike,
+    E: ArrayLike,  # noqa: N803
+    T: ArrayLike,  # noqa: N803
+) -> NDArray[np.float128]:
+    """Evaluate Arrhenius rate constant(s), k = A T^b exp(-E/RT).
+
+    :param A: Pre-exponential factor(s)
+    :param b: Temperature exponent(s)
+    :param E: Activation energy (energies)
+    :param T: Temperature(s)
+    :return: Rate constant(s)
+    """
+    R = const.value(C.gas, UNITS)  # noqa: N806
+    return A * np.power(T, b) * np.exp(-np.divide(E, np.multiply(R, T)))
+
+
+@functools.lru_cache(maxsize=1)
+def concentration_factor() -> float:
+    """Get the factor converting P / T to an effective concentration, [M] = P / R T.
+
+    :return: Factor, in internal units
+    """
+    R_ = const.quantity(C.gas)  # noqa: N806
+    T_ = pint.Quantity(1, UNITS.temperature)  # noqa: N806
+    P_ = pint.Quantity(1, UNITS.pressure)  # noqa: N806
+    return (P_ / (R_ * T_)).m_as(UNITS.concentration)
+
+
+ArrheniusParameters = tuple[
+    NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]
+]
+
+
+def arrhenius_design_matrix(T: ArrayLike) -> NDArray[np.float64]:  # noqa: N803
+    """Build the matrix mapping Arrhenius parameters to log rate constants.
+
+        ln k = ln A + b ln T - E / RT
+
+    :param T: Temperatures, n_T
+    :return: Matrix mapping (ln A, b, E) to ln k, n_T x 3
+    """
+    T = np.asarray(T, dtype=np.float64)  # noqa: N806
+    R = const.value(C.gas, UNITS)  # noqa: N806
+    return np.column_stack([np.ones_like(T), np.log(T), -1 / (R * T)])
+
+
+def arrhenius_fit(
+    T: ArrayLike,  # noqa: N803
+    k: ArrayLike,
+) -> ArrheniusParameters:
+    """Fit rate constants on a temperature grid to Arrhenius expressions.
+
+    The design matrix is built once, and all rows are solved together as a linear
+    least-squares problem in ln k with one right-hand side per row. Missing (NaN) and
+    nonpositive values are left out, by solving each group of rows with the same
+    pattern of valid values together.
+
+    :param T: Temperatures, n_T
+    :param k: Rate constants, ... x n_T
+    :return: Pre-exponential factors, temperature exponents, and activation energies
+    """
+    M = arrhenius_design_matrix(T)  # noqa: N806
+    k = np.asarray(k, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.log(k.reshape(-1, len(M)))
+
+    ok = np.isfinite(v)
+    params = np.zeros((len(v), 3))
+    patterns, groups = np.unique(ok, axis=0, return_inverse=True)
+    for i, pattern in enumerate(patterns):
+        rows = groups.ravel() == i
+        x, *_ = np.linalg.lstsq(M[pattern], v[rows][:, pattern].T, rcond=1e-24)
+        params[rows] = x.T
+
+    lnA, b, E = params.T.reshape(3, *k.shape[:-1])  # noqa: N806
+    return np.exp(lnA), b, E
+
+
+def double_arrhenius_fit(
+    T: ArrayLike,  # noqa: N803
+    k: ArrayLike,
+    T_split: float | None = None,  # noqa: N803
+) -> ArrheniusParameters:
+    """Fit rate constants on a temperature grid to sums of two Arrhenius expressions.
+
+    Single Arrhenius fits of each row over the whole grid, and over the temperatures
+    below and above the split, are solved in one batch by `arrhenius_fit`. Starting
+    from the split fits, each row is then refined by nonlinear least squares in ln k.
+    Where this does not improve on the single fit, or there are too few valid values,
+    the single fit is split evenly between both expressions instead.
+
+    :param T: Temperatures, n_T
+    :param k: Rate constants, ... x n_T
+    :param T_split: Temperature splitting the initial fits (default: median)
+    :return: Pre-exponential factors, temperature exponents, and activation energies,
+        each ... x 2
+    """
+    from scipy import optimize  # noqa: PLC0415
+
+    T = np.asarray(T, dtype=np.float64)  # noqa: N806
+    M = arrhenius_design_matrix(T)  # noqa: N806
+    T_split = np.median(T) if T_split is None else T_split  # noqa: N806
+    k = np.asarray(k, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.log(k.reshape(-1, len(T)))
+
+    # Fit each row over the whole grid, and above and below the split, in one pass
+    v_low = np.where(T_split >= T, v, np.nan)
+    v_high = np.where(T_split <= T, v, np.nan)
+    A, b, E = arrhenius_fit(T, np.exp(np.stack([v, v_low, v_high])))  # noqa: N806
+    x_single = np.stack([np.log(A[0]), b[0], E[0]], axis=-1)
+    x_split = np.concatenate(
+        [np.stack([np.log(A[i]), b[i], E[i]], axis=-1) for i in (1, 2)], axis=-1
+    )
+
+    # Start from a single fit split evenly between two expressions
+    x_half = x_single.copy()
+    x_half[:, 0] -= np.log(2)
+    params = np.concatenate([x_half, x_half], axis=-1)
+
+    for i, (v_row, x0, x1) in enumerate(zip(v, x_single, x_split, strict=True)):
+        ok = np.isfinite(v_row)
+        if np.count_nonzero(ok) < params.shape[-1]:
+            continue
+
+        M_i, v_i = M[ok], v_row[ok]  # noqa: N806
+
+        def residuals(
+            x: NDArray[np.float64],
+            M_i: NDArray[np.float64] = M_i,  # noqa: N803
+            v_i: NDArray[np.float64] = v_i,
+        ) -> NDArray[np.float64]:
+            return np.logaddexp(M_i @ x[:3], M_i @ x[3:]) - v_i
+
+        def jacobian(
+            x: NDArray[np.float64],
+            M_i: NDArray[np.float64] = M_i,  # noqa: N803
+        ) -> NDArray[np.float64]:
+            l1, l2 = M_i @ x[:3], M_i @ x[3:]
+            w1 = 1 / (1 + np.exp(l2 - l1))
+            return np.column_stack([w1[:, None] * M_i, (1 - w1)[:, None] * M_i])
+
+        res = optimize.least_squares(residuals, x1, jac=jacobian, x_scale="jac")
+        cost0 = 0.5 * np.sum((M_i @ x0 - v_i) ** 2)
+        if res.success and res.cost < cost0:
+            params[i] = res.x
+
+    shape = (*k.shape[:-1], 2)
+    lnA, b, E = (params[:, [j, j + 3]].reshape(shape) for j in range(3))  # noqa: N806
+    return np.exp(lnA), b, E
+
+
+def cheb_reduced_coordinates(
+    T: ArrayLike,  # noqa: N803
+    P: ArrayLike,  # noqa: N803
+    T_range: tuple[float, float],  # noqa: N803
+    P_range: tuple[float, float],  # noqa: N803
+) -> tuple[NDArray[np.float128], NDArray[np.float128]]:
+    """Map temperatures and pressures onto [-1, 1] for a Chebyshev series.
+
+    Temperatures are mapped by their inverse and pressures by their log.
+
+    :param T: Temperature(s)
+    :param P: Pressure(s)
+    :param T_range: Temperature range
+    :param P_range: Pressure range
+    :return: Reduced temperature(s) and pressure(s)
+    """
+    T_ = np.array(T, dtype=np.float128)  # noqa: N806
+    P_ = np.array(P, dtype=np.float128)  # noqa: N806
+    T0, T1 = np.reciprocal(np.array(T_range, dtype=np.float128))  # noqa: N806
+    P0, P1 = np.log10(np.array(P_range, dtype=np.float128))  # noqa: N806
+    T_r = (2 * np.reciprocal(T_) - T0 - T1) / (T1 - T0)  # noqa: N806
+    P_r = (2 * np.log10(P_) - P0 - P1) / (P1 - P0)  # noqa: N806
+    return T_r, P_r
+
+
+def cheb_fit(  # noqa: PLR0913
+    T: ArrayLike,  # noqa: N803
+    P: ArrayLike,  # noqa: N803
+    k: ArrayLike,
+    n_T: int | None = None,  # noqa: N803
+    n_P: int | None = None,  # noqa: N803
+    tol: float = CHEB_FIT_TOLERANCE,
+) -> tuple[NDArray[np.float64], float]:
+    """Fit log10 k to a Chebyshev series over the range of the data.
+
+    The design matrix is built once, for the largest orders, and the columns of each
+    candidate order pair are sliced from it. Candidates are tried in order of their
+    number of coefficients, so that the first one within tolerance is the most
+    compact. Missing (non-finite or non-positive) rate constants are skipped.
+
+    :param T: Temperatures, n_T
+    :param P: Pressures, n_P
+    :param k: Rate constants, n_P x n_T
+    :param n_T: Number of temperature basis functions (chosen if `None`)
+    :param n_P: Number of pressure basis functions (chosen if `None`)
+    :param tol: Tolerance on the maximum absolute error in ln k
+    :return: Coefficients, n_T x n_P, and the maximum absolute error in ln k
+    """
+    T = np.asarray(T, dtype=np.float64)  # noqa: N806
+    P = np.asarray(P, dtype=np.float64)  # noqa: N806
+    k = np.asarray(k, dtype=np.float64)
+    T_range = (np.min(T), np.max(T))  # noqa: N806
+    P_range = (np.min(P), np.max(P))  # noqa: N806
+    T_r, P_r = cheb_reduced_coordinates(T, P, T_range, P_range)  # noqa: N806
+
+    # Rows over the (P, T) grid, columns over (i_T, i_P) coefficient pairs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.log10(k).ravel()
+    ok = np.isfinite(y)
+    y = y[ok]
+    n_T_max = min(CHEB_MAX_ORDERS[0], T.size) if n_T is None else n_T  # noqa: N806
+    n_P_max = min(CHEB_MAX_ORDERS[1], P.size) if n_P is None else n_P  # noqa: N806
+    V_T = chebyshev.chebvander(T_r.astype(np.float64), n_T_max - 1)  # noqa: N806
+    V_P = chebyshev.chebvander(P_r.astype(np.float64), n_P_max - 1)  # noqa: N806
+    X = np.einsum("ti,pj->ptij", V_T, V_P)[ok.reshape(P.size, T.size)]  # noqa: N806
+
+    candidates = sorted(
+        itertools.product(
+            range(1, n_T_max + 1) if n_T is None else [n_T],
+            range(1, n_P_max + 1) if n_P is None else [n_P],
+        ),
+        key=lambda n: (n[0] * n[1], n),
+    )
+    coeffs, err = np.zeros((1, 1)), np.inf
+    for n_T_, n_P_ in candidates:  # noqa: N806
+        if n_T_ * n_P_ > y.size:
+            break
+        X_ = X[:, :n_T_, :n_P_].reshape(y.size, -1)  # noqa: N806
+        c, *_ = np.linalg.lstsq(X_, y, rcond=None)
+        coeffs = c.reshape(n_T_, n_P_)
+        err = float(np.max(np.abs(X_ @ c - y), initial=0.0) * np.log(10))
+        if err <= tol:
+            break
+    return coeffs, err
+
+
+def interpolate(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    x_new: NDArray[np.float64],
+    method: Interpolation = "linear",
+) -> NDArray[np.float64]:
+    """Interpolate rows of values on a shared grid, without extrapolating.
+
+    The monotone cubic is the piecewise cubic Hermite interpolant of Fritsch and
+    Carlson, which does not overshoot the data.
+
+    :param x: Grid points, in increasing order, n
+    :param y: Values, ... x n
+    :param x_new: New points, m
+    :param method: Interpolation method: nearest, linear, or monotone cubic
+    :return: Interpolated values, ... x m, which are NaN outside of the grid, and only
+        depend on the value at a grid point itself if there
+    """
+    y = np.asarray(y, dtype=np.float64)
+    out = (x_new < x[0]) | (x_new > x[-1])
+    if x.size == 1 or method == "nearest":
+        i = np.clip(np.searchsorted(x, x_new), 1, max(x.size - 1, 1))
+        if x.size > 1:
+            i = np.where(x_new - x[i - 1] <= x[i] - x_new, i - 1, i)
+        return np.where(out, np.nan, y[..., i - (x.size == 1)])
+
+    i = np.clip(np.searchsorted(x, x_new) - 1, 0, x.size - 2)
+    h = x[i + 1] - x[i]
+    t = (x_new - x[i]) / h
+    y0, y1 = y[..., i], y[..., i + 1]
+    if method == "linear":
+        y_new = y0 + t * (y1 - y0)
+    else:
+        d = pchip_slopes(x, y)
+        h00 = (1 + 2 * t) * (1 - t) ** 2
+        h10 = t * (1 - t) ** 2
+        h01 = t**2 * (3 - 2 * t)
+        h11 = t**2 * (t - 1)
+        y_new = h00 * y0 + h10 * h * d[..., i] + h01 * y1 + h11 * h * d[..., i + 1]
+    y_new = np.where(t == 0, y0, np.where(t == 1, y1, y_new))
+    return np.where(out, np.nan, y_new)
+
+
+def pchip_slopes(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get the slopes of a monotone piecewise cubic Hermite interpolant.
+
+    Interior slopes are weighted harmonic means of the neighboring secants, or zero at
+    local extrema. End slopes use a shape-preserving three-point formula.
+
+    :param x: Grid points, in increasing order, n >= 2
+    :param y: Values, ... x n
+    :return: Slopes, ... x n
+    """
+    h = np.diff(x)
+    delta = np.diff(y, axis=-1) / h
+    if x.size == 2:
+        return np.concatenate([delta, delta], axis=-1)
+
+    d = np.zeros_like(y)
+    w1, w2 = 2 * h[1:] + h[:-1], h[1:] + 2 * h[:-1]
+    d0, d1 = delta[..., :-1], delta[..., 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d[..., 1:-1] = np.where(d0 * d1 > 0, (w1 + w2) / (w1 / d0 + w2 / d1), 0.0)
+
+    for end, (h0, h1, s0, s1) in (
+        (0, (h[0], h[1], delta[..., 0], delta[..., 1])),
+        (-1, (h[-1], h[-2], delta[..., -1], delta[..., -2])),
+    ):
+        d_end = ((2 * h0 + h1) * s0 - h0 * s1) / (h0 + h1)
+        d_end = np.where(np.sign(d_end) != np.sign(s0), 0.0, d_end)
+        overshoot = (np.sign(s0) != np.sign(s1)) & (np.abs(d_end) > 3 * np.abs(s0))
+        d[..., end] = np.where(overshoot, 3 * s0, d_end)
+    return d
 
 
 Rate_ = Annotated[
@@ -780,7 +1223,7 @@ def from_chemkin_parse_results(
     order = len(res.reactants) + bool(efficiencies)
 
     # Determine units
-    units = Units() if units is None else Units.model_validate(units)
+    units = unit_.system.validate(units)
 
     if "CHEB" in res.aux_numbers:
         # Read coefficients
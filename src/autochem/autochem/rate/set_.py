@@ -0,0 +1,545 @@
+"""Vectorized rate constants for many reactions."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from .. import unit_
+from ..unit_ import UNITS, D, UnitsData
+from ..util.type_ import Frozen, NDArray_
+from . import _reaction, blend, data
+from ._reaction import Reaction
+from .data import ArrheniusRateFit, ChebRateFit, FalloffRateFit, PlogRateFit
+
+# Blending function codes, used to select a form for each falloff reaction
+LINDEMANN = 0
+TROE = 1
+SRI = 2
+
+
+class ArrheniusGroup(Frozen):
+    """Arrhenius rate fits, packed into arrays.
+
+    :param index: Reaction indices in the set
+    :param A: Pre-exponential factors
+    :param b: Temperature exponents
+    :param E: Activation energies
+    """
+
+    index: list[int]
+    A: NDArray_
+    b: NDArray_
+    E: NDArray_
+
+    def __call__(
+        self,
+        T: NDArray[np.floating],  # noqa: N803
+        P: NDArray[np.floating],  # noqa: N803
+    ) -> NDArray[np.floating]:
+        """Evaluate rate constants.
+
+        :param T: Temperatures, n_T
+        :param P: Pressures, n_P
+        :return: Rate constants, n_rxn x n_T x n_P
+        """
+        kT = arrhenius(self.A, self.b, self.E, T)  # noqa: N806
+        return np.broadcast_to(kT[..., np.newaxis], (*kT.shape, P.size))
+
+
+class FalloffGroup(Frozen):
+    """Falloff rate fits, packed into arrays.
+
+    Blending function parameters are padded with NaN for reactions that don't use them.
+
+    :param index: Reaction indices in the set
+    :param A_high: High-pressure pre-exponential factors
+    :param b_high: High-pressure temperature exponents
+    :param E_high: High-pressure activation energies
+    :param A_low: Low-pressure pre-exponential factors
+    :param b_low: Low-pressure temperature exponents
+    :param E_low: Low-pressure activation energies
+    :param activated: Whether each reaction is chemically activated
+    :param function: Blending function codes (Lindemann, Troe, or SRI)
+    :param troe: Troe parameters (A, T3, T1, T2), n_rxn x 4
+    :param sri: SRI parameters (a, b, c, d, e), n_rxn x 5
+    """
+
+    index: list[int]
+    A_high: NDArray_
+    b_high: NDArray_
+    E_high: NDArray_
+    A_low: NDArray_
+    b_low: NDArray_
+    E_low: NDArray_
+    activated: NDArray_
+    function: NDArray_
+    troe: NDArray_
+    sri: NDArray_
+
+    def __call__(
+        self,
+        T: NDArray[np.floating],  # noqa: N803
+        P: NDArray[np.floating],  # noqa: N803
+    ) -> NDArray[np.floating]:
+        """Evaluate rate constants.
+
+        :param T: Temperatures, n_T
+        :param P: Pressures, n_P
+        :return: Rate constants, n_rxn x n_T x n_P
+        """
+        k_low = arrhenius(self.A_low, self.b_low, self.E_low, T)[..., np.newaxis]
+        k_high = arrhenius(self.A_high, self.b_high, self.E_high, T)[..., np.newaxis]
+        P_r = k_low * concentration(T, P) / k_high  # noqa: N806
+
+        # Evaluate each blending function form over the reactions that use it
+        T_ = T[np.newaxis, :, np.newaxis]  # noqa: N806
+        F = np.ones_like(P_r)  # noqa: N806
+        is_troe = self.function == TROE
+        is_sri = self.function == SRI
+        if np.any(is_troe):
+            F[is_troe] = troe(*self.troe[is_troe].T, T_, P_r[is_troe])
+        if np.any(is_sri):
+            F[is_sri] = sri(*self.sri[is_sri].T, T_, P_r[is_sri])
+
+        activated = self.activated.astype(bool)[:, np.newaxis, np.newaxis]
+        return np.where(activated, k_low, k_high * P_r) / (1 + P_r) * F
+
+
+class PlogGroup(Frozen):
+    """Plog rate fits, packed into pressure tables.
+
+    Tables are padded with NaN for reactions with fewer pressures.
+
+    :param index: Reaction indices in the set
+    :param Ps: Pressures, n_rxn x n_P_max
+    :param As: Pre-exponential factors, n_rxn x n_P_max
+    :param bs: Temperature exponents, n_rxn x n_P_max
+    :param Es: Activation energies, n_rxn x n_P_max
+    """
+
+    index: list[int]
+    Ps: NDArray_
+    As: NDArray_
+    bs: NDArray_
+    Es: NDArray_
+
+    def __call__(
+        self,
+        T: NDArray[np.floating],  # noqa: N803
+        P: NDArray[np.floating],  # noqa: N803
+    ) -> NDArray[np.floating]:
+        """Evaluate rate constants.
+
+        Values are interpolated linearly in log(P) between the nearest tabulated
+        pressures and are NaN outside of the tabulated range.
+
+        :param T: Temperatures, n_T
+        :param P: Pressures, n_P
+        :return: Rate constants, n_rxn x n_T x n_P
+        """
+        Ps = self.Ps.astype(T.dtype)  # noqa: N806
+        n_ps = np.sum(~np.isnan(Ps), axis=-1, keepdims=True)
+        kTs = np.swapaxes(arrhenius(self.As, self.bs, self.Es, T), 1, 2)  # noqa: N806
+
+        # Find the nearest lower and higher pressure indices, n_rxn x n_P
+        iP0 = np.sum(Ps[:, :, np.newaxis] <= P, axis=1) - 1  # noqa: N806
+        iP1 = iP0 + 1  # noqa: N806
+
+        def _nearest(iP: NDArray[np.int_]) -> tuple[NDArray, NDArray]:  # noqa: N803
+            valid = (iP >= 0) & (iP < n_ps)
+            iP = np.clip(iP, 0, Ps.shape[-1] - 1)  # noqa: N806
+            P_ = np.where(valid, np.take_along_axis(Ps, iP, axis=-1), np.nan)  # noqa: N806
+            kT = np.take_along_axis(kTs, iP[:, np.newaxis, :], axis=-1)  # noqa: N806
+            kT = np.where(valid[:, np.newaxis, :], kT, np.nan)  # noqa: N806
+            return P_[:, np.newaxis, :], kT
+
+        P0, kT0 = _nearest(iP0)  # noqa: N806
+        P1, kT1 = _nearest(iP1)  # noqa: N806
+
+        # Evaluate intermediate pressures, then fill in on-boundary pressures
+        log_P, log_P0, log_P1 = map(np.log, (P, P0, P1))  # noqa: N806
+        with np.errstate(invalid="ignore"):
+            kTP = kT0 + (kT1 - kT0) * (log_P - log_P0) / (log_P1 - log_P0)  # noqa: N806
+        return np.where(np.equal(P, P0), kT0, kTP)
+
+
+class ChebGroup(Frozen):
+    """Chebyshev rate fits, packed into coefficient stacks.
+
+    Coefficient matrices are padded with zeros, which leaves their values unchanged.
+
+    :param index: Reaction indices in the set
+    :param coeffs: Coefficient matrices for log10 k, n_rxn x n_T_max x n_P_max
+    :param T_range: Temperature ranges, n_rxn x 2
+    :param P_range: Pressure ranges, n_rxn x 2
+    """
+
+    index: list[int]
+    coeffs: NDArray_
+    T_range: NDArray_
+    P_range: NDArray_
+
+    def __call__(
+        self,
+        T: NDArray[np.floating],  # noqa: N803
+        P: NDArray[np.floating],  # noqa: N803
+    ) -> NDArray[np.floating]:
+        """Evaluate rate constants.
+
+        :param T: Temperatures, n_T
+        :param P: Pressures, n_P
+        :return: Rate constants, n_rxn x n_T x n_P
+        """
+        inv_ = np.reciprocal
+        log_ = np.log10
+
+        T0, T1 = inv_(self.T_range.astype(T.dtype).T[..., np.newaxis])  # noqa: N806
+        P0, P1 = log_(self.P_range.astype(P.dtype).T[..., np.newaxis])  # noqa: N806
+        T_r = (2 * inv_(T) - T0 - T1) / (T1 - T0)  # noqa: N806
+        P_r = (2 * log_(P) - P0 - P1) / (P1 - P0)  # noqa: N806
+
+        n, m = self.coeffs.shape[1:]
+        V_T = chebyshev.chebvander(T_r, n - 1)  # noqa: N806
+        V_P = chebyshev.chebvander(P_r, m - 1)  # noqa: N806
+        log_kTP = np.einsum("rij,rti,rpj->rtp", self.coeffs, V_T, V_P)  # noqa: N806
+        return np.power(10, log_kTP)
+
+
+class ReactionSet(Frozen):
+    """Rate fits for many reactions, grouped by form and packed into arrays.
+
+    Evaluates all reactions over a temperature and pressure grid in one vectorized
+    pass per rate form, returning an array of shape (n_rxn, n_T, n_P).
+
+    :param equations: Reaction equations
+    :param orders: Reaction orders
+    :param arrhenius: Arrhenius rate fits
+    :param falloff: Falloff rate fits
+    :param plog: Plog rate fits
+    :param cheb: Chebyshev rate fits
+    """
+
+    equations: list[str]
+    orders: list[int]
+    arrhenius: ArrheniusGroup | None = None
+    falloff: FalloffGroup | None = None
+    plog: PlogGroup | None = None
+    cheb: ChebGroup | None = None
+
+    @property
+    def groups(
+        self,
+    ) -> list[ArrheniusGroup | FalloffGroup | PlogGroup | ChebGroup]:
+        """Non-empty rate form groups."""
+        groups = (self.arrhenius, self.falloff, self.plog, self.cheb)
+        return [group for group in groups if group is not None]
+
+    def index(self, eq: str) -> int:
+        """Get the index of a reaction.
+
+        :param eq: Reaction equation
+        :return: Index
+        """
+        return self.equations.index(eq)
+
+    def __call__(
+        self,
+        T: ArrayLike,  # noqa: N803
+        P: ArrayLike = 1,  # noqa: N803
+        units: UnitsData | None = None,
+        dtype: DTypeLike = np.float128,
+    ) -> NDArray[np.floating]:
+        """Evaluate rate constants for all reactions.
+
+        :param T: Temperature(s)
+        :param P: Pressure(s)
+        :param units: Input units and desired output units
+        :param dtype: Floating point type for evaluation, e.g. np.float64 for speed
+        :return: Rate constants, n_rxn x shape(T) x shape(P)
+        """
+        units = unit_.system.validate(units)
+        T_ = unit_.dim.convert(units, UNITS, D.temperature, T)  # noqa: N806
+        P_ = unit_.dim.convert(units, UNITS, D.pressure, P)  # noqa: N806
+        T_ = np.reshape(np.asarray(T_, dtype=dtype), -1)  # noqa: N806
+        P_ = np.reshape(np.asarray(P_, dtype=dtype), -1)  # noqa: N806
+
+        kTP = np.full((len(self.equations), T_.size, P_.size), np.nan, dtype=dtype)  # noqa: N806
+        for group in self.groups:
+            kTP[group.index] = group(T_, P_)
+
+        # Convert units, which depend on reaction order
+        factors = [
+            unit_.dim.conversion_factor(UNITS, units, D.rate_constant, order=order)
+            for order in self.orders
+        ]
+        kTP *= np.reshape(factors, (-1, 1, 1)).astype(dtype)  # noqa: N806
+        kTP = np.reshape(kTP, (-1, *np.shape(T), *np.shape(P)))  # noqa: N806
+        return np.where(np.less_equal(kTP, 0), np.nan, kTP)
+
+
+# Constructors
+def from_reactions(rxns: Sequence[Reaction]) -> ReactionSet:
+    """Build a reaction set from reactions with rate fits.
+
+    :param rxns: Reactions
+    :return: Reaction set
+    """
+    arrh_rates: dict[int, ArrheniusRateFit] = {}
+    fall_rates: dict[int, FalloffRateFit] = {}
+    plog_rates: dict[int, PlogRateFit] = {}
+    cheb_rates: dict[int, ChebRateFit] = {}
+    for idx, rxn in enumerate(rxns):
+        match rxn.rate:
+            case ArrheniusRateFit():
+                arrh_rates[idx] = rxn.rate
+            case FalloffRateFit():
+                fall_rates[idx] = rxn.rate
+            case PlogRateFit():
+                plog_rates[idx] = rxn.rate
+            case ChebRateFit():
+                cheb_rates[idx] = rxn.rate
+            case _:
+                eq = _reaction.chemkin_equation(rxn)
+                msg = f"Reaction {eq} has no packable rate fit: {type(rxn.rate)}"
+                raise NotImplementedError(msg)
+
+    return ReactionSet(
+        equations=list(map(_reaction.chemkin_equation, rxns)),
+        orders=[rxn.rate.order for rxn in rxns],
+        arrhenius=arrhenius_group(arrh_rates) if arrh_rates else None,
+        falloff=falloff_group(fall_rates) if fall_rates else None,
+        plog=plog_group(plog_rates) if plog_rates else None,
+        cheb=cheb_group(cheb_rates) if cheb_rates else None,
+    )
+
+
+def from_chemkin_string(
+    rxn_block_str: str,
+    *,
+    units: UnitsData | None = None,
+    strict: bool = True,
+) -> ReactionSet:
+    """Build a reaction set from a Chemkin REACTIONS block.
+
+    :param rxn_block_str: Chemkin REACTIONS block string
+    :param units: Units
+    :param strict: Whether to fail if there are unused aux keys
+    :return: Reaction set
+    """
+    lines = rxn_block_str.splitlines()
+    rxns = _reaction.from_chemkin_lines(lines, units=units, strict=strict)
+    return from_reactions(list(rxns))
+
+
+def from_chemkin_file(
+    path: str | Path,
+    *,
+    units: UnitsData | None = None,
+    strict: bool = True,
+) -> ReactionSet:
+    """Build a reaction set from a Chemkin REACTIONS file.
+
+    :param path: Path to a file containing a Chemkin REACTIONS block
+    :param units: Units
+    :param strict: Whether to fail if there are unused aux keys
+    :return: Reaction set
+    """
+    rxns = _reaction.from_chemkin_file(path, units=units, strict=strict)
+    return from_reactions(list(rxns))
+
+
+# Groups
+def arrhenius_group(rates: dict[int, ArrheniusRateFit]) -> ArrheniusGroup:
+    """Pack Arrhenius rate fits into a group.
+
+    :param rates: Rate fits, by reaction index
+    :return: Group
+    """
+    return ArrheniusGroup(
+        index=list(rates.keys()),
+        A=[rate.A for rate in rates.values()],
+        b=[rate.b for rate in rates.values()],
+        E=[rate.E for rate in rates.values()],
+    )
+
+
+def falloff_group(rates: dict[int, FalloffRateFit]) -> FalloffGroup:
+    """Pack falloff rate fits into a group.
+
+    :param rates: Rate fits, by reaction index
+    :return: Group
+    """
+    functions = []
+    troe_params = []
+    sri_params = []
+    for rate in rates.values():
+        troe_row = [np.nan] * 4
+        sri_row = [np.nan] * 5
+        match rate.function:
+            case blend.LindemannBlendingFunction():
+                functions.append(LINDEMANN)
+            case blend.TroeBlendingFunction():
+                func = rate.function
+                functions.append(TROE)
+                troe_row = [
+                    func.A,
+                    func.T3,
+                    func.T1,
+                    np.nan if func.T2 is None else func.T2,
+                ]
+            case blend.SriBlendingFunction():
+                func = rate.function
+                functions.append(SRI)
+                sri_row = [func.a, func.b, func.c, func.d, func.e]
+            case _:
+                msg = f"Unknown blending function: {rate.function}"
+                raise NotImplementedError(msg)
+        troe_params.append(troe_row)
+        sri_params.append(sri_row)
+
+    return FalloffGroup(
+        index=list(rates.keys()),
+        A_high=[rate.A_high for rate in rates.values()],
+        b_high=[rate.b_high for rate in rates.values()],
+        E_high=[rate.E_high for rate in rates.values()],
+        A_low=[rate.A_low for rate in rates.values()],
+        b_low=[rate.b_low for rate in rates.values()],
+        E_low=[rate.E_low for rate in rates.values()],
+        activated=[rate.activated for rate in rates.values()],
+        function=functions,
+        troe=troe_params,
+        sri=sri_params,
+    )
+
+
+def plog_group(rates: dict[int, PlogRateFit]) -> PlogGroup:
+    """Pack Plog rate fits into a group.
+
+    :param rates: Rate fits, by reaction index
+    :return: Group
+    """
+    n_max = max(len(rate.Ps) for rate in rates.values())
+
+    def _pad(vals: Sequence[float]) -> list[float]:
+        return [*vals, *([np.nan] * (n_max - len(vals)))]
+
+    return PlogGroup(
+        index=list(rates.keys()),
+        Ps=[_pad(rate.Ps) for rate in rates.values()],
+        As=[_pad(rate.As) for rate in rates.values()],
+        bs=[_pad(rate.bs) for rate in rates.values()],
+        Es=[_pad(rate.Es) for rate in rates.values()],
+    )
+
+
+def cheb_group(rates: dict[int, ChebRateFit]) -> ChebGroup:
+    """Pack Chebyshev rate fits into a group.
+
+    :param rates: Rate fits, by reaction index
+    :return: Group
+    """
+    n_max = max(np.shape(rate.coeffs)[0] for rate in rates.values())
+    m_max = max(np.shape(rate.coeffs)[1] for rate in rates.values())
+    coeffs = np.zeros((len(rates), n_max, m_max))
+    for row, rate in zip(coeffs, rates.values(), strict=True):
+        n, m = np.shape(rate.coeffs)
+        row[:n, :m] = rate.coeffs
+
+    return ChebGroup(
+        index=list(rates.keys()),
+        coeffs=coeffs,
+        T_range=[rate.T_range for rate in rates.values()],
+        P_range=[rate.P_range for rate in rates.values()],
+    )
+
+
+# Kernels
+def arrhenius(
+    A: NDArray[np.floating],  # noqa: N803
+    b: NDArray[np.floating],
+    E: NDArray[np.floating],  # noqa: N803
+    T: NDArray[np.floating],  # noqa: N803
+) -> NDArray[np.floating]:
+    """Evaluate Arrhenius rate constants, k = A T^b exp(-E/RT).
+
+    :param A: Pre-exponential factors, any shape
+    :param b: Temperature exponents, same shape as A
+    :param E: Activation energies, same shape as A
+    :param T: Temperatures, n_T
+    :return: Rate constants, shape(A) x n_T
+    """
+    A, b, E = (np.asarray(x, dtype=T.dtype)[..., np.newaxis] for x in (A, b, E))  # noqa: N806
+    return data.arrhenius_values(A, b, E, T)
+
+
+def concentration(
+    T: NDArray[np.floating],  # noqa: N803
+    P: NDArray[np.floating],  # noqa: N803
+) -> NDArray[np.floating]:
+    """Evaluate effective concentrations, [M] = P / R T (ideal gas law).
+
+    :param T: Temperatures, n_T
+    :param P: Pressures, n_P
+    :return: Effective concentrations, n_T x n_P
+    """
+    return data.concentration_factor() * P[np.newaxis, :] / T[:, np.newaxis]
+
+
+def troe(  # noqa: PLR0913
+    A: NDArray[np.floating],  # noqa: N803
+    T3: NDArray[np.floating],  # noqa: N803
+    T1: NDArray[np.floating],  # noqa: N803
+    T2: NDArray[np.floating],  # noqa: N803
+    T: NDArray[np.floating],  # noqa: N803
+    P_r: NDArray[np.floating],  # noqa: N803
+) -> NDArray[np.floating]:
+    """Evaluate Troe blending functions.
+
+    :param A: Parameters A, n_rxn
+    :param T3: Parameters T3, n_rxn
+    :param T1: Parameters T1, n_rxn
+    :param T2: Parameters T2 (NaN if unused), n_rxn
+    :param T: Temperatures, broadcastable to P_r
+    :param P_r: Reduced pressures, n_rxn x n_T x n_P
+    :return: Function values, n_rxn x n_T x n_P
+    """
+    A, T3, T1, T2 = (x[:, np.newaxis, np.newaxis] for x in (A, T3, T1, T2))  # noqa: N806
+    f_cent = (1 - A) * np.exp(-T / T3) + A * np.exp(-T / T1)
+    f_cent = f_cent + np.where(np.isnan(T2), 0.0, np.exp(-T2 / T))
+    log_f_cent = np.log10(f_cent)
+    n = 0.75 - 1.27 * log_f_cent
+    c = -0.4 - 0.67 * log_f_cent
+    log_p_r_plus_c = np.log10(P_r) + c
+    f1 = log_p_r_plus_c / (n - 0.14 * log_p_r_plus_c)
+    return np.power(10, log_f_cent / (1 + f1**2))
+
+
+def sri(  # noqa: PLR0913
+    a: NDArray[np.floating],
+    b: NDArray[np.floating],
+    c: NDArray[np.floating],
+    d: NDArray[np.floating],
+    e: NDArray[np.floating],
+    T: NDArray[np.floating],  # noqa: N803
+    P_r: NDArray[np.floating],  # noqa: N803
+) -> NDArray[np.floating]:
+    """Evaluate SRI blending functions.
+
+    :param a: Parameters a, n_rxn
+    :param b: Parameters b, n_rxn
+    :param c: Parameters c, n_rxn
+    :param d: Parameters d, n_rxn
+    :param e: Parameters e, n_rxn
+    :param T: Temperatures, broadcastable to P_r
+    :param P_r: Reduced pressures, n_rxn x n_T x n_P
+    :return: Function values, n_rxn x n_T x n_P
+    """
+    a, b, c, d, e = (x[:, np.newaxis, np.newaxis] for x in (a, b, c, d, e))
+    return (
+        d
+        * (a * np.exp(-b / T) + np.exp(-T / c)) ** (1 / (1 + np.log10(P_r) ** 2))
+        * np.power(T, e)
+    )
@@ -0,0 +1,377 @@
+"""Benchmark autochem.therm and autochem.rate hot paths.
+
+Run as a script, optionally saving results to compare against another commit:
+
+    python -m autochem.tests.benchmark -o new.json
+    python -m autochem.tests.benchmark -k rate --compare old.json
+
+Inputs are synthetic, generated from a fixed seed, so results are comparable across
+commits and no files or network access are needed.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy
+
+from autochem import rate, therm, unit_
+from autochem.unit_ import UNITS, D
+from autochem.util import chemkin
+
+SEED = 20250721
+
+# Number of timing repeats, of which the minimum and median are reported
+REPEAT = 5
+
+# Evaluation grids
+TEMPS = numpy.linspace(300, 3000, 200)
+PRESSURES = numpy.logspace(-2, 2, 50)
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark, given a function that sets it up.
+
+    The setup function returns the zero-argument function that is timed.
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+# Synthetic inputs
+def messpf_output_string(nvib: int = 15, dT: float = 10.0) -> str:  # noqa: N803
+    """Generate MESS-PF output for a rigid-rotor, harmonic-oscillator species."""
+    rng = numpy.random.default_rng(SEED)
+    thetas = rng.uniform(200, 4500, nvib)
+    T = numpy.append(numpy.arange(200, 3000 + dT, dT), 298.2)  # noqa: N806
+    x = thetas[:, None] / T
+    ex = numpy.exp(-x)
+    Z0 = 20 + 3 * numpy.log(T) - numpy.log(1 - ex).sum(axis=0)  # noqa: N806
+    Z1 = 3 / T + (x / T * ex / (1 - ex)).sum(axis=0)  # noqa: N806
+    Z2 = -3 / T**2 + (  # noqa: N806
+        x / T**2 * ex / (1 - ex) * (x / (1 - ex) - 2)
+    ).sum(axis=0)
+    R = 1.98720  # noqa: N806
+    S = R * (Z0 + T * Z1)  # noqa: N806
+    C = R * (T**2 * Z2 + 2 * T * Z1)  # noqa: N806
+    lines = [
+        "Natural log of the partition function, its derivatives, entropy, and "
+        "thermal capacity:",
+        "T, K    SPC  SPC  SPC  SPC  SPC",
+        "Z_0  Z_1  Z_2  S, cal/mol/K  C, cal/mol/K",
+        *(
+            f"{t:<8g} {z0:12.6g} {z1:12.6g} {z2:12.6g} {s:12.6g} {c:12.6g}"
+            for t, z0, z1, z2, s, c in zip(T, Z0, Z1, Z2, S, C, strict=True)
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def messpf_species() -> therm.Species:
+    """Read the synthetic MESS-PF output."""
+    return therm.from_messpf_output_string(
+        messpf_output_string(),
+        formula="C5H7",
+        name="SPC",
+        Hf=86.0,
+        units={"energy": "kcal"},
+    )
+
+
+def thermo_block_string(nspc: int = 100) -> str:
+    """Generate a Chemkin THERMO block of perturbed copies of a fitted species."""
+    rng = numpy.random.default_rng(SEED)
+    fit = therm.fit(messpf_species(), T_min=200, T_mid=1000, T_max=3000)
+    spc_strs = []
+    for i in range(nspc):
+        fit_i = fit.model_copy(
+            update={
+                "name": f"SPC{i}",
+                "therm": fit.therm.model_copy(
+                    update={
+                        "coeffs_low": list(
+                            fit.therm.coeffs_low * rng.normal(1, 1e-3, 7)
+                        ),
+                        "coeffs_high": list(
+                            fit.therm.coeffs_high * rng.normal(1, 1e-3, 7)
+                        ),
+                    }
+                ),
+            }
+        )
+        spc_strs.append(therm.chemkin_string(fit_i))
+    return "\n".join(spc_strs)
+
+
+RATE_TEMPLATES = {
+    "arrhenius": "A{i}+B{i}=C{i}+D{i}  2.945E+06  2.087  -1455.0\n",
+    "lindemann": (
+        "A{i}+B{i}(+M)=C{i}(+M)  1.880E+11  0.000  2430.0\n"
+        "    LOW / 1.400E+21 -2.100 5500.0 /\n"
+    ),
+    "troe": (
+        "A{i}(+M)=B{i}+C{i}(+M)  8.000E+12  0.440  88770\n"
+        "    LOW / 7.000E+50 -9.310 99860 /\n"
+        "    TROE / 7.345E-01 1.800E+02 1.035E+03 5.417E+03 /\n"
+    ),
+    "sri": (
+        "A{i}+A{i}(+M)=B{i}+C{i}(+M)  4.989E+12  0.099  10600.0\n"
+        "    HIGH / 3.80E-7 4.838 7710. /\n"
+        "    SRI / 1.641 4334 2725 /\n"
+    ),
+    "plog": (
+        "A{i}+B{i}=C{i}  2.560E+36  -7.752  6946\n"
+        "    PLOG / 1.000E-02 1.740E+43 -10.460 7699 /\n"
+        "    PLOG / 2.500E-02 3.250E+37 -8.629 5215 /\n"
+        "    PLOG / 1.000E-01 1.840E+35 -7.750 4909 /\n"
+        "    PLOG / 1.000E+00 2.560E+36 -7.752 6946 /\n"
+        "    PLOG / 1.000E+01 3.700E+33 -6.573 7606 /\n"
+        "    PLOG / 1.000E+02 1.120E+26 -4.101 5757 /\n"
+    ),
+    "cheb": (
+        "A{i}(+M)=B{i}+C{i}(+M)  1.000E+00  0.000  0.000\n"
+        "    TCHEB / 300.000 2200.000 /\n"
+        "    PCHEB / 0.010 98.702 /\n"
+        "    CHEB / 6 4 /\n"
+        "    CHEB / 4.859e+00 9.247e-01 -3.655e-02 2.971e-15 /\n"
+        "    CHEB / -3.682e-02 4.836e-02 2.294e-02 4.705e-17 /\n"
+        "    CHEB / -3.061e-15 -4.107e-16 1.623e-17 -1.319e-30 /\n"
+        "    CHEB / 3.682e-02 -4.836e-02 -2.294e-02 -4.705e-17 /\n"
+        "    CHEB / -4.859e+00 -9.247e-01 3.655e-02 -2.971e-15 /\n"
+        "    CHEB / 3.682e-02 -4.836e-02 -2.294e-02 -4.705e-17 /\n"
+    ),
+}
+
+
+def rate_block_string(nrxn: int = 20) -> str:
+    """Generate a Chemkin REACTIONS block with `nrxn` reactions of each type."""
+    return "".join(
+        template.format(i=f"{type_}{i}")
+        for type_, template in RATE_TEMPLATES.items()
+        for i in range(nrxn)
+    )
+
+
+# Thermo benchmarks
+@benchmark("therm.from_messpf_output_string")
+def _() -> Callable[[], object]:
+    pf_str = messpf_output_string()
+    return lambda: therm.from_messpf_output_string(
+        pf_str, formula="C5H7", Hf=86.0, units={"energy": "kcal"}
+    )
+
+
+@benchmark("therm.Therm.properties")
+def _() -> Callable[[], object]:
+    data = messpf_species().therm
+
+    def evaluate() -> None:
+        data.heat_capacity_data()
+        data.entropy_data()
+        data.enthalpy_data()
+
+    return evaluate
+
+
+@benchmark("therm.fit")
+def _() -> Callable[[], object]:
+    spc = messpf_species()
+    return lambda: therm.fit(spc, T_min=200, T_mid=1000, T_max=3000)
+
+
+@benchmark("therm.fit[continuous]")
+def _() -> Callable[[], object]:
+    spc = messpf_species()
+    return lambda: therm.fit(spc, T_min=200, T_mid=1000, T_max=3000, continuous=True)
+
+
+@benchmark("therm.Nasa7ThermFit.properties")
+def _() -> Callable[[], object]:
+    fit = therm.fit(messpf_species(), T_min=200, T_mid=1000, T_max=3000).therm
+
+    def evaluate() -> None:
+        fit.heat_capacity(TEMPS)
+        fit.entropy(TEMPS)
+        fit.enthalpy(TEMPS)
+
+    return evaluate
+
+
+@benchmark("therm.ThermTable.gibbs_energy")
+def _() -> Callable[[], object]:
+    table = therm.table.from_chemkin_string(thermo_block_string())
+    return lambda: table.gibbs_energy(TEMPS)
+
+
+@benchmark("chemkin.parse_thermo")
+def _() -> Callable[[], object]:
+    spc_str = thermo_block_string(1)
+    return lambda: chemkin.parse_thermo(spc_str)
+
+
+@benchmark("therm.from_chemkin_lines")
+def _() -> Callable[[], object]:
+    lines = thermo_block_string().splitlines()
+    return lambda: list(therm.from_chemkin_lines(lines))
+
+
+# Rate benchmarks
+for _type in RATE_TEMPLATES:
+
+    @benchmark(f"chemkin.parse_rate[{_type}]")
+    def _(type_: str = _type) -> Callable[[], object]:
+        rxn_str = RATE_TEMPLATES[type_].format(i=0)
+        return lambda: chemkin.parse_rate(rxn_str)
+
+    @benchmark(f"rate.RateFit.__call__[{_type}]")
+    def _(type_: str = _type) -> Callable[[], object]:
+        rate_ = rate.from_chemkin_string(RATE_TEMPLATES[type_].format(i=0)).rate
+        return lambda: rate_(TEMPS, PRESSURES)
+
+
+@benchmark("rate.Rate.__call__")
+def _() -> Callable[[], object]:
+    rxn = rate.from_chemkin_string(RATE_TEMPLATES["plog"].format(i=0))
+    T = numpy.linspace(500, 2000, 16)  # noqa: N806
+    P = numpy.logspace(-1, 2, 4)  # noqa: N806
+    k_data = numpy.asarray(rxn.rate(T, P), dtype=numpy.float64).T
+    rate_ = rate.Rate(T=T, P=P, k_data=k_data, order=rxn.rate.order)
+    return lambda: rate_(T, P)
+
+
+@benchmark("rate.ReactionSet.__call__")
+def _() -> Callable[[], object]:
+    rxn_set = rate.set_.from_chemkin_string(rate_block_string())
+    return lambda: rxn_set(TEMPS, PRESSURES)
+
+
+@benchmark("rate.from_chemkin_string[block]")
+def _() -> Callable[[], object]:
+    rxn_strs = rate_block_string(5)
+    return lambda: rate.set_.from_chemkin_string(rxn_strs)
+
+
+@benchmark("rate.PlogRateFit.fit")
+def _() -> Callable[[], object]:
+    rxn = rate.from_chemkin_string(RATE_TEMPLATES["plog"].format(i=0))
+    T = numpy.linspace(500, 2000, 16)  # noqa: N806
+    P = numpy.logspace(-2, 2, 5)  # noqa: N806
+    k_data = numpy.asarray(rxn.rate(T, P), dtype=numpy.float64).T
+    return lambda: rate.PlogRateFit.fit(T=T, P=P, k_data=k_data)
+
+
+# Unit benchmarks
+@benchmark("unit_.dim.convert")
+def _() -> Callable[[], object]:
+    units = unit_.system.validate({"energy": "kcal", "pressure": "bar"})
+    vals = numpy.linspace(0, 100, 1000)
+    return lambda: unit_.dim.convert(units, UNITS, D.energy_per_substance, vals)
+
+
+# Running
+def run(
+    pattern: str = "*", repeat: int = REPEAT, min_time: float = 0.2
+) -> dict[str, dict[str, float]]:
+    """Run the benchmarks whose names match a pattern.
+
+    Each benchmark is called enough times per repeat to take at least `min_time`.
+
+    :param pattern: Shell-style pattern, matched against benchmark names
+    :param repeat: Number of repeats
+    :param min_time: Minimum time per repeat, in seconds
+    :return: Number of calls per repeat, and minimum and median times per call, in
+        seconds, by benchmark name
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern) and pattern not in name:
+            continue
+
+        timer = timeit.Timer(setup())
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+        results[name] = {
+            "number": number,
+            "min": min(times),
+            "median": statistics.median(times),
+        }
+        print(f"{name:45} {min(times) * 1e3:12.4f} ms", file=sys.stderr)
+    return results
+
+
+def metadata() -> dict[str, str]:
+    """Describe the environment the benchmarks are run in."""
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=Path(__file__).parent,
+    ).stdout.strip()
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(tz=datetime.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def compare(results: dict[str, dict[str, float]], path: str | Path) -> str:
+    """Compare results to those saved in a file.
+
+    :param results: Benchmark results
+    :param path: Path to saved results
+    :return: Table of minimum times and their ratios, new / old
+    """
+    old_results = json.loads(Path(path).read_text())["results"]
+    lines = [f"{'benchmark':45} {'old/ms':>12} {'new/ms':>12} {'ratio':>8}"]
+    for name, res in results.items():
+        if name not in old_results:
+            continue
+        old, new = old_results[name]["min"], res["min"]
+        lines.append(f"{name:45} {old * 1e3:12.4f} {new * 1e3:12.4f} {new / old:8.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", default="*", help="only run benchmarks matching this")
+    parser.add_argument("-o", "--output", help="save results to this JSON file")
+    parser.add_argument("--compare", help="compare to results saved in this file")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timing repeats")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    results = run(args.k, repeat=args.repeat)
+    if args.output is not None:
+        data = {"metadata": metadata(), "results": results}
+        Path(args.output).write_text(json.dumps(data, indent=2) + "\n")
+    if args.compare is not None:
+        print(compare(results, args.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Test the benchmark suite."""
+
+import json
+
+from autochem.tests import benchmark
+
+
+def test__benchmarks():
+    # Each benchmark sets up and runs once, without timing
+    for setup in benchmark.BENCHMARKS.values():
+        setup()()
+
+
+def test__run(tmp_path):
+    results = benchmark.run("unit_.dim.*", repeat=1, min_time=0)
+    assert list(results) == ["unit_.dim.convert"]
+
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"results": results}))
+    assert "unit_.dim.convert" in benchmark.compare(results, path)
+
+
+if __name__ == "__main__":
+    test__benchmarks()
@@ -0,0 +1,38 @@
+"""Test import-time costs."""
+
+import subprocess
+import sys
+
+# Modules that should only be loaded for plotting or tabulated data
+HEAVY_MODULES = ("altair", "pandas", "xarray")
+
+
+def import_report(stmt: str) -> tuple[float, list[str]]:
+    """Time an import in a fresh interpreter and report which modules it loaded."""
+    code = "\n".join(
+        [
+            "import sys, time",
+            "t0 = time.perf_counter()",
+            stmt,
+            "print(time.perf_counter() - t0)",
+            "print(' '.join(sys.modules))",
+        ]
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    time_str, mods_str = out.splitlines()[-2:]
+    return float(time_str), mods_str.split()
+
+
+def test__lazy_import():
+    _, mods = import_report("import autochem")
+    assert not any(m.startswith("autochem.") for m in mods), mods
+
+    _, mods = import_report("from autochem import rate, therm")
+    loaded = [m for m in HEAVY_MODULES if m in mods]
+    assert not loaded, f"Heavy modules loaded on import: {loaded}"
+
+
+if __name__ == "__main__":
+    test__lazy_import()
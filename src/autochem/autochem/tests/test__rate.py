@@ -203,6 +203,56 @@ def test__from_chemkin_string(name, data, check_roundtrip: bool):
     assert numpy.shape(kT1P1) == (4, 3), kT1P1
 
 
+def test__from_chemkin_file(tmp_path):
+    datas = [SIMPLE, THREEBODY, FALLOFF_TROE, ACTIVATED_SRI, PLOG, CHEB]
+    rxn_strs = [d.get("chemkin") for d in datas]
+    rxns = [rate.from_chemkin_string(s, units={"energy": "cal"}) for s in rxn_strs]
+
+    path = tmp_path / "reactions.dat"
+    path.write_text("\n".join(["REACTIONS CAL/MOLE", "! comment", *rxn_strs, "END"]))
+    rxns_ = list(rate.from_chemkin_file(path, units={"energy": "cal"}))
+    assert len(rxns) == len(rxns_), f"{len(rxns)} != {len(rxns_)}"
+    for rxn, rxn_ in zip(rxns, rxns_, strict=True):
+        assert rxn.model_dump_json() == rxn_.model_dump_json(), f"{rxn} != {rxn_}"
+
+    # Malformed reactions are reported by line number
+    with pytest.raises(ValueError, match="Line 2"):
+        list(rate.from_chemkin_lines(["REACTIONS", "A+B=C 1.0 0.0"]))
+
+
+def test__plog_values():
+    rxn = rate.from_chemkin_string(PLOG["chemkin"], units=PLOG["units"])
+    T = [500, 1000, 1500]
+    P = [0.001, *rxn.rate.Ps, 1000]
+
+    # Tabulated pressures match their Arrhenius functions, others are out of range
+    kTP = rxn.rate(T, P)
+    for iP, k in enumerate(rxn.rate.arrhenius_functions, start=1):
+        assert numpy.allclose(kTP[:, iP], k(T)), f"{kTP[:, iP]} != {k(T)}"
+    assert numpy.all(numpy.isnan(kTP[:, [0, -1]])), kTP
+
+
+def test__reaction_set():
+    datas = [SIMPLE, THREEBODY, FALLOFF, FALLOFF_TROE, ACTIVATED, ACTIVATED_SRI, PLOG]
+    datas.append(CHEB)
+    rxns = [rate.from_chemkin_string(d["chemkin"], units=d["units"]) for d in datas]
+    rxn_set = rate.set_.from_reactions(rxns)
+
+    # Evaluating the set matches evaluating each reaction over the grid
+    units = {"energy": "kcal", "substance": "mol"}
+    T = [500, 1000, 1500, 2000]
+    P = [0.01, 0.1, 1, 10, 100]
+    for dtype in (numpy.float128, numpy.float64):
+        kTPs = rxn_set(T, P, units=units, dtype=dtype)
+        assert kTPs.shape == (len(rxns), len(T), len(P)), kTPs.shape
+        for rxn, kTP in zip(rxns, kTPs, strict=True):
+            ref_kTP = rxn.rate(T, P, units=units)
+            assert numpy.allclose(kTP, ref_kTP, equal_nan=True), f"{kTP} != {ref_kTP}"
+
+    # Scalar temperatures and pressures are squeezed out
+    assert rxn_set(1000, 1).shape == (len(rxns),)
+
+
 @pytest.mark.parametrize(
     "name, data",
     [
@@ -249,6 +299,49 @@ def test__from_mess_channel_output(name, data):
     assert numpy.shape(kT1P1) == (4, 3), kT1P1
 
 
+@pytest.mark.parametrize("method", ["nearest", "linear", "cubic"])
+def test__rate_interpolation(method):
+    rxn = rate.from_mess_channel_output(MESS1["data"])
+    T = rxn.rate.T
+    P = [*rxn.rate.P, numpy.inf]
+
+    # Grid points are reproduced exactly, with the high-pressure limit at P = inf
+    k = numpy.vstack([rxn.rate.k_data, rxn.rate.k_high]).T
+    assert numpy.allclose(rxn.rate(T, P, method=method), k, equal_nan=True)
+
+    # Between grid points, values lie between their neighbors
+    T_mid = numpy.add(T[1:], T[:-1]) / 2
+    k_mid = rxn.rate(T_mid, 10.0, method=method)
+    k_lo, k_hi = k[:-1, 2], k[1:, 2]
+    ok = numpy.isfinite(k_mid)
+    assert numpy.all(numpy.minimum(k_lo, k_hi)[ok] <= k_mid[ok] * (1 + 1e-12))
+    assert numpy.all(numpy.maximum(k_lo, k_hi)[ok] >= k_mid[ok] * (1 - 1e-12))
+
+    # Points outside of the grid are NaN
+    assert numpy.isnan(rxn.rate(T[0] / 2, 1.0, method=method))
+
+
+def test__from_mess_output_file(tmp_path):
+    chan_outs = [MESS1["data"], MESS2["data"]]
+    path = tmp_path / "rate.out"
+    path.write_text(
+        "Temperature-Pressure Rate Tables:\n"
+        + "\n".join(chan_outs)
+        + "\nCapture/Escape Rate Coefficients:\n  W1->W2 is not a table\n"
+    )
+    with rate.from_mess_output_file(path) as rxns:
+        assert list(rxns) == [("W1", "W2"), ("W2", "W14")]
+        for key, chan_out in zip(rxns, chan_outs, strict=True):
+            rxn = rxns[key]
+            rxn0 = rate.from_mess_channel_output(chan_out)
+            assert rxn.reactants == rxn0.reactants
+            assert rxn.products == rxn0.products
+            assert rxn.rate.order == rxn0.rate.order
+            assert numpy.allclose(rxn.rate.P, rxn0.rate.P)
+            assert numpy.allclose(rxn.rate.k_data, rxn0.rate.k_data, equal_nan=True)
+            assert numpy.allclose(rxn.rate.k_high, rxn0.rate.k_high, equal_nan=True)
+
+
 @pytest.mark.parametrize(
     "name, data",
     [
@@ -292,6 +385,54 @@ def test__fit_plog():
     rate.display([e12_rxn_fake, e12_rxn_real, e12_rxn_data, e12_rxn_fit])
 
 
+def test__fit_plogs():
+    rxns = [rate.from_mess_channel_output(d["data"]) for d in (MESS1, MESS2)]
+    rxn_fits = rate.fit_plogs(rxns)
+    for rxn, rxn_fit in zip(rxns, rxn_fits, strict=True):
+        rxn_fit0 = rate.fit_plog(rxn)
+        assert numpy.allclose(rxn_fit.rate.As, rxn_fit0.rate.As)
+        assert numpy.allclose(rxn_fit.rate.bs, rxn_fit0.rate.bs)
+        assert numpy.allclose(rxn_fit.rate.Es, rxn_fit0.rate.Es)
+
+    dup_fits = rate.fit_duplicate_plogs(rxns)
+    for rxn, rxn_fit, (rxn_dup1, rxn_dup2) in zip(
+        rxns, rxn_fits, dup_fits, strict=True
+    ):
+        T = rxn.rate.T
+        P = rxn.rate.P
+        k = numpy.transpose(rxn.rate.k_data)
+        k_fit = rxn_fit.rate(T, P)
+        k_dup = rxn_dup1.rate(T, P) + rxn_dup2.rate(T, P)
+        err_fit = numpy.nanmax(numpy.abs(numpy.log(k_fit / k)))
+        err_dup = numpy.nanmax(numpy.abs(numpy.log(k_dup / k)))
+        assert err_dup <= err_fit * (1 + 1e-6), (err_dup, err_fit)
+
+
+@pytest.mark.parametrize(
+    "name, data",
+    [
+        ("MESS1", MESS1),
+        ("MESS2", MESS2),
+    ],
+)
+def test__fit_cheb(name, data):
+    rxn = rate.from_mess_channel_output(data["data"])
+
+    # Orders are chosen to meet the tolerance
+    rxn_fit = rate.fit_cheb(rxn, tol=0.05)
+    assert rate.fit_error(rxn_fit, rxn) <= 0.05
+    rate.display([rxn, rxn_fit], label=["rate", "fit"])
+
+    # Orders can be given, and the fit survives a round trip through Chemkin
+    rxn_fit = rate.fit_cheb(rxn, 3, 2, tol=numpy.inf)
+    assert numpy.shape(rxn_fit.rate.coeffs) == (3, 2)
+    rxn_fit_ = rate.from_chemkin_string(rate.chemkin_string(rxn_fit))
+    T = [600, 1200, 1800]
+    P = [1.0, 100.0]
+    assert numpy.allclose(rxn_fit_.rate(T, P), rxn_fit.rate(T, P), rtol=1e-2)
+    assert numpy.allclose((rxn_fit * 2).rate(T, P), 2 * rxn_fit.rate(T, P))
+
+
 @pytest.mark.parametrize(
     "name, data, exp_dct, count, factor",
     [
@@ -1,5 +1,6 @@
 """Test autochem.rate."""
 
+import numpy
 import pytest
 
 from autochem import therm
@@ -48,6 +49,14 @@ T, K    C5H7(487)z   C5H7(487)z   C5H7(487)z   C5H7(487)z   C5H7(487)z
 298.2      77.9598    0.0247741 -4.78494e-05      82.8616      22.8932
 """
 
+# PAC99 fit of the MESSPF data above (Hf = 86.239 kcal/mol at 0 K)
+MESSPF_PAC99 = """
+C5H7(487)z              C   5H   7          G     200.0    3000.0  1000.0      1
+ 5.44139387E+00 2.99849337E-02-1.45175641E-05 3.42018649E-09-3.17917319E-13    2
+ 3.84863610E+04 1.50413709E+00 8.03819494E+00-9.15747006E-03 1.04299288E-04    3
+-1.30879516E-07 5.17105360E-11 3.90243795E+04-4.94049720E+00                   4
+"""
+
 
 def generate_id(val):
     """Generate a unique ID for the test case."""
@@ -108,5 +117,134 @@ def test__fit(name, spc_str0):
     therm.display(spc, label="data", others=[spc_fit], others_labels=["fit"])
 
 
+@pytest.mark.parametrize(
+    "name, spc_str0",
+    [
+        ("MESSPF", MESSPF),
+    ],
+    ids=generate_id,
+)
+def test__select_data(name, spc_str0):
+    spc = therm.from_messpf_output_string(
+        spc_str0,
+        formula="C5H7",
+        name="C5H7(487)z",
+        Hf=86.239,
+        Tf=0,
+        units={"energy": "kcal"},
+    )
+    therm_ = spc.therm
+    assert therm_.data_set is therm_.data_set
+
+    # Check nearest-neighbor lookup against xarray, including ties
+    T = numpy.concatenate([numpy.linspace(100, 3500, 341), [250, 298.15, 3000]])
+    for key in ("Cp", "Cv", "S", "dH"):
+        val = therm_.select_data(key, T)
+        val_ = therm_.data_set[key].sel(T=T, method="nearest").data
+        assert numpy.array_equal(val, val_), f"{key}: {val} != {val_}"
+
+    # Other methods go through xarray
+    T = numpy.linspace(250, 2950, 28)
+    val = therm_.heat_capacity(T, method="ffill")
+    val_ = therm_.data_set["Cp"].sel(T=T, method="ffill").data
+    assert numpy.array_equal(val, val_), f"{val} != {val_}"
+
+
+def test__select_data_single_temperature():
+    therm_ = therm.Therm(
+        T=[300.0],
+        Z0=[78.0043],
+        Z1=[0.0246886],
+        Z2=[-4.72064e-05],
+        Hf=0.0,
+        formula={"C": 5, "H": 7},
+    )
+    val = therm_.heat_capacity([200.0, 300.0, 1000.0])
+    assert numpy.array_equal(val, numpy.full(3, therm_.heat_capacity(300.0)))
+
+
+@pytest.mark.parametrize(
+    "name, spc_str0, pac_str",
+    [
+        ("MESSPF", MESSPF, MESSPF_PAC99),
+    ],
+    ids=generate_id,
+)
+def test__fit_continuous(name, spc_str0, pac_str):
+    spc = therm.from_messpf_output_string(
+        spc_str0,
+        formula="C5H7",
+        name="C5H7(487)z",
+        Hf=86.239,
+        Tf=0,
+        units={"energy": "kcal"},
+    )
+    spc_fit = therm.fit(spc, T_min=200, T_mid=1000, T_max=3000, continuous=True)
+    spc_pac = therm.from_chemkin_string(pac_str)
+
+    # Check continuity at T_mid
+    therm_fit = spc_fit.therm
+    calc_low, calc_high = therm_fit.piecewise_calculators()
+    T_mid = therm_fit.T_mid
+    for prop in ("heat_capacity", "entropy", "enthalpy"):
+        val_low = getattr(calc_low, prop)(T_mid)
+        val_high = getattr(calc_high, prop)(T_mid)
+        assert numpy.isclose(val_low, val_high, rtol=1e-8), f"{val_low} != {val_high}"
+
+    # Check agreement with PAC99 (cal/mol/K for Cp and S, cal/mol for H)
+    T = numpy.linspace(200, 3000, 141)
+    for prop, tol in (("heat_capacity", 0.25), ("entropy", 0.1), ("enthalpy", 50)):
+        val_fit = getattr(therm_fit, prop)(T)
+        val_pac = getattr(spc_pac.therm, prop)(T)
+        err = numpy.max(numpy.abs(val_fit - val_pac))
+        assert err < tol, f"{prop}: {err} !< {tol}"
+
+
+def test__table():
+    block_str = "\n".join(
+        ["THERMO ALL", "300.0 1000.0 5000.0", NASA7, MESSPF_PAC99, "END"]
+    )
+    tab = therm.table.from_chemkin_string(block_str)
+    spcs = [therm.from_chemkin_string(NASA7), therm.from_chemkin_string(MESSPF_PAC99)]
+    assert tab.names == [spc.name for spc in spcs]
+    assert tab.coeffs.shape == (2, 2, 7)
+
+    T = numpy.linspace(300, 3000, 28)
+    for prop in ("heat_capacity", "entropy", "enthalpy"):
+        vals = getattr(tab, prop)(T)
+        assert vals.shape == (2, len(T))
+        for val, spc in zip(vals, spcs, strict=True):
+            val_ = getattr(spc.therm, prop)(T)
+            assert numpy.allclose(val, val_), f"{prop}: {val} != {val_}"
+
+    H = tab.enthalpy(T)
+    H_kJ = tab.enthalpy(T=T, units={"energy": "kJ"})
+    assert numpy.allclose(H_kJ, H * 4.184e-3), f"{H_kJ} != {H} cal"
+
+    G = tab.gibbs_energy(T)
+    G_ = tab.enthalpy(T) - T * tab.entropy(T)
+    assert numpy.allclose(G, G_), f"{G} != {G_}"
+
+
+def test__chemkin_file(tmp_path):
+    spcs = [therm.from_chemkin_string(NASA7), therm.from_chemkin_string(MESSPF_PAC99)]
+    path = tmp_path / "therm.dat"
+    therm.write_chemkin_file(path, spcs)
+    spcs_ = list(therm.from_chemkin_file(path))
+    assert spcs == spcs_, f"\n   {spcs}\n!= {spcs_}"
+
+    # Global temperature line and comments
+    block_str = "\n".join(
+        ["THERMO ALL", "   300.000  1000.000  5000.000", "! comment", NASA7, "END"]
+    )
+    (spc,) = therm.from_chemkin_lines(block_str.splitlines())
+    assert spc == spcs[0], f"\n   {spc}\n!= {spcs[0]}"
+
+    # Malformed entries are reported by line number
+    lines = ["THERMO", *MESSPF_PAC99.strip().splitlines()[:3], "END"]
+    with pytest.raises(ValueError, match="Line 5"):
+        list(therm.from_chemkin_lines(lines))
+
+
 if __name__ == "__main__":
     test__from_chemkin_string("NASA7", NASA7)
@@ -1,11 +1,13 @@
 """Thermodynamic functions."""
 
-from . import data
+from . import data, table
 from ._species import (
     Species,
     chemkin_string,
     display,
     fit,
+    from_chemkin_file,
+    from_chemkin_lines,
     from_chemkin_string,
     from_messpf_output_string,
     from_pac99_output_string,
@@ -13,9 +15,11 @@ from ._species import (
     temperature_maximum,
     temperature_middle,
     temperature_minimum,
+    write_chemkin_file,
 )
 from .data import BaseTherm, Nasa7ThermFit, Therm, ThermFit
 from .func import Nasa7Calculator, ThermCalculator
+from .table import ThermTable
 
 __all__ = [
     # Types
@@ -29,21 +33,27 @@ __all__ = [
     #   - Calculators
     "ThermCalculator",
     "Nasa7Calculator",
+    #   - Tables
+    "ThermTable",
     # Functions
     #   - Properties
     "temperature_minimum",
     "temperature_middle",
     "temperature_maximum",
     #   - Conversions
+    "from_chemkin_file",
+    "from_chemkin_lines",
     "from_chemkin_string",
     "from_messpf_output_string",
     "from_pac99_output_string",
     "pac99_input_string",
     "chemkin_string",
+    "write_chemkin_file",
     #   - Fitting
     "fit",
     #   - Display
     "display",
     # Submodules
     "data",
+    "table",
 ]
@@ -1,10 +1,10 @@
 """Thermodynamic data."""
 
 import datetime
-from collections.abc import Sequence
-from typing import ClassVar, Literal
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Literal
 
-import altair as alt
 import numpy as np
 import pyparsing as pp
 
@@ -14,6 +14,9 @@ from ..util.type_ import Scalable, Scalers
 from . import data
 from .data import Nasa7ThermFit, Therm, Therm_
 
+if TYPE_CHECKING:
+    import altair as alt
+
 
 # TODO(avcopan): Include subtype: `Species[Therm]` / `Species[ThermFit]`  # noqa: FIX002
 # https://github.com/Auto-Mech/autochem/issues/671
@@ -86,6 +89,35 @@ def from_chemkin_string(
     return Species(name=res.name, therm=therm_fit)
 
 
+def from_chemkin_lines(
+    lines: Iterable[str],
+    T_mid: float | None = None,  # noqa: N803
+) -> Iterator[Species]:
+    """Lazily read species thermo from the lines of a Chemkin THERMO block.
+
+    :param lines: Lines of a Chemkin THERMO block
+    :param T_mid: Default middle temperature, if not given in the block or entry
+    :yield: Species thermo
+    """
+    for res in chemkin.iter_thermo(lines):
+        therm_fit = data.from_chemkin_parse_results(res, T_mid=T_mid)
+        yield Species(name=res.name, therm=therm_fit)
+
+
+def from_chemkin_file(
+    path: str | Path,
+    T_mid: float | None = None,  # noqa: N803
+) -> Iterator[Species]:
+    """Lazily read species thermo from a Chemkin THERMO file.
+
+    :param path: Path to a file containing a Chemkin THERMO block
+    :param T_mid: Default middle temperature, if not given in the block or entry
+    :yield: Species thermo
+    """
+    with Path(path).open() as file:
+        yield from from_chemkin_lines(file, T_mid=T_mid)
+
+
 def from_messpf_output_string(  # noqa: PLR0913
     pf_str: str,
     formula: FormulaData,
@@ -167,6 +199,22 @@ def chemkin_string(spc: Species) -> str:
     return "\n".join(f"{L: <78}{i + 1:>2d}" for i, L in enumerate(lines))
 
 
+def write_chemkin_file(path: str | Path, spcs: Iterable[Species]) -> None:
+    """Write species thermo to a Chemkin THERMO file.
+
+    Species are written one at a time, so the iterable may be lazy.
+
+    :param path: Path to the file
+    :param spcs: Species thermo
+    """
+    with Path(path).open("w") as file:
+        file.write("THERMO\n")
+        for spc in spcs:
+            file.write(chemkin_string(spc))
+            file.write("\n")
+        file.write("END\n")
+
+
 def pac99_input_string(
     spc: Species,
     T_min: float = 200,  # noqa: N803
@@ -221,16 +269,19 @@ def pac99_input_string(
     )
 
 
-def fit(
+def fit(  # noqa: PLR0913
     spc: Species,
     T_min: float | None = None,  # noqa: N803
     T_mid: float = 1000,  # noqa: N803
     T_max: float | None = None,  # noqa: N803
     type_: Literal["nasa7"] = "nasa7",  # noqa: ARG001
+    *,
+    continuous: bool = False,
 ) -> Species:
     """Fit data to therm fit object.
 
     :param spc: Species thermo with thermo data (not a fit)
+    :param continuous: Whether to constrain Cp, S, and H to be continuous at T_mid
     :return: Species thermo with fitted data
     """
     therm: Therm = spc.therm
@@ -253,6 +304,7 @@ def fit(
         T_min=T_min,
         T_mid=T_mid,
         T_max=T_max,
+        continuous=continuous,
     )
     return spc_fit
 
@@ -270,7 +322,7 @@ def display(  # noqa: PLR0913
     x_label: str = "𝑇",  # noqa: RUF001
     y_labels: Sequence[str | None] | None = None,
     horizontal: bool = False,
-) -> alt.Chart:
+) -> "alt.Chart":
     """Display as an Arrhenius plot, optionally comparing to other rates.
 
     :param spc: Species thermo
@@ -323,16 +323,9 @@ class Nasa7Calculator(Bounded, ThermCalculator):
         :return: Fitted object
         """
         T = np.array(T, dtype=np.float64)  # noqa: N806
-        _0 = np.zeros_like(T)
-        _1 = np.ones_like(T)
 
         # Transformation matrix
-        M_Cp = np.column_stack([_1, T, T**2, T**3, T**4, _0, _0])  # noqa: N806
-        M_S = np.column_stack(  # noqa: N806
-            [np.log(T), T, T**2 / 2, T**3 / 3, T**4 / 4, _0, _1],
-        )
-        M_H = np.column_stack([T, T**2 / 2, T**3 / 3, T**4 / 4, T**5 / 5, _1, _0])  # noqa: N806
-        M = np.vstack((M_Cp, M_S, M_H))  # noqa: N806
+        M = np.vstack(nasa7_matrices(T))  # noqa: N806
 
         # Data vector
         R = unit_.const.value(C.gas, UNITS)  # noqa: N806
@@ -351,3 +344,25 @@ class Nasa7Calculator(Bounded, ThermCalculator):
             a6=a6,
             a7=a7,
         )
+
+
+# Helpers
+def nasa7_matrices(
+    T: ArrayLike,  # noqa: N803
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Get matrices mapping NASA-7 coefficients to Cp/R, S/R, and H/R values.
+
+        Cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
+        S/R = a1 ln(T) + a2 T + (a3/2) T^2 + (a4/3) T^3 + (a5/4) T^4 + a7
+        H/R = a1 T + (a2/2) T^2 + (a3/3) T^3 + (a4/4) T^4 + (a5/5) T^5 + a6
+
+    :param T: Temperature(s)
+    :return: Heat capacity, entropy, and enthalpy matrices, each n_T x 7
+    """
+    T = np.array(T, dtype=np.float64).reshape(-1)  # noqa: N806
+    _0 = np.zeros_like(T)
+    _1 = np.ones_like(T)
+    M_Cp = np.column_stack([_1, T, T**2, T**3, T**4, _0, _0])  # noqa: N806
+    M_S = np.column_stack([np.log(T), T, T**2 / 2, T**3 / 3, T**4 / 4, _0, _1])  # noqa: N806
+    M_H = np.column_stack([T, T**2 / 2, T**3 / 3, T**4 / 4, T**5 / 5, _1, _0])  # noqa: N806
+    return M_Cp, M_S, M_H
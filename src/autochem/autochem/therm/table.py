@@ -0,0 +1,182 @@
+"""Vectorized thermodynamic functions for many species."""
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .. import unit_
+from ..unit_ import UNITS, C, D, UnitsData
+from ..util.type_ import Frozen, NDArray_
+from . import _species
+from ._species import Species
+from .data import Nasa7ThermFit
+from .func import nasa7_matrices
+
+
+class ThermTable(Frozen):
+    """NASA-7 thermodynamic fits for many species, packed into arrays.
+
+    Evaluates all species over a temperature vector at once, returning arrays of shape
+    (n_species, n_T). Temperatures at or above a species' middle temperature use its
+    high-temperature coefficients. Temperatures outside of its range are extrapolated.
+
+    :param names: Species names
+    :param T_min: Minimum temperatures, n_species
+    :param T_mid: Middle temperatures, n_species
+    :param T_max: Maximum temperatures, n_species
+    :param coeffs: Low- and high-temperature coefficients, n_species x 2 x 7
+    """
+
+    names: list[str]
+    T_min: NDArray_
+    T_mid: NDArray_
+    T_max: NDArray_
+    coeffs: NDArray_
+
+    def index(self, name: str) -> int:
+        """Get the index of a species.
+
+        :param name: Species name
+        :return: Index
+        """
+        return self.names.index(name)
+
+    def _evaluate(
+        self,
+        T: ArrayLike,  # noqa: N803
+        M: NDArray[np.float64],  # noqa: N803
+    ) -> NDArray[np.float64]:
+        """Contract coefficients with a NASA-7 matrix for each temperature range.
+
+        :param T: Temperature(s)
+        :param M: Matrix mapping coefficients to values, n_T x 7
+        :return: Values for each species and temperature, n_species x n_T
+        """
+        T = np.reshape(np.asarray(T, dtype=np.float64), -1)  # noqa: N806
+        n_spc = len(self.names)
+        vals = (self.coeffs.reshape(2 * n_spc, 7) @ M.T).reshape(n_spc, 2, -1)
+        high = T[np.newaxis, :] >= self.T_mid[:, np.newaxis]
+        return np.where(high, vals[:, 1], vals[:, 0])
+
+    @unit_.manage_units([], D.energy_per_substance / D.temperature)
+    def heat_capacity(
+        self,
+        T: ArrayLike,  # noqa: N803
+        const: Literal["P", "V"] = "P",
+        units: UnitsData | None = None,  # noqa: ARG002
+    ) -> NDArray[np.float64]:
+        """Evaluate heat capacity, Cv(T) or Cp(T).
+
+        :param T: Temperature(s)
+        :param const: Whether to hold pressure ("P") or volume ("V") constant
+        :param units: Unit system
+        :return: Function values, n_species x n_T
+        """
+        R = unit_.const.value(C.gas, UNITS)  # noqa: N806
+        M_Cp, _, _ = nasa7_matrices(T)  # noqa: N806
+        C_ = R * self._evaluate(T, M_Cp)  # noqa: N806
+        C_ -= R if const == "V" else 0.0  # noqa: N806
+        return C_
+
+    @unit_.manage_units([], D.energy_per_substance / D.temperature)
+    def entropy(
+        self,
+        T: ArrayLike,  # noqa: N803
+        units: UnitsData | None = None,  # noqa: ARG002
+    ) -> NDArray[np.float64]:
+        """Evaluate entropy, S(T).
+
+        :param T: Temperature(s)
+        :param units: Unit system
+        :return: Function values, n_species x n_T
+        """
+        R = unit_.const.value(C.gas, UNITS)  # noqa: N806
+        _, M_S, _ = nasa7_matrices(T)  # noqa: N806
+        return R * self._evaluate(T, M_S)
+
+    @unit_.manage_units([], D.energy_per_substance)
+    def enthalpy(
+        self,
+        T: ArrayLike,  # noqa: N803
+        units: UnitsData | None = None,  # noqa: ARG002
+    ) -> NDArray[np.float64]:
+        """Evaluate enthalpy, H(T).
+
+        :param T: Temperature(s)
+        :param units: Unit system
+        :return: Function values, n_species x n_T
+        """
+        R = unit_.const.value(C.gas, UNITS)  # noqa: N806
+        _, _, M_H = nasa7_matrices(T)  # noqa: N806
+        return R * self._evaluate(T, M_H)
+
+    @unit_.manage_units([], D.energy_per_substance)
+    def gibbs_energy(
+        self,
+        T: ArrayLike,  # noqa: N803
+        units: UnitsData | None = None,  # noqa: ARG002
+    ) -> NDArray[np.float64]:
+        """Evaluate Gibbs free energy, G(T) = H(T) - T S(T).
+
+        Both are evaluated in a single pass, as G/RT = H/RT - S/R.
+
+        :param T: Temperature(s)
+        :param units: Unit system
+        :return: Function values, n_species x n_T
+        """
+        R = unit_.const.value(C.gas, UNITS)  # noqa: N806
+        T = np.reshape(np.asarray(T, dtype=np.float64), -1)  # noqa: N806
+        _, M_S, M_H = nasa7_matrices(T)  # noqa: N806
+        return R * self._evaluate(T, M_H - T[:, np.newaxis] * M_S)
+
+
+# Constructors
+def from_species(spcs: Sequence[Species]) -> ThermTable:
+    """Build a thermo table from species with NASA-7 fits.
+
+    :param spcs: Species thermo
+    :return: Thermo table
+    """
+    therms = [spc.therm for spc in spcs]
+    for spc, therm in zip(spcs, therms, strict=True):
+        if not isinstance(therm, Nasa7ThermFit):
+            msg = f"Species {spc.name} has no NASA-7 fit: {type(therm)}"
+            raise NotImplementedError(msg)
+
+    return ThermTable(
+        names=[spc.name for spc in spcs],
+        T_min=[therm.T_min for therm in therms],
+        T_mid=[therm.T_mid for therm in therms],
+        T_max=[therm.T_max for therm in therms],
+        coeffs=[[therm.coeffs_low, therm.coeffs_high] for therm in therms],
+    )
+
+
+def from_chemkin_string(
+    therm_block_str: str,
+    T_mid: float | None = None,  # noqa: N803
+) -> ThermTable:
+    """Build a thermo table from a Chemkin THERMO block.
+
+    :param therm_block_str: Chemkin THERMO block string
+    :param T_mid: Default middle temperature, if not given in the block or entry
+    :return: Thermo table
+    """
+    lines = therm_block_str.splitlines()
+    return from_species(list(_species.from_chemkin_lines(lines, T_mid=T_mid)))
+
+
+def from_chemkin_file(
+    path: str | Path,
+    T_mid: float | None = None,  # noqa: N803
+) -> ThermTable:
+    """Build a thermo table from a Chemkin THERMO file.
+
+    :param path: Path to a file containing a Chemkin THERMO block
+    :param T_mid: Default middle temperature, if not given in the block or entry
+    :return: Thermo table
+    """
+    return from_species(list(_species.from_chemkin_file(path, T_mid=T_mid)))
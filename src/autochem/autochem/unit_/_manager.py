@@ -10,9 +10,9 @@ import pydantic
 from numpy.typing import NDArray
 
 from ..util.type_ import Frozen
-from . import dim
+from . import dim, system
 from .dim import Dimension
-from .system import UNITS, Units, UnitsData
+from .system import UNITS, UnitsData
 
 
 class UnitManager(Frozen, abc.ABC):
@@ -20,7 +20,7 @@ class UnitManager(Frozen, abc.ABC):
 
     def __init__(self, units: UnitsData | None = None, **kwargs: object) -> None:
         if units is not None:
-            units0 = Units.model_validate(units)
+            units0 = system.validate(units)
             for key, dim_ in self.__class__._dimensions.items():  # noqa: SLF001
                 val0 = kwargs.get(key)
                 kwargs[key] = dim.convert(units0, UNITS, dim_, val0, **kwargs)
@@ -61,11 +61,12 @@ def manage_units(
                 return func0(self, *args, units=units, **kwargs)
 
             # Process units
-            units0 = Units.model_validate(units)
+            units0 = system.validate(units)
+            order = getattr(self, "order", None)
 
             # Convert arguments
             args_ = tuple(
-                dim.convert(units0, UNITS, dim_, arg, **self.model_dump())
+                dim.convert(units0, UNITS, dim_, arg, order=order)
                 for dim_, arg in zip(arg_dims, args, strict=True)
             )
 
@@ -74,7 +75,7 @@ def manage_units(
 
             # Convert return
             if ret_dim is not None:
-                ret = dim.convert(UNITS, units0, ret_dim, ret, **self.model_dump())
+                ret = dim.convert(UNITS, units0, ret_dim, ret, order=order)
 
             return ret
 
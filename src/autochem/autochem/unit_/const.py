@@ -1,5 +1,7 @@
 """Physical constants."""
 
+import functools
+
 import pint
 
 from . import dim
@@ -44,8 +46,9 @@ def dimension(const: str) -> Dimension:
     return dim_dct[const]
 
 
+@functools.lru_cache(maxsize=64)
 def value(const: str, units: Units) -> float:
-    """Determine physical constant value in unit system.
+    """Determine physical constant value in unit system (cached).
 
     :param const: Physical constant name
     :param units: Unit system
@@ -53,6 +53,16 @@ class Dimension:
         """Get items of dimension."""
         return sorted(self.unit_exponents.items(), key=lambda t: t[::-1], reverse=True)
 
+    def __eq__(self, other: object) -> bool:
+        """Determine equality with another dimension."""
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        return self.unit_exponents == other.unit_exponents and self.log == other.log
+
+    def __hash__(self) -> int:
+        """Hash, for caching conversion factors."""
+        return hash((frozenset(self.unit_exponents.items()), self.log))
+
     def __repr__(self) -> str:
         """Represent as string."""
         data_str = ", ".join(f"{k}={v}" for k, v in self.items())
@@ -156,14 +166,36 @@ def conversion_factor(
     function. The conversion is performed by taking the log of this factor and adding it
     to the original value.
 
+    Factors are cached, so only the reaction order is used from the extra arguments, if
+    the dimension depends on it.
+
     :param units: Units sytem
     :param new_units: New units system
     :param dim: Dimension
     :param **kwargs: Extra arguments for unit determination
     :return: New value
     """
-    unit = unit_(units, dim, **kwargs)
-    new_unit = unit_(new_units, dim, **kwargs)
+    dim = Dimension(dim)
+    order = kwargs.get("order") if "rate_constant" in dim.unit_exponents else None
+    return _conversion_factor(units, new_units, dim, order)
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion_factor(
+    units: Units, new_units: Units, dim: Dimension, order: int | None
+) -> float:
+    """Determine a conversion factor (cached).
+
+    :param units: Units sytem
+    :param new_units: New units system
+    :param dim: Dimension
+    :param order: Reaction order, if the dimension depends on it
+    :return: Conversion factor
+    """
+    if units == new_units:
+        return 1.0
+    unit = unit_(units, dim, order=order)
+    new_unit = unit_(new_units, dim, order=order)
     return pint.Quantity(1, unit).m_as(new_unit)
 
 
@@ -12,8 +12,6 @@ from pydantic_core import core_schema
 
 from ..util.type_ import Frozen, Unit_
 
-UR = pint.UnitRegistry()
-
 
 # Model for specifying units
 class Units(Frozen):
@@ -74,6 +72,35 @@ UnitsData: TypeAlias = Mapping[str, UnitData] | Units
 UNITS = Units()
 
 
+def validate(units: UnitsData | None) -> Units:
+    """Validate unit system data.
+
+    Validated once for each unique specification, since this is called with the same
+    specification on every unit-managed function call.
+
+    :param units: Unit system data, or `None` for internal units
+    :return: Unit system
+    """
+    if units is None:
+        return UNITS
+    if isinstance(units, Units):
+        return units
+    try:
+        return _validate(frozenset(units.items()))
+    except TypeError:
+        return Units.model_validate(units)
+
+
+@functools.lru_cache(maxsize=128)
+def _validate(items: frozenset[tuple[str, UnitData]]) -> Units:
+    """Validate unit system data, by its items.
+
+    :param items: Unit system data items
+    :return: Unit system
+    """
+    return Units.model_validate(dict(items))
+
+
 # Constructors
 def from_unit_sequence(unit_seq: Sequence[pint.Unit]) -> Units:
     """Construct unit sytem from sequence of composite units.
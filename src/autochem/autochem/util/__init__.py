@@ -1,7 +1,15 @@
-"""Utilities."""
+"""Utilities.
 
-from . import chemkin, form, mess, pac99, plot, type_
-from .form import FormulaData
+Submodules are loaded on first access, so that e.g. plotting dependencies are only
+imported when needed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import chemkin, form, mess, pac99, plot, type_
+    from .form import FormulaData
 
 __all__ = [
     "FormulaData",
@@ -13,3 +21,23 @@ __all__ = [
     "pac99",
     "mess",
 ]
+
+# Lazily loaded attributes, by the submodule that defines them
+_LAZY_ATTRS = {"FormulaData": "form"}
+
+
+def __getattr__(name: str) -> object:
+    """Load submodules and their attributes on first access (PEP 562)."""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        return getattr(module, name)
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List public attributes, including submodules that are not yet loaded."""
+    return sorted(__all__)
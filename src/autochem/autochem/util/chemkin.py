@@ -2,7 +2,7 @@
 
 import re
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 
 import more_itertools as mit
 import numpy as np
@@ -11,6 +11,9 @@ import pyparsing as pp
 from pyparsing import common as ppc
 
 COMMENT_REGEX = re.compile(r"# .*$|!.*$", flags=re.MULTILINE)
+FALLOFF_REGEX = re.compile(r"\(\s*\+")
+AUX_REGEX = re.compile(r"([^\s/]+)\s*/([^/]*)/")
+COEFF_REGEX = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)[EeDd][-+]?\d+")
 
 
 # Readers
@@ -97,6 +100,117 @@ def parse_thermo(therm_str: str) -> ChemkinThermoParseResults:
     )
 
 
+def iter_thermo(lines: Iterable[str]) -> Iterator[ChemkinThermoParseResults]:
+    """Lazily parse thermo entries from the lines of a Chemkin THERMO block.
+
+    Entries are read from their fixed-column layout by slicing. The THERMO (ALL) and
+    END lines are optional. If the global temperature line is given, its middle
+    temperature is used for entries that do not set their own.
+
+    :param lines: Lines of a Chemkin THERMO block, e.g. an open file
+    :yield: Parse results for each entry
+    """
+    T_mid_default = None  # noqa: N806
+    entry: list[str] = []
+    comments: list[str] = []
+    start = 0
+    for num, line0 in enumerate(lines, start=1):
+        comments.extend(read_comments(line0))
+        line = re.sub(COMMENT_REGEX, "", line0).rstrip()
+        word = line.split()[0].upper() if line.strip() else ""
+        if not word or (not entry and word.startswith("THERM")):
+            continue
+        if not entry and word == "END":
+            break
+
+        # Read the global temperature line, if present
+        if not entry and T_mid_default is None and not line.endswith("1"):
+            T_mid_default = parse_thermo_temperatures(line, num=num)[1]  # noqa: N806
+            continue
+
+        start = start if entry else num
+        entry.append(line)
+        if not line.endswith(str(len(entry))):
+            msg = f"Line {num}: Expected line {len(entry)} of thermo entry:\n{line0}"
+            raise ValueError(msg)
+
+        if len(entry) == 4:
+            try:
+                res = parse_thermo_lines(entry, comments=comments)
+            except ValueError as err:
+                msg = f"Lines {start}-{num}: Malformed thermo entry: {err}"
+                raise ValueError(msg) from err
+            res.T_mid = res.T_mid or T_mid_default
+            yield res
+            entry = []
+            comments = []
+
+    if entry:
+        msg = f"Line {start}: Incomplete thermo entry:\n" + "\n".join(entry)
+        raise ValueError(msg)
+
+
+def parse_thermo_temperatures(line: str, num: int = 0) -> tuple[float, float, float]:
+    """Parse the global temperature line of a Chemkin THERMO block.
+
+    :param line: Line
+    :param num: Line number, for error reporting
+    :return: Default minimum, middle, and maximum temperatures
+    """
+    try:
+        T_min, T_mid, T_max = map(float, line.split())  # noqa: N806
+    except ValueError as err:
+        msg = f"Line {num}: Expected thermo entry header:\n{line}"
+        raise ValueError(msg) from err
+    return T_min, T_mid, T_max
+
+
+def parse_thermo_lines(
+    lines: Sequence[str], comments: Sequence[str] = ()
+) -> ChemkinThermoParseResults:
+    """Parse the four lines of a Chemkin thermo entry without pyparsing.
+
+    The header line is read by its fixed columns and the coefficients with a regular
+    expression, which tolerates misaligned and unseparated numbers.
+
+    :param lines: Entry lines, without comments
+    :param comments: Entry comments
+    :return: Parse results including name, formula, coefficients, etc.
+    """
+    line1, *coeff_lines = lines
+    line1 = f"{line1:<80}"
+
+    # Formula: four 5-column element fields, plus an optional fifth after T_mid
+    form_dct = {}
+    for form_field in (*mit.sliced(line1[24:44], 5), line1[73:78]):
+        symb, count = form_field[:2].strip(), form_field[2:].strip()
+        if symb:
+            form_dct[symb] = int(float(count))
+
+    # Coefficients: five per line, before the line number in column 80
+    coeffs = [
+        float(coeff_str.upper().replace("D", "E"))
+        for coeff_line in coeff_lines
+        for coeff_str in COEFF_REGEX.findall(coeff_line.rstrip()[:-1])
+    ]
+    if len(coeffs) != 14:
+        msg = f"Expected 14 coefficients, found {len(coeffs)}"
+        raise ValueError(msg)
+
+    T_mid_str = line1[65:73].strip()  # noqa: N806
+    return ChemkinThermoParseResults(
+        name=line1[:18].strip(),
+        formula=form_dct,
+        T_min=float(line1[45:55]),
+        T_max=float(line1[55:65]),
+        coeffs=coeffs,
+        phase=line1[44],
+        T_mid=float(T_mid_str) if T_mid_str else None,
+        date=line1[18:24].strip(),
+        comments=list(comments),
+    )
+
+
 # Rates
 class ChemkinRateParseResults(pydantic.BaseModel):
     """Chemkin rate parse results."""
@@ -130,9 +244,9 @@ def parse_equation(reac_str: str) -> ChemkinRateParseResults:
     # Extract (+M) or (+X) third body, if present
     efficiencies = {}
     pressure_dependent = False
-    rct_res = REAC_SIDE_FALLOFF.parse_string(rct)
-    prd_res = REAC_SIDE_FALLOFF.parse_string(prd)
+    rct_res = REAC_SIDE_FALLOFF.parse_string(rct) if FALLOFF_REGEX.search(rct) else {}
     if Key.falloff in rct_res:
+        prd_res = REAC_SIDE_FALLOFF.parse_string(prd)
         (third_body,) = rct_res.get(Key.falloff)
         rct = rct_res.get(Key.reagents)
         prd = prd_res.get(Key.reagents)
@@ -197,6 +311,120 @@ def parse_rate(rate_str: str) -> ChemkinRateParseResults:
     return res
 
 
+def iter_rates(lines: Iterable[str]) -> Iterator[ChemkinRateParseResults]:
+    """Lazily parse reactions from the lines of a Chemkin REACTIONS block.
+
+    Each reaction line, identified by its equation, is grouped with the auxiliary lines
+    that follow it (LOW, TROE, PLOG, CHEB, DUP, efficiencies, etc.). Comment-only lines
+    are attached to the next reaction. The REACTIONS and END lines are optional, and
+    unit keywords on the REACTIONS line are ignored.
+
+    :param lines: Lines of a Chemkin REACTIONS block, e.g. an open file
+    :yield: Parse results for each reaction
+    """
+    rxn_lines: list[str] = []
+    comments: list[str] = []
+    next_comments: list[str] = []
+    start = 0
+
+    def _parse() -> ChemkinRateParseResults:
+        try:
+            return parse_rate_lines(rxn_lines, comments=comments)
+        except (ValueError, pp.ParseException) as err:
+            msg = f"Line {start}: Malformed reaction: {err}\n" + "\n".join(rxn_lines)
+            raise ValueError(msg) from err
+
+    for num, line, line_comments in iter_block_lines(lines, keyword="REAC"):
+        if not line:
+            next_comments.extend(line_comments)
+            continue
+
+        if "=" in line:
+            if rxn_lines:
+                yield _parse()
+            rxn_lines = []
+            comments = next_comments
+            next_comments = []
+            start = num
+        elif not rxn_lines:
+            msg = f"Line {num}: Expected a reaction line:\n{line}"
+            raise ValueError(msg)
+
+        rxn_lines.append(line)
+        comments.extend(line_comments)
+
+    if rxn_lines:
+        yield _parse()
+
+
+def iter_block_lines(
+    lines: Iterable[str], keyword: str
+) -> Iterator[tuple[int, str, list[str]]]:
+    """Strip comments from the lines of a Chemkin block, up to its END line.
+
+    :param lines: Lines of a Chemkin block
+    :param keyword: Start of the block keyword, whose line is skipped
+    :yield: Line number, stripped line (empty if blank), and comments for each line
+    """
+    for num, line0 in enumerate(lines, start=1):
+        line = re.sub(COMMENT_REGEX, "", line0).strip()
+        word = line.split()[0].upper() if line and "=" not in line else ""
+        if word == "END":
+            return
+        if not word.startswith(keyword):
+            yield num, line, read_comments(line0)
+
+
+def parse_rate_lines(
+    lines: Sequence[str], comments: Sequence[str] = ()
+) -> ChemkinRateParseResults:
+    """Extract all rate information from the lines of a Chemkin reaction.
+
+    Arrhenius parameters are split off the end of the reaction line, falling back on
+    the full grammar if that fails. Auxiliary `KEY / values /` entries are read with a
+    regular expression: single numbers are collider efficiencies, lists of numbers are
+    auxiliary numbers, and anything else is kept as a string, as in `parse_rate`.
+
+    :param lines: Reaction line, followed by any auxiliary lines, without comments
+    :param comments: Reaction comments
+    :return: Parse results including reactants, products, reversible,
+        pressure_dependent, and efficiencies (only contains third-body, with value 1.0)
+    """
+    rxn_line, *aux_lines = lines
+
+    # Parse the reaction line
+    eq, *arrh_strs = rxn_line.rsplit(maxsplit=3)
+    try:
+        arrhenius = list(map(float, arrh_strs))
+    except ValueError:
+        arrhenius = []
+    if len(arrhenius) != 3:
+        rxn_res = REAC_LINE.parse_string(rxn_line)
+        eq = rxn_res.get(Key.reaction)
+        arrhenius = rxn_res.get(Key.arrhenius).as_list()
+
+    res = parse_equation(eq)
+    res.arrhenius = arrhenius
+    res.comments = list(comments)
+
+    # Parse the auxiliary lines, if any
+    res.aux_numbers = defaultdict(list)
+    for aux_line in aux_lines:
+        for key, val in AUX_REGEX.findall(aux_line):
+            try:
+                nums = list(map(float, val.split()))
+            except ValueError:
+                nums = []
+            if len(nums) == 1:
+                res.efficiencies[key] = nums[0]
+            elif nums:
+                res.aux_numbers[key].extend(nums)
+            else:
+                res.aux_misc[key] = val.strip()
+
+    return res
+
+
 # Writers
 def write_equation(
     reactants: Sequence[str],
@@ -1,5 +1,11 @@
 """Utility functions for reading and writing MESS input/output data."""
 
+import mmap
+import re
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Self
+
 import numpy as np
 import pydantic
 import pyparsing as pp
@@ -57,3 +63,104 @@ def parse_output_channel(mess_chan_out: str) -> MessOutputChannelParseResults:
         id1=res.get(Key.id1),
         id2=res.get(Key.id2),
     )
+
+
+# Whole-file reading
+CHANNEL_HEADER = re.compile(
+    rb"^[ \t]*([WP]\d+)->([WP]\d+)[ \t]*\r?\n(?:[ \t]*\r?\n)*(?=[ \t]*P\\T)",
+    re.MULTILINE,
+)
+CHANNEL_TABLE = re.compile(
+    rb"[ \t]*P\\T(?P<T>[^\n]*)\n"
+    rb"(?P<data>(?:[ \t]*[-+.\d][^\n]*(?:\n|\Z))*)"
+    rb"(?:[ \t]*O-O(?P<high>[^\n]*))?"
+)
+
+
+def parse_output_channel_table(
+    buf: bytes | mmap.mmap, pos: int = 0, id1: str | None = None, id2: str | None = None
+) -> MessOutputChannelParseResults:
+    r"""Parse the rate table of one channel in MESS output, starting at its P\T line.
+
+    Numbers are converted in bulk by NumPy, with `***` entries read as NaN.
+
+    :param buf: MESS output
+    :param pos: Position of the P\T line
+    :param id1: Reactant ID
+    :param id2: Product ID
+    :return: Parse results
+    """
+    match = CHANNEL_TABLE.match(buf, pos)
+    if match is None:
+        msg = f"No MESS rate table at position {pos}"
+        raise ValueError(msg)
+
+    T = np.array(match["T"].split(), dtype=np.float64)  # noqa: N806
+    data = np.array(match["data"].replace(b"***", b"nan").split(), dtype=np.float64)
+    data = data.reshape(-1, T.size + 1)
+    high = match["high"]
+    return MessOutputChannelParseResults(
+        T=T.tolist(),
+        P=data[:, 0].tolist(),
+        k_data=data[:, 1:],
+        k_high=(
+            None
+            if high is None
+            else np.array(high.replace(b"***", b"nan").split(), dtype=np.float64)
+        ),
+        id1=id1,
+        id2=id2,
+    )
+
+
+class MessOutputFile(Mapping[tuple[str, str], MessOutputChannelParseResults]):
+    """MESS output file, mapping each (id1, id2) channel to its rate table.
+
+    The file is memory-mapped and scanned once for channel blocks when opened. Each
+    rate table is only parsed when first accessed. If a channel appears more than once,
+    its first block is used.
+
+    :param path: Path to the MESS output file
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize file."""
+        self._file = Path(path).open("rb")  # noqa: SIM115
+        self._buf: bytes | mmap.mmap = b""
+        if Path(path).stat().st_size:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._offsets: dict[tuple[str, str], int] = {}
+        for match in CHANNEL_HEADER.finditer(self._buf):
+            key = (match[1].decode(), match[2].decode())
+            self._offsets.setdefault(key, match.end())
+        self._results: dict[tuple[str, str], MessOutputChannelParseResults] = {}
+
+    def __getitem__(self, key: tuple[str, str]) -> MessOutputChannelParseResults:
+        """Get the parse results for a channel."""
+        if key not in self._results:
+            pos = self._offsets[key]
+            self._results[key] = parse_output_channel_table(self._buf, pos, *key)
+        return self._results[key]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over channels, in order of appearance."""
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        """Count channels."""
+        return len(self._offsets)
+
+    def close(self) -> None:
+        """Close the file; tables that were already parsed remain available."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit context, closing the file."""
+        self.close()
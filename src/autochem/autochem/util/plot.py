@@ -2,15 +2,17 @@
 
 import itertools
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
-import altair as alt
 import numpy as np
-import pandas as pd
 from numpy.typing import ArrayLike
 
 from .. import unit_
 from ..unit_ import UNITS, Units, UnitsData
 
+if TYPE_CHECKING:
+    import altair as alt
+
 
 class Color:
     """Color hex values."""
@@ -71,7 +73,7 @@ def arrhenius(  # noqa: PLR0913
     y_label: str = "𝑘",  # noqa: RUF001
     mark: str = Mark.line,
     domain: tuple[float, float] | None = None,
-) -> alt.Chart:
+) -> "alt.Chart":
     """Display as an Arrhenius plot.
 
     :param others: Other rate constants
@@ -84,6 +86,9 @@ def arrhenius(  # noqa: PLR0913
     :param point: Whether to mark with points instead of a line
     :return: Chart
     """
+    import altair as alt  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
     assert mark in MARKS, f"{mark} not in {MARKS}"
     color_cycle = LINE_COLOR_CYCLE if mark == Mark.line else POINT_COLOR_CYCLE
 
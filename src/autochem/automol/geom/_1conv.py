@@ -9,6 +9,7 @@ import numpy
 import pyparsing as pp
 from numpy.typing import ArrayLike
 from pyparsing import pyparsing_common as ppc
+from scipy.spatial import KDTree
 from phydat import phycon
 
 from .. import vmat
@@ -38,6 +39,8 @@ from .base import (
     xyz_trajectory_string,
 )
 
+KDTREE_MIN_ATOMS = 256
+
 
 # # conversions
 def graph(geo, stereo=True, local_stereo=False, fix_hyper: bool = True):
@@ -75,15 +78,9 @@ def graph_without_stereo(geo, dist_factor=None, fix_hyper: bool = True):
     :param fix_hyper: Correct hypervalencies by removing the most distant neighbors?
     """
     symb_dct = dict(enumerate(symbols(geo)))
-    keys = sorted(symb_dct.keys())
-    bnd_keys = [
-        frozenset({k1, k2})
-        for k1, k2 in itertools.combinations(keys, r=2)
-        if distance(geo, k1, k2, angstrom=True)
-        <= heuristic.bond_distance_limit(
-            symb_dct[k1], symb_dct[k2], angstrom=True, dist_factor=dist_factor
-        )
-    ]
+    bnd_keys = list(
+        map(frozenset, _bonded_atom_pairs(geo, dist_factor=dist_factor).tolist())
+    )
 
     gra = graph_base.from_data(atm_symb_dct=symb_dct, bnd_keys=bnd_keys)
 
@@ -93,6 +90,7 @@ def graph_without_stereo(geo, dist_factor=None, fix_hyper: bool = True):
     dnkeys_dct = dict_.by_key(nkeys_dct, dummy_keys)
     dnkeys_dct = dict_.filter_by_value(dnkeys_dct, lambda n: len(n) > 1)
     if dnkeys_dct:
+        bad_bkeys = []
         for dkey, dnkeys in dnkeys_dct.items():
             # Find the neighbor that is closest to 1 Angstrom away
             best_dnkey = None
@@ -104,8 +102,8 @@ def graph_without_stereo(geo, dist_factor=None, fix_hyper: bool = True):
                     best_dnkey = dnkey
             # Remove bonds to all but this neighbor
             bad_dnkeys = dnkeys - {best_dnkey}
-            bad_bkeys = [(dkey, k) for k in bad_dnkeys]
-            gra = graph_base.remove_bonds(gra, bad_bkeys)
+            bad_bkeys.extend((dkey, k) for k in bad_dnkeys)
+        gra = graph_base.remove_bonds(gra, bad_bkeys)
 
     # Remove hypervalencies, if requested
     if fix_hyper:
@@ -114,16 +112,54 @@ def graph_without_stereo(geo, dist_factor=None, fix_hyper: bool = True):
             graph_base.without_dummy_atoms(gra)
         )
 
+        hyp_bkeys = set()
         for key, nhyp in nhyp_dct.items():
             # Get the neighboring keys sorted by distance
             nkeys = sorted(nkeys_dct[key], key=functools.partial(distance, geo, key))
             # Remove the `nhyp` longest hypervalent bonds
-            hyp_bkeys = {(key, k) for k in nkeys[-nhyp:]}
+            hyp_bkeys.update(frozenset({key, k}) for k in nkeys[-nhyp:])
+        if hyp_bkeys:
             gra = graph_base.remove_bonds(gra, hyp_bkeys)
 
     return gra
 
 
+def _bonded_atom_pairs(geo, dist_factor=None) -> numpy.ndarray:
+    """Find the pairs of atoms within bonding distance of each other
+
+    Distances are compared to `heuristic.bond_distance_limit` for each pair. Small
+    geometries are compared through their full distance matrix, while large ones are
+    searched for neighbors with a k-d tree, which scales sub-quadratically.
+
+    :param geo: molecular geometry
+    :type geo: automol geometry data structure
+    :param dist_factor: The multiplier on the distance limit, defaults to None
+    :type dist_factor: float, optional
+    :returns: The bonded pairs of atom indices, sorted, as an N x 2 array
+    """
+    natms = count(geo)
+    if natms < 2:
+        return numpy.empty((0, 2), dtype=int)
+
+    # Look up the distance limits by unique symbol pair
+    symbs, symb_idxs = numpy.unique(symbols(geo), return_inverse=True)
+    lim_mat = heuristic.bond_distance_limits(symbs, dist_factor=dist_factor)
+
+    xyzs = numpy.array(coordinates(geo))
+    if natms < KDTREE_MIN_ATOMS:
+        idxs1, idxs2 = numpy.triu_indices(natms, k=1)
+    else:
+        max_dist = numpy.max(lim_mat) / phycon.BOHR2ANG * (1 + 1e-6)
+        pairs = KDTree(xyzs).query_pairs(max_dist, output_type="ndarray")
+        pairs = pairs[numpy.lexsort((pairs[:, 1], pairs[:, 0]))]
+        idxs1, idxs2 = pairs.T
+
+    dists = numpy.linalg.norm(xyzs[idxs1] - xyzs[idxs2], axis=-1) * phycon.BOHR2ANG
+    lims = lim_mat[symb_idxs[idxs1], symb_idxs[idxs2]]
+    is_bonded = dists <= lims
+    return numpy.stack([idxs1[is_bonded], idxs2[is_bonded]], axis=-1)
+
+
 def connectivity_graph_deprecated(
     geo, rqq_bond_max=3.45, rqh_bond_max=2.6, rhh_bond_max=1.9
 ):
@@ -1402,8 +1402,13 @@ def atom_bond_counts(gra, bond_order=True, with_implicit=True, ts_=True):
     if not bond_order:
         gra = without_pi_bonds(gra)
 
-    atm_nbhs = dict_.values_by_key(atom_neighborhoods(gra), atm_keys)
-    atm_nbnds = [sum(bond_orders(nbh).values()) for nbh in atm_nbhs]
+    # Sum the orders of each atom's bonds, in the order of its neighborhood subgraph
+    bnd_ord_dct = bond_orders(gra)
+    atm_bnd_keys_dct = _bond_keys_index(bond_keys(gra))
+    atm_nbnds = [
+        sum(bnd_ord_dct[k] for k in set(atm_bnd_keys_dct.get(atm_key, ())))
+        for atm_key in atm_keys
+    ]
     atm_nbnd_dct = dict_.transform_values(dict(zip(atm_keys, atm_nbnds)), int)
     return atm_nbnd_dct
 
@@ -2267,6 +2272,9 @@ def add_atom_explicit_hydrogens(gra, exp_hyd_keys_dct):
         f"{set(exp_hyd_keys_dct.keys())} !<= {atom_keys(gra)}"
     )
     for atm_key, atm_exp_hyd_keys in exp_hyd_keys_dct.items():
+        if not atm_exp_hyd_keys:
+            continue
+
         assert not set(atm_exp_hyd_keys) & atom_keys(gra)
         atm_exp_hyd_bnd_keys = {
             frozenset({atm_key, atm_exp_hyd_key})
@@ -2630,6 +2638,48 @@ def bond_induced_subgraph(gra, bnd_keys, stereo=False):
     return sub
 
 
+def _bond_keys_index(bnd_keys) -> Dict[int, frozenset]:
+    """Index a set of bond keys by atom, in one pass over the bonds
+
+    The index is cached by bond key set, so that neighbor queries on the same graph
+    share it instead of re-scanning its bonds. It must not be mutated.
+
+    :param bnd_keys: The bond keys
+    :returns: The bond keys containing each atom, by atom key (bonded atoms only)
+    """
+    return _frozen_bond_keys_index(frozenset(bnd_keys))
+
+
+def _neighbor_keys_index(bnd_keys) -> Dict[int, frozenset]:
+    """Index the neighbors of each atom in a set of bond keys
+
+    The index is cached by bond key set, like `_bond_keys_index`.
+
+    :param bnd_keys: The bond keys
+    :returns: The keys of neighboring atoms, by atom key (bonded atoms only)
+    """
+    return _frozen_neighbor_keys_index(frozenset(bnd_keys))
+
+
+@functools.lru_cache(maxsize=256)
+def _frozen_bond_keys_index(bnd_keys: frozenset) -> Dict[int, frozenset]:
+    """Cached body of `_bond_keys_index`."""
+    atm_bnd_keys_dct = {}
+    for bnd_key in bnd_keys:
+        for atm_key in bnd_key:
+            atm_bnd_keys_dct.setdefault(atm_key, []).append(bnd_key)
+    return {k: frozenset(v) for k, v in atm_bnd_keys_dct.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _frozen_neighbor_keys_index(bnd_keys: frozenset) -> Dict[int, frozenset]:
+    """Cached body of `_neighbor_keys_index`."""
+    return {
+        k: frozenset(itertools.chain(*ks)) - {k}
+        for k, ks in _frozen_bond_keys_index(bnd_keys).items()
+    }
+
+
 def atom_neighborhood(
     gra, atm_key, bnd_keys=None, stereo=False, ts_=True, second_degree: bool = False
 ):
@@ -2653,12 +2703,15 @@ def atom_neighborhood(
     """
     gra = gra if ts_ else ts_reactants_graph_without_stereo(gra)
     bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else bnd_keys
-    nbh_bnd_keys = set(k for k in bnd_keys if atm_key in k)
+    atm_bnd_keys_dct = _bond_keys_index(bnd_keys)
+    nbh_bnd_keys = set(atm_bnd_keys_dct.get(atm_key, ()))
 
     # If we are allowing second-degree neighbors, extend this to include them
     if second_degree:
         nbh_atm_keys = set(itertools.chain(*nbh_bnd_keys))
-        nbh_bnd_keys = set(k for k in bnd_keys if nbh_atm_keys & k)
+        nbh_bnd_keys = set(
+            itertools.chain(*(atm_bnd_keys_dct.get(k, ()) for k in nbh_atm_keys))
+        )
 
     if nbh_bnd_keys:
         nbh = bond_induced_subgraph(gra, nbh_bnd_keys, stereo=stereo)
@@ -2680,7 +2733,7 @@ def atom_neighborhoods(gra, bnd_keys=None, stereo=False, ts_=True):
     :returns: neighborhood subgraphs, by atom key
     :rtype: dict[int: automol graph data structure]
     """
-    bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else bnd_keys
+    bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else frozenset(bnd_keys)
 
     def _neighborhood(atm_key):
         return atom_neighborhood(
@@ -2707,7 +2760,8 @@ def bond_neighborhood(gra, bnd_key, bnd_keys=None, stereo=False, ts_=True):
     :rtype: automol graph data structure
     """
     bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else bnd_keys
-    nbh_bnd_keys = set(filter(lambda x: bnd_key & x, bnd_keys))
+    atm_bnd_keys_dct = _bond_keys_index(bnd_keys)
+    nbh_bnd_keys = set(itertools.chain(*(atm_bnd_keys_dct.get(k, ()) for k in bnd_key)))
     nbh = bond_induced_subgraph(gra, nbh_bnd_keys, stereo=stereo)
     return nbh
 
@@ -2724,7 +2778,7 @@ def bond_neighborhoods(gra, bnd_keys=None, stereo=False, ts_=True):
     :returns: neighborhood subgraphs, by bond key
     :rtype: dict[frozenset: automol graph data structure]
     """
-    bnd_keys = list(bond_keys(gra, ts_=ts_) if bnd_keys is None else bnd_keys)
+    bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else frozenset(bnd_keys)
 
     def _neighborhood(bnd_key):
         return bond_neighborhood(
@@ -2768,10 +2822,18 @@ def atom_neighbor_atom_keys(
     :returns: The keys of neighboring atoms
     :rtype: frozenset[int]
     """
-    atm_nbh = atom_neighborhood(
-        gra, atm_key, bnd_keys=bnd_keys, ts_=ts_, second_degree=second_degree
-    )
-    atm_nkeys = atom_keys(atm_nbh, symb=symb, excl_symbs=excl_symbs)
+    bnd_keys = bond_keys(gra, ts_=ts_) if bnd_keys is None else bnd_keys
+    atm_nkeys_dct = _neighbor_keys_index(bnd_keys)
+    atm_nkeys = {atm_key} | atm_nkeys_dct.get(atm_key, frozenset())
+
+    # If we are allowing second-degree neighbors, extend this to include them
+    if second_degree:
+        atm_nkeys.update(*(atm_nkeys_dct.get(k, ()) for k in atm_nkeys))
+
+    symb_dct = atom_symbols(gra)
+    atm_nkeys = {k for k in atm_nkeys if symb_dct[k] not in excl_symbs}
+    if symb is not None:
+        atm_nkeys = {k for k in atm_nkeys if symb_dct[k] == symb}
 
     if not include_self:
         atm_nkeys -= {atm_key}
@@ -2836,14 +2898,8 @@ def atoms_neighbor_atom_keys(gra, ts_=True):
     :returns: Neighboring atom keys by atom, as a dictionary
     :rtype: dict[int: frozenset]
     """
-
-    def _neighbor_keys(atm_key, atm_nbh):
-        return frozenset(atom_keys(atm_nbh) - {atm_key})
-
-    atm_ngb_keys_dct = dict_.transform_items_to_values(
-        atom_neighborhoods(gra, ts_=ts_), _neighbor_keys
-    )
-    return atm_ngb_keys_dct
+    atm_nkeys_dct = _neighbor_keys_index(bond_keys(gra, ts_=ts_))
+    return {k: atm_nkeys_dct.get(k, frozenset()) for k in atom_keys(gra)}
 
 
 def atoms_sorted_neighbor_atom_keys(
@@ -2934,8 +2990,8 @@ def atom_sorted_neighbor_atom_keys(
 
     # 1. Get the pools of neighbor keys, based on included and excluded keys
     incl_keys = atom_keys(gra) if incl_keys is None else incl_keys
-    nbh = atom_neighborhood(gra, atm_key, ts_=ts_)
-    keys = set(incl_keys) & (atom_keys(nbh) - {atm_key} - set(excl_keys))
+    nkeys = atom_neighbor_atom_keys(gra, atm_key, ts_=ts_)
+    keys = set(incl_keys) & (nkeys - set(excl_keys))
 
     # 2. Do the sorting
     #   a. Sort by key value
@@ -3127,7 +3183,7 @@ def atom_bond_keys(gra, atm_key, ts_=True):
     :returns: The bond keys containing this atom
     :rtype: frozenset[frozenset[int]]
     """
-    return bond_keys(atom_neighborhood(gra, atm_key, ts_=ts_))
+    return _bond_keys_index(bond_keys(gra, ts_=ts_)).get(atm_key, frozenset())
 
 
 def atoms_bond_keys(gra, ts_=True):
@@ -3140,8 +3196,8 @@ def atoms_bond_keys(gra, ts_=True):
     :returns: The bond keys of each atom, as a dictionary
     :rtype: dict[int: frozenset]
     """
-    atm_nbhs = atom_neighborhoods(gra, ts_=ts_)
-    return dict_.transform_values(atm_nbhs, bond_keys)
+    atm_bnd_keys_dct = _bond_keys_index(bond_keys(gra, ts_=ts_))
+    return {k: atm_bnd_keys_dct.get(k, frozenset()) for k in atom_keys(gra)}
 
 
 def dummy_source_dict(
@@ -99,34 +99,6 @@ def all_isomorphisms(nxg1, nxg2):
     return tuple(matcher.isomorphisms_iter())
 
 
-def isomorphism(nxg1, nxg2):
-    """graph isomorphism"""
-
-    matcher = networkx.algorithms.isomorphism.GraphMatcher(
-        nxg1, nxg2, node_match=operator.eq, edge_match=operator.eq
-    )
-
-    iso_dct = None
-    if matcher.is_isomorphic():
-        iso_dct = dict(matcher.mapping)
-
-    return iso_dct
-
-
-def subgraph_isomorphism(nxg1, nxg2):
-    """subgraph isomorphism -- a subgraph of G1 is isomorphic to G2"""
-
-    matcher = networkx.algorithms.isomorphism.GraphMatcher(
-        nxg1, nxg2, node_match=operator.eq, edge_match=operator.eq
-    )
-
-    iso_dct = None
-    if matcher.subgraph_is_isomorphic():
-        iso_dct = dict(matcher.mapping)
-
-    return iso_dct
-
-
 def weighted_maximal_matching(nxg, edge_attrib_name):
     """subgraph isomorphism -- a subgraph of G1 is isomorphic to G2"""
     ret = networkx.max_weight_matching(nxg, weight=edge_attrib_name)
@@ -8,8 +8,8 @@ import functools
 import itertools
 import numbers
 import operator
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, NamedTuple, Tuple
 
 import more_itertools as mit
 import networkx
@@ -17,6 +17,11 @@ import networkx
 from ... import util
 from . import _01networkx
 from ._00core import (
+    ATM_IMP_HYD_POS,
+    ATM_STE_PAR_POS,
+    ATM_SYM_POS,
+    BND_ORD_POS,
+    BND_STE_PAR_POS,
     AtomKeys,
     add_bonds,
     atom_bond_keys,
@@ -24,11 +29,13 @@ from ._00core import (
     atom_keys,
     atom_neighbor_atom_keys,
     atom_symbols,
+    atoms,
     atoms_bond_keys,
     atoms_neighbor_atom_keys,
     bond_induced_subgraph,
     bond_keys,
     bond_orders,
+    bonds,
     clear_unstable_bond_orders,
     frozen,
     implicit,
@@ -73,29 +80,293 @@ def isomorphism(
     :returns: The isomorphism mapping `gra1` onto `gra2`
     :rtype: dict
     """
-    if backbone_only:
-        gra1 = implicit(gra1)
-        gra2 = implicit(gra2)
+    mgra1 = _isomorphism_match_graph(
+        gra1, backbone_only=backbone_only, stereo=stereo, dummy=dummy, unstable=unstable
+    )
+    mgra2 = _isomorphism_match_graph(
+        gra2, backbone_only=backbone_only, stereo=stereo, dummy=dummy, unstable=unstable
+    )
+    return _match(mgra1, mgra2, subgraph=subgraph)
 
-    if not stereo:
-        gra1 = without_stereo(gra1)
-        gra2 = without_stereo(gra2)
+
+def isomorphism_hash(gra, backbone_only=False, stereo=True, dummy=True) -> str:
+    """Get a hash that is the same for isomorphic graphs
+
+    Graphs with different hashes are not isomorphic, though graphs with the same hash
+    may still not be. The hash is only consistent within one Python session.
+
+    :param backbone_only: Compare backbone atoms only?
+    :type backbone_only: bool
+    :param stereo: Consider stereo?
+    :type stereo: bool
+    :param dummy: Consider dummy atoms?
+    :type dummy: bool
+    :returns: A hash of the refined atom colors compared by `isomorphism`
+    """
+    mgra = _isomorphism_match_graph(
+        gra, backbone_only=backbone_only, stereo=stereo, dummy=dummy
+    )
+    return f"{hash(mgra.invariant) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+# # # native VF2 matching
+class _MatchGraph(NamedTuple):
+    """The data compared by `isomorphism`, prepared once per graph.
+
+    :param keys: Atom keys, in `atom_keys` order
+    :param adj: Neighbor dictionary, mapping each atom to its neighbors' bond labels
+    :param labels: Atom labels (symbol, implicit hydrogens, stereo parity)
+    :param label_counts: Counts of the atom labels
+    :param colors: Refined atom colors; isomorphic atoms always have the same color
+    :param invariant: A sorted tuple of the atom colors, shared by isomorphic graphs
+    """
+
+    keys: tuple
+    adj: dict
+    labels: dict
+    label_counts: Counter
+    colors: dict
+    invariant: tuple
+
+
+MATCH_GRAPH_CACHE_SIZE = 512
+COLOR_REFINEMENT_ITERATIONS = 2
+
+
+def _isomorphism_match_graph(
+    gra, backbone_only=False, stereo=True, dummy=True, unstable=True
+) -> _MatchGraph:
+    """Get the prepared graph compared by `isomorphism`.
+
+    Prepared graphs are cached by the contents of the graph, so that the atom
+    invariants are reused across repeated queries against the same graph.
+    """
+    gra_items = (tuple(atoms(gra).items()), tuple(bonds(gra).items()))
+    return _match_graph_from_items(gra_items, backbone_only, stereo, dummy, unstable)
+
+
+@functools.lru_cache(maxsize=MATCH_GRAPH_CACHE_SIZE)
+def _match_graph_from_items(
+    gra_items, backbone_only: bool, stereo: bool, dummy: bool, unstable: bool
+) -> _MatchGraph:
+    """Prepare a graph for matching, given its atom and bond items.
+
+    Atoms and bonds are visited in the same order as in the networkx graph, so that
+    the search visits candidates in the same order as the networkx matcher.
+    """
+    gra = tuple(map(dict, gra_items))
+    if backbone_only:
+        gra = implicit(gra)
 
     if not dummy:
-        gra1 = without_dummy_atoms(gra1)
-        gra2 = without_dummy_atoms(gra2)
+        gra = without_dummy_atoms(gra)
 
     if not unstable:
-        gra1 = clear_unstable_bond_orders(gra1)
-        gra2 = clear_unstable_bond_orders(gra2)
+        gra = clear_unstable_bond_orders(gra)
+
+    atm_dct = atoms(gra)
+    bnd_dct = bonds(gra)
+    keys = tuple(atom_keys(gra))
+    labels = {
+        k: (
+            atm_dct[k][ATM_SYM_POS],
+            atm_dct[k][ATM_IMP_HYD_POS],
+            atm_dct[k][ATM_STE_PAR_POS] if stereo else None,
+        )
+        for k in keys
+    }
+
+    adj = {k: {} for k in keys}
+    for bkey in bond_keys(gra):
+        key1, key2 = bkey
+        adj[key1][key2] = adj[key2][key1] = (
+            bnd_dct[bkey][BND_ORD_POS],
+            bnd_dct[bkey][BND_STE_PAR_POS] if stereo else None,
+        )
+
+    # networkx compares `without_stereo(gra)` here, which has its atoms sorted
+    if not stereo:
+        keys = tuple(frozenset(sorted(keys)))
+
+    # Refine atom colors by neighborhood, as in the Weisfeiler-Lehman hash
+    bnd_hashes = {k: [(n, hash(b)) for n, b in d.items()] for k, d in adj.items()}
+    colors = {k: hash(lab) for k, lab in labels.items()}
+    for _ in range(COLOR_REFINEMENT_ITERATIONS):
+        colors = {
+            k: hash((colors[k], *sorted(h + colors[n] for n, h in nhs)))
+            for k, nhs in bnd_hashes.items()
+        }
+
+    invariant = tuple(sorted(colors.values()))
+    return _MatchGraph(
+        keys=keys,
+        adj=adj,
+        labels=labels,
+        label_counts=Counter(labels.values()),
+        colors=colors,
+        invariant=invariant,
+    )
+
 
-    nxg1 = _01networkx.from_graph(gra1)
-    nxg2 = _01networkx.from_graph(gra2)
+def _match(mgra1: _MatchGraph, mgra2: _MatchGraph, subgraph: bool = False):
+    """Find an isomorphism between prepared graphs, using the VF2 algorithm.
+
+    :param mgra1: The first graph
+    :param mgra2: The second graph
+    :param subgraph: Match `mgra2` onto an induced subgraph of `mgra1`?
+    :returns: The isomorphism mapping `mgra1` onto `mgra2`, if there is one
+    """
     if subgraph:
-        iso_dct = _01networkx.subgraph_isomorphism(nxg1, nxg2)
-    else:
-        iso_dct = _01networkx.isomorphism(nxg1, nxg2)
-    return iso_dct
+        if not mgra2.label_counts <= mgra1.label_counts:
+            return None
+    elif mgra1.invariant != mgra2.invariant:
+        return None
+
+    matcher = _Matcher(mgra1, mgra2, subgraph=subgraph)
+    return dict(matcher.core1) if matcher.search() else None
+
+
+class _Matcher:
+    """The state of a VF2 search between two prepared graphs.
+
+    This follows the networkx `GraphMatcher`, but prunes candidates by their atom
+    colors (isomorphism) or degrees (subgraph isomorphism) before checking
+    feasibility, and updates the terminal sets incrementally.
+    """
+
+    def __init__(self, mgra1: _MatchGraph, mgra2: _MatchGraph, subgraph: bool) -> None:
+        self.mgra1 = mgra1
+        self.mgra2 = mgra2
+        self.subgraph = subgraph
+        self.order2 = {k: i for i, k in enumerate(mgra2.keys)}
+        self.core1 = {}
+        self.core2 = {}
+        # Mapped and terminal atoms, by the order in which they were reached
+        self.inout1 = {}
+        self.inout2 = {}
+        # Terminal atoms: unmapped neighbors of mapped atoms
+        self.term1 = set()
+        self.term2 = set()
+        self.sizes = []
+
+    def search(self) -> bool:
+        """Extend the mapping until it covers the second graph.
+
+        The depth-first search keeps an explicit stack of candidate pairs, so that it
+        is not limited by the recursion limit for large graphs.
+        """
+        nkeys = len(self.mgra2.keys)
+        if len(self.core1) == nkeys:
+            return True
+
+        pairs_stack = [iter(self.candidate_pairs())]
+        path = []
+        while pairs_stack:
+            for key1, key2 in pairs_stack[-1]:
+                if self.feasible(key1, key2):
+                    self.push(key1, key2)
+                    if len(self.core1) == nkeys:
+                        return True
+
+                    path.append((key1, key2))
+                    pairs_stack.append(iter(self.candidate_pairs()))
+                    break
+            else:
+                # No pairs remain at this depth, so backtrack
+                pairs_stack.pop()
+                if path:
+                    self.pop(*path.pop())
+
+        return False
+
+    def candidate_pairs(self) -> list[tuple[Any, Any]]:
+        """Get the candidate pairs for extending the mapping."""
+        term1, term2 = self.term1, self.term2
+
+        # A terminal atom of the second graph can only map onto a terminal atom of the
+        # first, and vice versa for a full isomorphism
+        if (term2 and not term1) or (term1 and not term2 and not self.subgraph):
+            return []
+
+        if term1 and term2:
+            keys1 = sorted(term1, key=self.inout1.__getitem__)
+            keys2 = term2
+        else:
+            keys1 = [k for k in self.mgra1.keys if k not in self.core1]
+            keys2 = [k for k in self.mgra2.keys if k not in self.core2]
+        key2 = min(keys2, key=self.order2.__getitem__)
+        return [(key1, key2) for key1 in keys1]
+
+    def feasible(self, key1, key2) -> bool:
+        """Determine whether a pair can be added to the mapping."""
+        nbs1 = self.mgra1.adj[key1]
+        nbs2 = self.mgra2.adj[key2]
+        if self.mgra1.labels[key1] != self.mgra2.labels[key2]:
+            return False
+
+        if self.subgraph:
+            if len(nbs1) < len(nbs2):
+                return False
+        elif self.mgra1.colors[key1] != self.mgra2.colors[key2]:
+            return False
+
+        # Mapped neighbors must be bonded in both graphs, with the same bond labels
+        core1, core2 = self.core1, self.core2
+        if any(
+            core1[n1] not in nbs2 or nbs2[core1[n1]] != b1
+            for n1, b1 in nbs1.items()
+            if n1 in core1
+        ) or any(core2[n2] not in nbs1 for n2 in nbs2 if n2 in core2):
+            return False
+
+        # Look ahead at the terminal and remaining neighbors
+        term1, term2 = self.term1, self.term2
+        inout1, inout2 = self.inout1, self.inout2
+        counts1 = (
+            sum(1 for n in nbs1 if n in term1),
+            sum(1 for n in nbs1 if n not in inout1),
+        )
+        counts2 = (
+            sum(1 for n in nbs2 if n in term2),
+            sum(1 for n in nbs2 if n not in inout2),
+        )
+        if self.subgraph:
+            return all(c1 >= c2 for c1, c2 in zip(counts1, counts2, strict=True))
+        return counts1 == counts2
+
+    def push(self, key1, key2) -> None:
+        """Add a pair to the mapping."""
+        self.sizes.append((len(self.inout1), len(self.inout2)))
+        self.core1[key1] = key2
+        self.core2[key2] = key1
+        for inout, term, adj, key in (
+            (self.inout1, self.term1, self.mgra1.adj, key1),
+            (self.inout2, self.term2, self.mgra2.adj, key2),
+        ):
+            term.discard(key)
+            inout.setdefault(key, len(inout))
+            for nkey in adj[key]:
+                if nkey not in inout:
+                    inout[nkey] = len(inout)
+                    term.add(nkey)
+
+    def pop(self, key1, key2) -> None:
+        """Remove the last pair from the mapping."""
+        sizes = self.sizes.pop()
+        del self.core1[key1]
+        del self.core2[key2]
+        for inout, term, key, size in zip(
+            (self.inout1, self.inout2),
+            (self.term1, self.term2),
+            (key1, key2),
+            sizes,
+            strict=True,
+        ):
+            # Atoms reached by the last pair are the last ones in the dictionary
+            while len(inout) > size:
+                term.discard(inout.popitem()[0])
+            if key in inout:
+                term.add(key)
 
 
 def isomorphic(gra1, gra2, backbone_only=False, stereo=True, dummy=True):
@@ -144,26 +415,41 @@ def unique_with_counts(
     :param dummy: Consider dummy atoms?
     :returns: Unique graphs along with their counts.
     """
-
-    def _equiv(gra1, gra2):
-        return isomorphic(
-            gra1, gra2, backbone_only=backbone_only, stereo=stereo, dummy=dummy
+    # Prepare each graph once, and only compare graphs with the same invariant
+    gras = tuple(gras)
+    mgras = [
+        _isomorphism_match_graph(
+            gra, backbone_only=backbone_only, stereo=stereo, dummy=dummy
         )
+        for gra in gras
+    ]
+
+    def _equiv(idx1, idx2):
+        return _match(mgras[idx1], mgras[idx2]) is not None
+
+    idxs_with_counts = _unique_with_counts(
+        range(len(gras)), equiv=_equiv, key=lambda idx: mgras[idx].invariant
+    )
+    return [(gras[idx], count) for idx, count in idxs_with_counts]
 
-    gras_with_counts = _unique_with_counts(gras, equiv=_equiv)
-    return gras_with_counts
 
+def _unique_with_counts(items, equiv, key=None) -> list[tuple[Any, int]]:
+    """Get unique items from a list, according to binary comparison `equiv`.
 
-def _unique_with_counts(items, equiv) -> list[tuple[Any, int]]:
-    """Get unique items from a list, according to binary comparison `equiv`."""
+    If given, `key` is an invariant of `equiv`, so that items are only compared to
+    those with the same key.
+    """
     items0 = items
     items = []
     counts = []
+    bucket_dct = defaultdict(list)
     for item in items0:
-        idx = next((ix for ix, it in enumerate(items) if equiv(item, it)), None)
+        bucket = bucket_dct[None if key is None else key(item)]
+        idx = next((ix for ix in bucket if equiv(item, items[ix])), None)
         if idx is not None:
             counts[idx] += 1
         else:
+            bucket.append(len(items))
             items.append(item)
             counts.append(1)
 
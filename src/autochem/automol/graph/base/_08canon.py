@@ -6,6 +6,7 @@ Reference:
 Schneider, Sayle, Landrum. J. Chem. Inf. Model. 2015, 55, 10, 2111–2120
 """
 
+import functools
 import itertools
 from collections.abc import Callable
 from typing import Any, Dict, List, Optional, Tuple
@@ -28,6 +29,7 @@ from ._00core import (
     bond_stereo_keys,
     bond_stereo_parities,
     explicit,
+    frozen,
     has_stereo,
     implicit,
     invert_atom_stereo_parities,
@@ -377,6 +379,106 @@ def calculate_stereo(
         whether a TS graph has a canonical direction (None for non-TS graphs)
     :rtype: automol graph data structure, -//-, Dict[int, int], Optional[bool]
     """
+    # Results that only depend on the graph are memoized
+    if (
+        cand_dct is None
+        and par_eval_ in GRAPH_PARITY_EVALUATORS
+        and can_par_eval_ in GRAPH_PARITY_EVALUATORS
+    ):
+        args = _StereoArguments(gra, par_eval_, can_par_eval_, pri_dct)
+        gra, can_gra, pri_dct, is_can_dir = _calculate_stereo_memoized(args)
+        return (
+            tuple(map(dict, gra)),
+            tuple(map(dict, can_gra)),
+            dict(pri_dct),
+            is_can_dir,
+        )
+
+    return _calculate_stereo(
+        gra, par_eval_, can_par_eval_, pri_dct=pri_dct, cand_dct=cand_dct
+    )
+
+
+# # memoization of stereo calculations
+# Parity evaluators that only read the graph, so that their results can be memoized
+GRAPH_PARITY_EVALUATORS = (
+    None,
+    parity_evaluator_read_from_graph,
+    parity_evaluator_flip_from_graph,
+)
+STEREO_CACHE_SIZE = 1024
+
+
+class _StereoArguments:
+    """Arguments to `calculate_stereo`, compared by the value of the graph"""
+
+    __slots__ = ("can_par_eval_", "gra", "key", "par_eval_", "pri_dct")
+
+    def __init__(self, gra, par_eval_, can_par_eval_, pri_dct) -> None:
+        self.gra = gra
+        self.par_eval_ = par_eval_
+        self.can_par_eval_ = can_par_eval_
+        self.pri_dct = pri_dct
+        pri_key = None if pri_dct is None else frozenset(pri_dct.items())
+        self.key = (frozen(gra), par_eval_, can_par_eval_, pri_key)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StereoArguments) and self.key == other.key
+
+
+def _calculate_stereo_from_arguments(args: _StereoArguments):
+    """Uncached body of the memoized stereo calculation"""
+    return _calculate_stereo(
+        args.gra, args.par_eval_, args.can_par_eval_, pri_dct=args.pri_dct
+    )
+
+
+_calculate_stereo_memoized = functools.lru_cache(maxsize=STEREO_CACHE_SIZE)(
+    _calculate_stereo_from_arguments
+)
+
+
+def stereo_cache_info():
+    """Get statistics for the memoized stereo calculations
+
+    These back `canonical_keys`, `canonical_priorities`, `to_local_stereo`, and
+    `from_local_stereo`, as well as `calculate_stereo` when its results only depend on
+    the graph.
+
+    :returns: Hits, misses, maximum size, and current size of the cache
+    :rtype: functools._CacheInfo
+    """
+    return _calculate_stereo_memoized.cache_info()
+
+
+def clear_stereo_cache():
+    """Clear the memoized stereo calculations"""
+    _calculate_stereo_memoized.cache_clear()
+
+
+def set_stereo_cache_size(maxsize: Optional[int] = STEREO_CACHE_SIZE):
+    """Set the number of stereo calculations to memoize, clearing the cache
+
+    :param maxsize: Maximum number of cached results (0 to disable, None for no limit)
+    :type maxsize: Optional[int]
+    """
+    global _calculate_stereo_memoized  # noqa: PLW0603
+    _calculate_stereo_memoized = functools.lru_cache(maxsize=maxsize)(
+        _calculate_stereo_from_arguments
+    )
+
+
+def _calculate_stereo(
+    gra,
+    par_eval_: Optional[ParityEvaluator] = None,
+    can_par_eval_: Optional[ParityEvaluator] = None,
+    pri_dct: Optional[Dict[int, int]] = None,
+    cand_dct: Optional[CenterNeighborDict] = None,
+):
+    """Uncached body of `calculate_stereo`"""
     if is_ts_graph(gra):
         gra, can_gra, pri_dct, is_can_dir = _calculate_ts_stereo(
             gra, par_eval_, can_par_eval_, pri_dct=pri_dct, cand_dct=cand_dct
@@ -203,6 +203,7 @@ from ._02algo import (
     is_ring_system,
     isomorphic,
     isomorphism,
+    isomorphism_hash,
     longest_chain,
     ring_arc_complement_atom_keys,
     ring_atom_chirality,
@@ -316,8 +317,11 @@ from ._08canon import (
     canonical,
     canonical_keys,
     canonical_priorities,
+    clear_stereo_cache,
     from_local_stereo,
+    set_stereo_cache_size,
     smiles_graph,
+    stereo_cache_info,
     to_local_stereo,
 )
 
@@ -540,6 +544,7 @@ __all__ = [
     "equivalent_without_dummy_atoms",
     "isomorphism",
     "isomorphic",
+    "isomorphism_hash",
     "unique",
     "unique_with_counts",
     "sequence_isomorphism",
@@ -672,6 +677,9 @@ __all__ = [
     # # symmetry class functions
     "canonical_priorities",
     "calculate_stereo",
+    "stereo_cache_info",
+    "clear_stereo_cache",
+    "set_stereo_cache_size",
     # # parity evaluators
     "parity_evaluator_measure_from_geometry_",
     "parity_evaluator_read_from_graph",
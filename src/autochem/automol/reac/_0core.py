@@ -1310,15 +1310,20 @@ def unique(rxns: list[Reaction]) -> list[Reaction]:
     """
     all_rxns = rxns
     rxns = []
+    tsgs = []
+    hashes = []
 
-    def isomorphic_(rxn1, rxn2):
-        tsg1 = ts_graph(rxn1)
-        tsg2 = ts_graph(rxn2)
-        return graph.isomorphic(tsg1, tsg2, stereo=True)
-
+    # Only compare TS graphs with the same hash, since others cannot be isomorphic
     for rxn in all_rxns:
-        if not any(isomorphic_(rxn, r) for r in rxns):
+        tsg = ts_graph(rxn)
+        hash_ = graph.isomorphism_hash(tsg, stereo=True)
+        if not any(
+            h == hash_ and graph.isomorphic(tsg, t, stereo=True)
+            for h, t in zip(hashes, tsgs, strict=True)
+        ):
             rxns.append(rxn)
+            tsgs.append(tsg)
+            hashes.append(hash_)
 
     return tuple(rxns)
 
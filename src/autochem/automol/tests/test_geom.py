@@ -522,6 +522,22 @@ def test__translate():
     assert automol.geom.almost_equal_dist_matrix(geo1, ref_geo1, thresh=0.001)
 
 
+def test__graph_without_stereo():
+    """test geom.graph_without_stereo"""
+    gra = geom.graph_without_stereo(C2H6_GEO)
+    assert len(automol.graph.bond_keys(gra)) == 7
+
+    # A cluster of ethanes, large enough to search for neighbors with a k-d tree
+    nmols = 40
+    geos = [geom.translate(C2H6_GEO, (8.0 * idx, 0.0, 0.0)) for idx in range(nmols)]
+    cluster_geo = sum(geos, ())
+    assert geom.count(cluster_geo) == 320
+    cluster_gra = geom.graph_without_stereo(cluster_geo)
+    assert cluster_gra == automol.graph.union_from_sequence(
+        [gra] * nmols, shift_keys=True
+    )
+
+
 def test__closest_unbonded_atoms():
     """test geom.closest_unbonded_atoms"""
 
@@ -1103,9 +1103,49 @@ def test__isomorphism():
         assert graph.isomorphism(cgr, cgr_pmt) == pmt_dct
 
 
+def test__isomorphism__large():
+    """test graph.isomorphism for a graph deeper than the recursion limit"""
+    natms = 1200
+    gra = graph.from_data(
+        dict.fromkeys(range(natms), "C"), [(i, i + 1) for i in range(natms - 1)]
+    )
+    pmt_dct = dict(enumerate(numpy.random.permutation(natms).tolist()))
+    gra_pmt = graph.relabel(gra, pmt_dct)
+    iso_dct = graph.isomorphism(gra, gra_pmt)
+    assert graph.relabel(gra, iso_dct) == gra_pmt
+
+
+def test__subgraph_isomorphism():
+    """test graph.subgraph_isomorphism"""
+    cgr = C8H13O_CGR
+    sub_keys = graph.dfs_atom_keys(graph.dfs_(cgr, 0))[:5]
+    sub_cgr = graph.subgraph(cgr, sub_keys)
+    sub_cgr_pmt = graph.relabel(sub_cgr, {k: k + 100 for k in sub_keys})
+    iso_dct = graph.subgraph_isomorphism(cgr, sub_cgr_pmt)
+    assert graph.relabel(graph.subgraph(cgr, iso_dct), iso_dct) == sub_cgr_pmt
+
+    assert graph.subgraph_isomorphism(C3H3_CGR, cgr) is None
+
+
 def test__unique():
     """test graph.unique"""
     assert graph.unique(C3H3_RGRS) == C3H3_RGRS[:1]
+    assert graph.unique_with_counts(C3H3_RGRS) == [(C3H3_RGRS[0], len(C3H3_RGRS))]
+
+    gras = [C8H13O_CGR, C3H3_CGR, graph.relabel(C8H13O_CGR, {0: 100}), C3H3_CGR]
+    assert graph.unique_with_counts(gras) == [(C8H13O_CGR, 2), (C3H3_CGR, 2)]
+
+
+def test__isomorphism_hash():
+    """test graph.isomorphism_hash"""
+    natms = len(graph.atoms(C8H13O_CGR))
+    hash_ = graph.isomorphism_hash(C8H13O_CGR)
+    for _ in range(10):
+        pmt_dct = dict(enumerate(numpy.random.permutation(natms)))
+        cgr_pmt = graph.relabel(C8H13O_CGR, pmt_dct)
+        assert graph.isomorphism_hash(cgr_pmt) == hash_
+
+    assert graph.isomorphism_hash(C3H3_CGR) != hash_
 
 
 # chemistry library
@@ -2083,6 +2123,29 @@ def test__canonical():
         _test_from_smiles(smi)
 
 
+def test__stereo_cache():
+    """test graph.stereo_cache_info"""
+    graph.clear_stereo_cache()
+    can_key_dct = graph.canonical_keys(C8H13O_SGR)
+    info = graph.stereo_cache_info()
+    assert info.hits == 0 and info.currsize == 1
+
+    # Repeated calls are served from the cache, and returning copies protects it
+    can_key_dct.clear()
+    assert graph.canonical_keys(C8H13O_SGR) == graph.canonical_keys(C8H13O_SGR)
+    assert graph.canonical_keys(C8H13O_SGR)
+    assert graph.stereo_cache_info().hits == 3
+
+    # The cache can be resized or disabled
+    maxsize = graph.stereo_cache_info().maxsize
+    try:
+        graph.set_stereo_cache_size(0)
+        assert graph.canonical_keys(C8H13O_SGR)
+        assert graph.stereo_cache_info().currsize == 0
+    finally:
+        graph.set_stereo_cache_size(maxsize)
+
+
 def test__calculate_priorities_and_assign_parities():
     """test graph.calculate_priorities_and_assign_parities"""
 
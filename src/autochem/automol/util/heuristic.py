@@ -1,4 +1,9 @@
 """Structural heuristics."""
+
+from collections.abc import Sequence
+
+import numpy
+
 from phydat import ptab
 
 
@@ -51,3 +56,24 @@ def bond_distance_limit(
     vdw_dist = (rvdw1 + rvdw2) / 2.0
 
     return max(cov_dist, vdw_dist) * dist_factor
+
+
+def bond_distance_limits(
+    symbs: Sequence[str], dist_factor: float | None = None, angstrom: bool = True
+) -> numpy.ndarray:
+    """The heuristic bond distance limits between each pair of atoms in a sequence.
+
+    :param symbs: The atom symbols
+    :param dist_factor: The multiplier on the distance limit, defaults to 1.05
+    :type dist_factor: float, optional
+    :param angstrom: Return in angstroms instead of bohr?, defaults to True
+    :return: A symmetric matrix of distance limits, as given by `bond_distance_limit`
+    """
+    lims = [
+        [
+            bond_distance_limit(s1, s2, dist_factor=dist_factor, angstrom=angstrom)
+            for s2 in symbs
+        ]
+        for s1 in symbs
+    ]
+    return numpy.array(lims, dtype=float).reshape(len(symbs), len(symbs))
@@ -0,0 +1,284 @@
+"""Asynchronous pipeline, overlapping the external programs of many species."""
+
+import asyncio
+import contextlib
+import os
+import signal
+import subprocess
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from . import pipeline
+from .batch import Job, Result
+from .cache import Cache
+from .instrument import labeled, recording, stage
+from .pipeline import Input, Program, resume
+from .scratch import Scratch
+
+T = TypeVar("T")
+
+
+class Limits(BaseModel):
+    """Concurrency and time limits for each external program.
+
+    :param messpf_slots: Maximum number of concurrent MESS-PF runs
+    :param pac99_slots: Maximum number of concurrent PAC99 runs
+    :param messpf_timeout: MESS-PF time limit, in seconds (no limit if `None`)
+    :param pac99_timeout: PAC99 time limit, in seconds (no limit if `None`)
+    """
+
+    messpf_slots: int = os.cpu_count() or 1
+    pac99_slots: int = os.cpu_count() or 1
+    messpf_timeout: float | None = None
+    pac99_timeout: float | None = None
+
+
+class Stages:
+    """Semaphores bounding the concurrency of each pipeline stage.
+
+    The Python steps between external programs, such as parsing and fitting, are run
+    one at a time, since the pyparsing grammars are not thread-safe and the GIL would
+    serialize them anyway.
+
+    Semaphores are bound to an event loop, so these are created inside of one.
+
+    :param limits: Limits
+    """
+
+    def __init__(self, limits: Limits) -> None:
+        """Initialize stages."""
+        self.limits = limits
+        self.messpf = asyncio.Semaphore(limits.messpf_slots)
+        self.pac99 = asyncio.Semaphore(limits.pac99_slots)
+        self.python = asyncio.Lock()
+
+    async def run_python(self, func: Callable[..., T], *args: object) -> T:
+        """Run a Python step of the pipeline in a thread, keeping the event loop free.
+
+        :param func: Function
+        :param args: Arguments
+        :return: Function value
+        """
+        async with self.python:
+            return await asyncio.to_thread(func, *args)
+
+
+async def run_process(
+    args: Sequence[str],
+    cwd: Path,
+    timeout: float | None = None,
+    input_: bytes | None = None,
+    log_path: Path | None = None,
+) -> None:
+    """Run an external program, killing it if it times out or is cancelled.
+
+    :param args: Program and arguments
+    :param cwd: Working directory
+    :param timeout: Time limit, in seconds (no limit if `None`)
+    :param input_: Standard input
+    :param log_path: Path for standard output, with standard error going to the same
+        path with an `.err` suffix (discarded if `None`)
+    """
+    with contextlib.ExitStack() as stack:
+        stdout = stderr = subprocess.DEVNULL
+        if log_path is not None:
+            stdout = stack.enter_context(log_path.open("w"))
+            stderr = stack.enter_context(log_path.with_suffix(".err").open("w"))
+
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.DEVNULL if input_ is None else subprocess.PIPE,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            start_new_session=True,
+        )
+        try:
+            await asyncio.wait_for(proc.communicate(input_), timeout=timeout)
+        except TimeoutError:
+            await kill(proc)
+            msg = f"{args[0]} timed out after {timeout} s"
+            raise TimeoutError(msg) from None
+        except asyncio.CancelledError:
+            await kill(proc)
+            raise
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, list(args))
+
+
+async def kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a process started in its own session, along with any of its children.
+
+    :param proc: Process
+    """
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    await proc.wait()
+
+
+async def run_program(prog: Program, stages: Stages) -> None:
+    """Run an external program of the pipeline within its concurrency and time limits.
+
+    :param prog: Program
+    :param stages: Stage semaphores and limits
+    """
+    async with getattr(stages, prog.name):
+        with stage(prog.name):
+            await run_process(
+                prog.args,
+                cwd=prog.cwd,
+                timeout=getattr(stages.limits, f"{prog.name}_timeout"),
+                input_=prog.input_,
+                log_path=prog.log_path,
+            )
+
+
+async def run(
+    inp: Input,
+    stages: Stages,
+    path: str | Path = ".",
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+) -> str:
+    """Run MESS-PF and PAC99 for one species and write its NASA fit.
+
+    Runs the same steps as `pipeline.run`, except that the external programs are
+    awaited, so that those of other species can run at the same time. The steps in
+    between run in a worker thread, to keep the event loop free.
+
+    :param inp: Input
+    :param stages: Stage semaphores and limits
+    :param path: Working directory
+    :param cache: Result cache; if given, the executables are only run on a miss
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite the cache entry on a hit
+    :return: Chemkin-formatted NASA polynomial
+    """
+    steps = pipeline.steps(
+        inp, path=path, cache=cache, scratch=scratch, refresh=refresh
+    )
+    step = await stages.run_python(resume, steps)
+    while isinstance(step, Program):
+        try:
+            await run_program(step, stages)
+        except asyncio.CancelledError:
+            # Clean up the run directory, which is otherwise left to garbage collection
+            steps.close()
+            raise
+        except Exception as err:  # noqa: BLE001
+            step = await stages.run_python(resume, steps, err)
+        else:
+            step = await stages.run_python(resume, steps)
+    return step
+
+
+async def run_job(
+    job: Job,
+    stages: Stages,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    profile: bool = False,
+) -> Result:
+    """Run one job, capturing any error in the result.
+
+    :param job: Job
+    :param stages: Stage semaphores and limits
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param profile: Whether to record the resources used by each stage in the result
+    :return: Result
+    """
+    with (
+        labeled(job.label),
+        recording() if profile else contextlib.nullcontext([]) as records,
+    ):
+        try:
+            nasa_str = await run(
+                job.inp,
+                stages,
+                path=job.path,
+                cache=cache,
+                scratch=scratch,
+                refresh=refresh,
+            )
+        except Exception as err:  # noqa: BLE001
+            message = f"{type(err).__name__}: {err}"
+            return Result(label=job.label, ok=False, message=message, profile=records)
+    return Result(label=job.label, ok=True, nasa=nasa_str, profile=records)
+
+
+async def run_batch_async(
+    jobs: Sequence[Job],
+    limits: Limits | None = None,
+    callback: Callable[[Result], None] | None = None,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    profile: bool = False,
+) -> list[Result]:
+    """Run jobs concurrently, bounding the concurrency of each external program.
+
+    :param jobs: Jobs
+    :param limits: Concurrency and time limits
+    :param callback: Function called with each result as soon as it is available
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param profile: Whether to record the resources used by each stage in the results
+    :return: Results, in the same order as the jobs
+    """
+    stages = Stages(limits or Limits())
+
+    async def run_job_(job: Job) -> Result:
+        result = await run_job(
+            job, stages, cache=cache, scratch=scratch, refresh=refresh, profile=profile
+        )
+        if callback is not None:
+            callback(result)
+        return result
+
+    return list(await asyncio.gather(*map(run_job_, jobs)))
+
+
+def run_batch(
+    jobs: Sequence[Job],
+    limits: Limits | None = None,
+    callback: Callable[[Result], None] | None = None,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    profile: bool = False,
+) -> list[Result]:
+    """Run jobs concurrently in a new event loop.
+
+    :param jobs: Jobs
+    :param limits: Concurrency and time limits
+    :param callback: Function called with each result as soon as it is available
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param profile: Whether to record the resources used by each stage in the results
+    :return: Results, in the same order as the jobs
+    """
+    return asyncio.run(
+        run_batch_async(
+            jobs,
+            limits,
+            callback=callback,
+            cache=cache,
+            scratch=scratch,
+            refresh=refresh,
+            profile=profile,
+        )
+    )
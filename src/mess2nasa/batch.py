@@ -0,0 +1,223 @@
+"""Run the pipeline for many species on a process pool."""
+
+import concurrent.futures
+import contextlib
+import csv
+import functools
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import yaml
+from pydantic import BaseModel
+
+from .cache import Cache
+from .instrument import StageRecord, labeled, recording
+from .pipeline import Input, read_input, run
+from .scratch import Scratch
+
+
+class Job(BaseModel):
+    """One species in a batch.
+
+    :param label: Label used when reporting status
+    :param inp: Input
+    :param path: Working directory, against which input paths are resolved
+    """
+
+    label: str
+    inp: Input
+    path: Path
+
+
+class Result(BaseModel):
+    """Outcome of one species in a batch.
+
+    :param label: Job label
+    :param ok: Whether the job succeeded
+    :param message: Error message, if the job failed
+    :param nasa: Chemkin-formatted NASA polynomial, if the job succeeded
+    :param profile: Resources used by each stage, if requested
+    """
+
+    label: str
+    ok: bool
+    message: str = ""
+    nasa: str | None = None
+    profile: list[StageRecord] = []
+
+
+def read_manifest(manifest: str | Path) -> list[Job]:
+    """Read a batch manifest.
+
+    The manifest is either a directory or a YAML file containing a list of input
+    records. For a directory, each `*.yaml` file in it and each `*/input.yaml` file in
+    its subdirectories is an input, with paths relative to that file. For a YAML list,
+    paths in every record are relative to the manifest.
+
+    Jobs run in the same directory must set distinct `mess_input` and `nasa_output`
+    files, since the defaults would have them overwrite each other's output.
+
+    :param manifest: Path to the manifest
+    :return: Jobs
+    """
+    manifest = Path(manifest)
+    if manifest.is_dir():
+        input_files = sorted(manifest.glob("*.yaml")) + sorted(
+            manifest.glob("*/input.yaml")
+        )
+        jobs = [
+            Job(label=input_label(f, manifest), inp=read_input(f), path=f.parent)
+            for f in input_files
+        ]
+    else:
+        records = yaml.safe_load(manifest.read_text())
+        if not isinstance(records, list):
+            msg = f"Manifest {manifest} does not contain a list of inputs"
+            raise ValueError(msg)
+
+        jobs = [
+            Job(
+                label=f"{manifest.stem}[{i}]",
+                inp=Input.model_validate(record),
+                path=manifest.parent,
+            )
+            for i, record in enumerate(records)
+        ]
+
+    check_paths(jobs)
+    return jobs
+
+
+def check_paths(jobs: Sequence[Job]) -> None:
+    """Check that no two jobs share an input or output file.
+
+    :param jobs: Jobs
+    :raises ValueError: If two jobs resolve to the same `mess_input` or `nasa_output`
+    """
+    for field in ("mess_input", "nasa_output"):
+        labels: dict[Path, str] = {}
+        for job in jobs:
+            file = (job.path / getattr(job.inp, field)).resolve()
+            if file in labels:
+                msg = (
+                    f"Jobs {labels[file]} and {job.label} both use {field} {file}; "
+                    f"set a distinct {field} for each"
+                )
+                raise ValueError(msg)
+            labels[file] = job.label
+
+
+def input_label(input_file: Path, manifest: Path) -> str:
+    """Label an input file by its location in a manifest directory.
+
+    :param input_file: Path to the input file
+    :param manifest: Path to the manifest directory
+    :return: Label
+    """
+    rel_path = input_file.relative_to(manifest)
+    return str(rel_path.parent if rel_path.name == "input.yaml" else rel_path.stem)
+
+
+def run_job(
+    job: Job,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    profile: bool = False,
+    timeout: float | None = None,
+) -> Result:
+    """Run one job, capturing any error in the result.
+
+    :param job: Job
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param profile: Whether to record the resources used by each stage in the result
+    :param timeout: Time limit for each external program, in seconds (no limit if
+        `None`)
+    :return: Result
+    """
+    with (
+        labeled(job.label),
+        recording() if profile else contextlib.nullcontext([]) as records,
+    ):
+        try:
+            nasa_str = run(
+                job.inp,
+                path=job.path,
+                cache=cache,
+                scratch=scratch,
+                refresh=refresh,
+                timeout=timeout,
+            )
+        except Exception as err:  # noqa: BLE001
+            message = f"{type(err).__name__}: {err}"
+            return Result(label=job.label, ok=False, message=message, profile=records)
+    return Result(label=job.label, ok=True, nasa=nasa_str, profile=records)
+
+
+def run_batch(
+    jobs: Sequence[Job],
+    nprocs: int | None = None,
+    callback: Callable[[Result], None] | None = None,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    profile: bool = False,
+    timeout: float | None = None,
+) -> list[Result]:
+    """Run jobs on a bounded process pool.
+
+    :param jobs: Jobs
+    :param nprocs: Number of worker processes (default: number of CPUs)
+    :param callback: Function called with each result as soon as it is available
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param profile: Whether to record the resources used by each stage in the results
+    :param timeout: Time limit for each external program, in seconds (no limit if
+        `None`)
+    :return: Results, in the same order as the jobs
+    """
+    run_job_ = functools.partial(
+        run_job,
+        cache=cache,
+        scratch=scratch,
+        refresh=refresh,
+        profile=profile,
+        timeout=timeout,
+    )
+    results: dict[int, Result] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nprocs) as executor:
+        futures = {executor.submit(run_job_, job): i for i, job in enumerate(jobs)}
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if callback is not None:
+                callback(result)
+    return [results[i] for i in range(len(jobs))]
+
+
+def thermo_block(results: Sequence[Result]) -> str:
+    """Combine successful results into a Chemkin THERMO block.
+
+    :param results: Results
+    :return: Chemkin THERMO block
+    """
+    nasa_strs = [r.nasa for r in results if r.ok and r.nasa is not None]
+    return "\n".join(["THERMO", *nasa_strs, "END", ""])
+
+
+def write_status(results: Sequence[Result], status_file: str | Path) -> None:
+    """Write per-species status to a CSV file.
+
+    :param results: Results
+    :param status_file: Path to the status file
+    """
+    with Path(status_file).open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["label", "status", "message"])
+        for res in results:
+            writer.writerow([res.label, "ok" if res.ok else "failed", res.message])
@@ -0,0 +1,150 @@
+"""Content-addressed cache of MESS-PF and PAC99 results."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from .pipeline import Input
+
+MESSPF_FILE = "pf.dat"
+PAC99_FILE = "fit.c97"
+
+
+def default_path() -> Path:
+    """Get the default cache directory.
+
+    :return: `$XDG_CACHE_HOME/mess2nasa`, or `~/.cache/mess2nasa` if unset
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "mess2nasa"
+
+
+class CacheEntry(BaseModel):
+    """Cached MESS-PF and PAC99 output.
+
+    :param pf_str: MESS-PF `.dat` output
+    :param pac_out_str: PAC99 `.c97` output, or `None` for a native fit
+    """
+
+    pf_str: str
+    pac_out_str: str | None = None
+
+
+class Cache(BaseModel):
+    """On-disk result cache with a size cap and LRU eviction.
+
+    Each entry is a directory named by its key, holding the MESS-PF and PAC99 output.
+    Entry modification times record last use, so the least recently used entries are
+    evicted first once the cache grows past `max_size`.
+
+    :param path: Cache directory
+    :param max_size: Maximum total size of cached files, in bytes
+    """
+
+    path: Path = Field(default_factory=default_path)
+    max_size: int = 100 * 1024**2
+
+    def key(self, inp: "Input", mess_inp_str: str, pac_share_path: Path) -> str:
+        """Determine the cache key for a species.
+
+        The key is a hash of the MESS-PF input, the input fields that enter the PAC99
+        input, the fitter, and, for PAC99 fits, the names, sizes, and modification
+        times of the PAC99 share files.
+
+        :param inp: Input
+        :param mess_inp_str: MESS-PF input string
+        :param pac_share_path: PAC99 share directory
+        :return: Key
+        """
+        pac_share_files = (
+            sorted(pac_share_path.iterdir())
+            if inp.fitter == "pac99" and pac_share_path.is_dir()
+            else []
+        )
+        data = {
+            "mess_input": mess_inp_str,
+            "formula": inp.formula,
+            "Hf": inp.Hf,
+            "Tf": inp.Tf,
+            "energy_unit": inp.energy_unit,
+            "fitter": inp.fitter,
+            "pac99": [
+                (f.name, f.stat().st_size, f.stat().st_mtime_ns)
+                for f in pac_share_files
+            ],
+        }
+        data_str = json.dumps(data, sort_keys=True)
+        return hashlib.sha256(data_str.encode()).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Look up a cache entry, marking it as recently used.
+
+        :param key: Key
+        :return: Entry, or `None` if there is no entry for this key
+        """
+        entry_path = self.path / key
+        pac_out_path = entry_path / PAC99_FILE
+        try:
+            entry = CacheEntry(
+                pf_str=(entry_path / MESSPF_FILE).read_text(),
+                pac_out_str=(
+                    pac_out_path.read_text() if pac_out_path.exists() else None
+                ),
+            )
+            entry_path.touch()
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Add an entry to the cache, then evict entries to stay under the size cap.
+
+        The entry is written to a temporary directory and moved into place, so
+        concurrent writers never expose a partial entry.
+
+        :param key: Key
+        :param entry: Entry
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(tempfile.mkdtemp(dir=self.path, prefix=".tmp"))
+        (tmp_path / MESSPF_FILE).write_text(entry.pf_str)
+        if entry.pac_out_str is not None:
+            (tmp_path / PAC99_FILE).write_text(entry.pac_out_str)
+        entry_path = self.path / key
+        shutil.rmtree(entry_path, ignore_errors=True)
+        try:
+            tmp_path.rename(entry_path)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size cap."""
+        entries = []
+        for entry_path in self.path.iterdir():
+            if entry_path.name.startswith("."):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry_path.iterdir())
+                entries.append((entry_path.stat().st_mtime, size, entry_path))
+            except FileNotFoundError:
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        shutil.rmtree(self.path, ignore_errors=True)
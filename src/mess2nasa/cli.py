@@ -1,78 +1,301 @@
-import shutil
-import subprocess
-import sys
+import functools
+import os
+from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Annotated, Literal
 
 import click
-import yaml
-from pydantic import BaseModel, BeforeValidator
 
-import autochem
+from . import aio, instrument
+from . import batch as batch_
+from .cache import Cache, default_path
+from .pipeline import Input, read_input, run
+from .scratch import Scratch, run_directory
 
+__all__ = ["Input", "main", "run_directory"]
 
-class Input(BaseModel):
-    formula: str
-    Hf: float
-    Tf: Annotated[Literal[0, 298], BeforeValidator(round)] = 298
-    energy_unit: str = "kJ"
-    mess_input: str = "pf.inp"
-    nasa_output: str = "fit.nasa"
 
+class DefaultGroup(click.Group):
+    """Command group that falls back to the `run` command.
 
-@click.command()
-@click.argument("input_file", type=click.Path(exists=True), default="input.yaml")
-def main(input_file: str) -> None:
-    # 1. Read input
-    input_data = yaml.safe_load(Path(input_file).read_text())
-    input = Input.model_validate(input_data)
-    formula = input.formula
-    Hf = input.Hf
-    Tf = input.Tf
-    units = {"energy": input.energy_unit}
-    mess_inp_name = Path(input.mess_input)
-    nasa_out_name = Path(input.nasa_output)
-
-    # 2. Create run directory
-    run_path = run_directory()
-
-    # 3. Run MESS-PF and read output
-    mess_inp_path = shutil.copyfile(mess_inp_name, run_path / mess_inp_name)
-    subprocess.run(["messpf", mess_inp_name], cwd=run_path)
-    pf_str = mess_inp_path.with_suffix(".dat").read_text()
-    pf_spc = autochem.therm.from_messpf_output_string(
-        pf_str, formula=formula, Hf=Hf, Tf=Tf, units=units
+    This keeps `mess2nasa [input.yaml]` working alongside the other subcommands.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or args[0] not in [*self.commands, "--help"]:
+            args = ["run", *args]
+        return super().parse_args(ctx, args)
+
+
+def cache_options(func: Callable) -> Callable:
+    """Add result cache options to a command.
+
+    The decorated command receives a `cache` (or `None`) and a `refresh` flag.
+    """
+
+    @click.option(
+        "--cache/--no-cache", "use_cache", default=True, help="Use the result cache."
+    )
+    @click.option(
+        "--refresh", is_flag=True, help="Re-run and overwrite cached results."
+    )
+    @click.option(
+        "--cache-dir",
+        type=click.Path(file_okay=False, path_type=Path),
+        default=default_path,
+        show_default="$XDG_CACHE_HOME/mess2nasa",
+        help="Result cache directory.",
     )
+    @click.option(
+        "--cache-size", type=int, default=100, show_default=True, help="Cache cap (MB)."
+    )
+    @functools.wraps(func)
+    def func_(
+        *args: object,
+        use_cache: bool,
+        cache_dir: Path,
+        cache_size: int,
+        **kwargs: object,
+    ) -> object:
+        cache = Cache(path=cache_dir, max_size=cache_size * 1024**2)
+        return func(*args, cache=cache if use_cache else None, **kwargs)
+
+    return func_
 
-    # 4. Run PAC99 and read output (requires copying data files from share/ directory)
-    pac_inp_path = run_path / nasa_out_name.with_suffix(".i97")
-    pac_inp_path.write_text(autochem.therm.pac99_input_string(pf_spc))
-    pac_share_path = Path(sys.prefix) / "share" / "pac99"
-    for pac_share_file in pac_share_path.iterdir():
-        shutil.copyfile(pac_share_file, run_path / pac_share_file.name)
-    subprocess.run(
-        ["pac99"],
-        input=pac_inp_path.stem.encode(),
-        stdout=pac_inp_path.with_suffix(".log").open("w"),
-        stderr=pac_inp_path.with_suffix(".err").open("w"),
-        cwd=run_path,
+
+def scratch_options(func: Callable) -> Callable:
+    """Add run directory staging options to a command.
+
+    The decorated command receives a `scratch` staging and cleanup policy.
+    """
+
+    @click.option(
+        "--scratch-dir",
+        type=click.Path(file_okay=False, path_type=Path),
+        default=None,
+        help="Stage runs here (e.g. $TMPDIR or /dev/shm), copying back outputs and logs.",
+    )
+    @click.option(
+        "--link",
+        type=click.Choice(["symlink", "hardlink", "copy"]),
+        default="symlink",
+        show_default=True,
+        help="How PAC99 share files are staged.",
+    )
+    @click.option(
+        "--keep",
+        type=click.Choice(["all", "failed", "none"]),
+        default="all",
+        show_default=True,
+        help="Which run directories to keep.",
     )
-    pac_out_str = pac_inp_path.with_suffix(".c97").read_text()
-    fit_spc = autochem.therm.from_pac99_output_string(pac_out_str)
+    @functools.wraps(func)
+    def func_(
+        *args: object,
+        scratch_dir: Path | None,
+        link: str,
+        keep: str,
+        **kwargs: object,
+    ) -> object:
+        scratch = Scratch(root=scratch_dir, link=link, keep=keep)
+        return func(*args, scratch=scratch, **kwargs)
+
+    return func_
+
+
+fitter_option = click.option(
+    "--fitter",
+    type=click.Choice(["pac99", "native"]),
+    default=None,
+    help="Override the fitter set in the input.",
+)
+
 
-    # 5. Write NASA fit in Chemkin format
-    nasa_str = autochem.therm.chemkin_string(fit_spc)
-    nasa_out_name.write_text(nasa_str)
+profile_option = click.option(
+    "--profile",
+    "profile_file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write per-stage timings and resource use as JSON lines, and summarize them.",
+)
+
+
+def write_profile(
+    records: Sequence[instrument.StageRecord], profile_file: str | Path
+) -> None:
+    """Write stage records as JSON lines and print a summary table to stderr.
+
+    :param records: Stage records
+    :param profile_file: Path to the JSON-lines file
+    """
+    with open(profile_file, "w") as file:
+        file.writelines(record.model_dump_json() + "\n" for record in records)
+    click.echo(instrument.summary_table(records), err=True)
+
+
+@click.group(cls=DefaultGroup)
+def main() -> None:
+    """Generate NASA polynomial fits using MESS-PF and PAC99."""
+
+
+@main.command("run")
+@click.argument("input_file", type=click.Path(exists=True), default="input.yaml")
+@fitter_option
+@profile_option
+@cache_options
+@scratch_options
+def run_(
+    input_file: str,
+    fitter: str | None,
+    profile_file: str | None,
+    cache: Cache | None,
+    scratch: Scratch,
+    *,
+    refresh: bool,
+) -> None:
+    """Fit a single species described by INPUT_FILE."""
+    inp = read_input(input_file)
+    if fitter is not None:
+        inp = inp.model_copy(update={"fitter": fitter})
+    with instrument.labeled(input_file), instrument.recording() as records:
+        nasa_str = run(inp, cache=cache, scratch=scratch, refresh=refresh)
     print(nasa_str)
+    if profile_file is not None:
+        write_profile(records, profile_file)
+
 
+@main.command()
+@click.argument("manifest", type=click.Path(exists=True))
+@click.option(
+    "-n", "--nprocs", type=int, default=os.cpu_count(), help="Number of processes."
+)
+@click.option(
+    "-o", "--output", default="thermo.dat", help="Combined Chemkin THERMO block."
+)
+@click.option("-s", "--status", default="status.csv", help="Per-species status table.")
+@click.option(
+    "--async",
+    "use_async",
+    is_flag=True,
+    help="Overlap external programs with asyncio instead of using a process pool.",
+)
+@click.option(
+    "--timeout", type=float, default=None, help="External program time limit (s)."
+)
+@fitter_option
+@profile_option
+@cache_options
+@scratch_options
+def batch(  # noqa: PLR0913
+    manifest: str,
+    nprocs: int,
+    output: str,
+    status: str,
+    timeout: float | None,
+    fitter: str | None,
+    profile_file: str | None,
+    cache: Cache | None,
+    scratch: Scratch,
+    *,
+    use_async: bool,
+    refresh: bool,
+) -> None:
+    """Fit many species listed in MANIFEST.
 
-def run_directory(path: str = ".", base_name: str = "run") -> Path:
-    """Create a new run directory."""
-    base_path = Path(path) / base_name
-    run_paths = [base_path.with_name(f"{base_name}_{i:02d}") for i in range(100)]
-    run_path = next(p for p in run_paths if not p.exists())
-    run_path.mkdir()
-    return run_path
+    MANIFEST is either a directory of YAML inputs or a YAML file with a list of input
+    records.
+
+    With --async, up to NPROCS runs of each external program are run at once, from a
+    single process, so that e.g. MESS-PF for one species overlaps with PAC99 for
+    another.
+    """
+    jobs = batch_.read_manifest(manifest)
+    if fitter is not None:
+        for job in jobs:
+            job.inp = job.inp.model_copy(update={"fitter": fitter})
+    count = len(jobs)
+    done = 0
+
+    def report(res: batch_.Result) -> None:
+        nonlocal done
+        done += 1
+        state = "ok" if res.ok else f"failed ({res.message})"
+        click.echo(f"[{done}/{count}] {res.label}: {state}")
+
+    if use_async:
+        limits = aio.Limits(
+            messpf_slots=nprocs,
+            pac99_slots=nprocs,
+            messpf_timeout=timeout,
+            pac99_timeout=timeout,
+        )
+        results = aio.run_batch(
+            jobs,
+            limits=limits,
+            callback=report,
+            cache=cache,
+            scratch=scratch,
+            refresh=refresh,
+            profile=profile_file is not None,
+        )
+    else:
+        results = batch_.run_batch(
+            jobs,
+            nprocs=nprocs,
+            callback=report,
+            cache=cache,
+            scratch=scratch,
+            refresh=refresh,
+            profile=profile_file is not None,
+            timeout=timeout,
+        )
+    with open(output, "w") as file:
+        file.write(batch_.thermo_block(results))
+    batch_.write_status(results, status)
+    if profile_file is not None:
+        write_profile([rec for res in results for rec in res.profile], profile_file)
+
+    nfailed = sum(not r.ok for r in results)
+    click.echo(f"Wrote {count - nfailed} of {count} species to {output}")
+    if nfailed:
+        raise SystemExit(1)
+
+
+@main.command("serve")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Listen on this Unix socket instead of stdin.",
+)
+@click.option(
+    "-n", "--nprocs", type=int, default=os.cpu_count(), help="Number of processes."
+)
+@cache_options
+@scratch_options
+def serve_(
+    socket_path: Path | None,
+    nprocs: int,
+    cache: Cache | None,
+    scratch: Scratch,
+    *,
+    refresh: bool,
+) -> None:
+    """Fit species sent as JSON lines, keeping warm worker processes.
+
+    Each request is a JSON object with the fields of an input file, plus an optional
+    `id` and either the MESS-PF input text as `mess_input_text` or a working directory
+    `path`. Each result is written back as a JSON line as soon as it is available.
+    """
+    from .serve import serve
+
+    serve(
+        socket_path=socket_path,
+        nprocs=nprocs,
+        cache=cache,
+        scratch=scratch,
+        refresh=refresh,
+    )
 
 
 if __name__ == "__main__":
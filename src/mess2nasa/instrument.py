@@ -0,0 +1,189 @@
+"""Per-stage timing and resource instrumentation of the pipeline."""
+
+import contextlib
+import contextvars
+import resource
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+
+from pydantic import BaseModel
+
+# Size of the blocks counted by getrusage, in bytes
+BLOCK_SIZE = 512
+# Unit of the maximum resident set size reported by getrusage, in bytes
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+class StageRecord(BaseModel):
+    """Resources used by one stage of the pipeline.
+
+    CPU times and block I/O are differences in `getrusage` totals over the stage, for
+    this process and for its waited-for children, so they are only attributed exactly
+    to a stage when stages do not overlap (i.e. not with `batch --async`).
+
+    :param label: Label of the species, if run as part of a job
+    :param stage: Stage name
+    :param start: Start time, in seconds since the epoch
+    :param wall: Wall time, in seconds
+    :param cpu: CPU time of this process, in seconds
+    :param child_cpu: CPU time of child processes, in seconds
+    :param child_max_rss: Largest resident set size of any child process so far, in
+        bytes
+    :param read_bytes: Bytes read from disk, by this process and its children
+    :param write_bytes: Bytes written to disk, by this process and its children
+    """
+
+    label: str | None = None
+    stage: str
+    start: float
+    wall: float
+    cpu: float
+    child_cpu: float
+    child_max_rss: int
+    read_bytes: int
+    write_bytes: int
+
+
+Collector = Callable[[StageRecord], None]
+
+COLLECTORS: list[Collector] = []
+
+_label: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "label", default=None
+)
+_records: contextvars.ContextVar[list[StageRecord] | None] = contextvars.ContextVar(
+    "records", default=None
+)
+
+
+def add_collector(collector: Collector) -> None:
+    """Call a function with the record of each stage run in this process.
+
+    :param collector: Function called with each stage record
+    """
+    COLLECTORS.append(collector)
+
+
+def remove_collector(collector: Collector) -> None:
+    """Stop calling a function added with `add_collector`.
+
+    :param collector: Function called with each stage record
+    """
+    COLLECTORS.remove(collector)
+
+
+@contextlib.contextmanager
+def labeled(label: str | None) -> Iterator[None]:
+    """Label the stages run in this context, e.g. by species.
+
+    :param label: Label
+    """
+    token = _label.set(label)
+    try:
+        yield
+    finally:
+        _label.reset(token)
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[list[StageRecord]]:
+    """Collect the records of the stages run in this context.
+
+    Unlike collectors, this works in worker processes, whose records can be sent back
+    with their results.
+
+    :yield: Stage records, appended to as each stage finishes
+    """
+    records: list[StageRecord] = []
+    token = _records.set(records)
+    try:
+        yield records
+    finally:
+        _records.reset(token)
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Record the resources used by a stage, if anything is collecting them.
+
+    :param name: Stage name
+    """
+    records = _records.get()
+    if records is None and not COLLECTORS:
+        yield
+        return
+
+    start = time.time()
+    wall0 = time.perf_counter()
+    self0 = resource.getrusage(resource.RUSAGE_SELF)
+    child0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall0
+        self1 = resource.getrusage(resource.RUSAGE_SELF)
+        child1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        usages = ((self0, self1), (child0, child1))
+        record = StageRecord(
+            label=_label.get(),
+            stage=name,
+            start=start,
+            wall=wall,
+            cpu=cpu_time(self1) - cpu_time(self0),
+            child_cpu=cpu_time(child1) - cpu_time(child0),
+            child_max_rss=child1.ru_maxrss * RSS_UNIT,
+            read_bytes=sum(u1.ru_inblock - u0.ru_inblock for u0, u1 in usages)
+            * BLOCK_SIZE,
+            write_bytes=sum(u1.ru_oublock - u0.ru_oublock for u0, u1 in usages)
+            * BLOCK_SIZE,
+        )
+        if records is not None:
+            records.append(record)
+        for collector in COLLECTORS:
+            collector(record)
+
+
+def cpu_time(usage: resource.struct_rusage) -> float:
+    """Get the total CPU time of a resource usage.
+
+    :param usage: Resource usage
+    :return: User plus system CPU time, in seconds
+    """
+    return usage.ru_utime + usage.ru_stime
+
+
+def summary_table(records: Sequence[StageRecord]) -> str:
+    """Summarize stage records by stage, in order of first appearance.
+
+    :param records: Stage records
+    :return: Table of counts, total wall and CPU times, largest child RSS, and I/O
+    """
+    stages: dict[str, list[StageRecord]] = {}
+    for record in records:
+        stages.setdefault(record.stage, []).append(record)
+
+    header = ("stage", "count", "wall/s", "cpu/s", "child cpu/s", "max rss/MB", "io/MB")
+    rows = [header]
+    for name, recs in stages.items():
+        io = sum(r.read_bytes + r.write_bytes for r in recs)
+        rows.append(
+            (
+                name,
+                str(len(recs)),
+                f"{sum(r.wall for r in recs):.3f}",
+                f"{sum(r.cpu for r in recs):.3f}",
+                f"{sum(r.child_cpu for r in recs):.3f}",
+                f"{max(r.child_max_rss for r in recs) / 1024**2:.1f}",
+                f"{io / 1024**2:.1f}",
+            )
+        )
+
+    widths = [max(map(len, col)) for col in zip(*rows, strict=True)]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in rows
+    )
@@ -0,0 +1,344 @@
+"""MESS-PF -> PAC99 -> Chemkin pipeline for a single species."""
+
+import contextlib
+import shutil
+import subprocess
+import sys
+from collections.abc import Generator, Sequence
+from pathlib import Path
+from typing import Annotated, Literal
+
+import yaml
+from pydantic import BaseModel, BeforeValidator
+
+import autochem
+
+from .cache import Cache, CacheEntry
+from .instrument import stage
+from .scratch import Link, Scratch, stage_file
+
+
+class Input(BaseModel):
+    formula: str
+    Hf: float
+    Tf: Annotated[Literal[0, 298], BeforeValidator(round)] = 298
+    energy_unit: str = "kJ"
+    mess_input: str = "pf.inp"
+    nasa_output: str = "fit.nasa"
+    fitter: Literal["pac99", "native"] = "pac99"
+
+
+def read_input(input_file: str | Path) -> Input:
+    """Read a YAML input file.
+
+    :param input_file: Path to the YAML input file
+    :return: Input
+    """
+    input_data = yaml.safe_load(Path(input_file).read_text())
+    return Input.model_validate(input_data)
+
+
+class Program(BaseModel):
+    """An external program run by the pipeline.
+
+    :param name: Program name, which is also the name of its stage
+    :param args: Program and arguments
+    :param cwd: Working directory
+    :param input_: Standard input
+    :param log_path: Path for standard output, with standard error going to the same
+        path with an `.err` suffix (discarded if `None`)
+    """
+
+    name: Literal["messpf", "pac99"]
+    args: list[str]
+    cwd: Path
+    input_: bytes | None = None
+    log_path: Path | None = None
+
+
+Steps = Generator[Program, None, str]
+
+
+def run(
+    inp: Input,
+    path: str | Path = ".",
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+    timeout: float | None = None,
+) -> str:
+    """Run MESS-PF and PAC99 for one species and write its NASA fit.
+
+    If the input sets `fitter: native`, the MESS-PF data is fit in-process instead of
+    by PAC99.
+
+    Relative paths in the input are interpreted relative to `path`, which is also where
+    the run directory is created, unless it is staged on scratch storage.
+
+    :param inp: Input
+    :param path: Working directory
+    :param cache: Result cache; if given, the executables are only run on a miss
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite the cache entry on a hit
+    :param timeout: Time limit for each external program, in seconds (no limit if
+        `None`)
+    :return: Chemkin-formatted NASA polynomial
+    """
+    steps_ = steps(inp, path=path, cache=cache, scratch=scratch, refresh=refresh)
+    with contextlib.closing(steps_):
+        step = resume(steps_)
+        while isinstance(step, Program):
+            try:
+                with stage(step.name):
+                    run_process(
+                        step.args,
+                        step.cwd,
+                        timeout=timeout,
+                        input_=step.input_,
+                        log_path=step.log_path,
+                    )
+            except Exception as err:  # noqa: BLE001
+                step = resume(steps_, err)
+            else:
+                step = resume(steps_)
+    return step
+
+
+def steps(
+    inp: Input,
+    path: str | Path = ".",
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+) -> Steps:
+    """Run the pipeline for one species, yielding each external program to the caller.
+
+    The caller runs each program before resuming the steps, or throws its error into
+    them. This way, `run` and `aio.run` share the caching, run directory, and fitting
+    steps, and only differ in how they run the programs.
+
+    :param inp: Input
+    :param path: Working directory
+    :param cache: Result cache; if given, the executables are only run on a miss
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite the cache entry on a hit
+    :yield: External program to run
+    :return: Chemkin-formatted NASA polynomial
+    """
+    path = Path(path)
+    mess_inp_name = path / inp.mess_input
+    nasa_out_name = path / inp.nasa_output
+    pac_share_path = Path(sys.prefix) / "share" / "pac99"
+    scratch = scratch or Scratch()
+
+    # 1. Look up cached output
+    key = entry = None
+    if cache is not None:
+        with stage("cache_get"):
+            key = cache.key(inp, mess_inp_name.read_text(), pac_share_path)
+            entry = None if refresh else cache.get(key)
+
+    if entry is None:
+        # 2. Create run directory
+        with scratch.run_directory(path) as run_path:
+            # 3. Run MESS-PF
+            pf_str = yield from run_messpf(mess_inp_name, run_path)
+
+            # 4. Run PAC99, unless fitting natively
+            pac_out_str = None
+            if inp.fitter == "pac99":
+                pf_spc = read_messpf_output(pf_str, inp)
+                pac_inp_name = Path(nasa_out_name.name).with_suffix(".i97")
+                pac_out_str = yield from run_pac99(
+                    pf_spc, pac_inp_name, run_path, pac_share_path, link=scratch.link
+                )
+
+        entry = CacheEntry(pf_str=pf_str, pac_out_str=pac_out_str)
+        if cache is not None:
+            with stage("cache_put"):
+                cache.put(key, entry)
+
+    # 5. Read the PAC99 fit or fit natively, and write it
+    return write_fit(entry, inp, nasa_out_name)
+
+
+def resume(steps: Steps, err: Exception | None = None) -> Program | str:
+    """Resume pipeline steps until the next external program, or until they finish.
+
+    :param steps: Pipeline steps
+    :param err: Error running the last program, which is raised in the steps
+    :return: Next program to run, or the Chemkin-formatted NASA polynomial once done
+    """
+    try:
+        return next(steps) if err is None else steps.throw(err)
+    except StopIteration as stop:
+        return stop.value
+
+
+def write_fit(entry: CacheEntry, inp: Input, nasa_out_name: Path) -> str:
+    """Read the PAC99 fit or fit natively, then write the NASA fit in Chemkin format.
+
+    :param entry: MESS-PF and PAC99 output
+    :param inp: Input
+    :param nasa_out_name: Path to the NASA output file
+    :return: Chemkin-formatted NASA polynomial
+    """
+    if entry.pac_out_str is not None:
+        with stage("read_pac99"):
+            fit_spc = autochem.therm.from_pac99_output_string(entry.pac_out_str)
+    else:
+        pf_spc = read_messpf_output(entry.pf_str, inp)
+        with stage("native_fit"):
+            fit_spc = native_fit(pf_spc)
+
+    with stage("write_fit"):
+        nasa_str = autochem.therm.chemkin_string(fit_spc)
+        nasa_out_name.write_text(nasa_str)
+    return nasa_str
+
+
+def read_messpf_output(pf_str: str, inp: Input) -> "autochem.therm.Species":
+    """Read species thermo data from MESS-PF output.
+
+    :param pf_str: MESS-PF `.dat` output string
+    :param inp: Input
+    :return: Species thermo data
+    """
+    with stage("read_messpf"):
+        return autochem.therm.from_messpf_output_string(
+            pf_str,
+            formula=inp.formula,
+            Hf=inp.Hf,
+            Tf=inp.Tf,
+            units={"energy": inp.energy_unit},
+        )
+
+
+def native_fit(pf_spc: "autochem.therm.Species") -> "autochem.therm.Species":
+    """Fit species thermo data to a NASA-7 polynomial without PAC99.
+
+    The fit covers the temperature range of the MESS-PF data, split at 1000 K, with Cp,
+    S, and H constrained to be continuous there.
+
+    :param pf_spc: Species thermo data from MESS-PF
+    :return: Species thermo fit
+    """
+    return autochem.therm.fit(pf_spc, continuous=True)
+
+
+def run_messpf(mess_inp_name: Path, run_path: Path) -> Generator[Program, None, str]:
+    """Run MESS-PF in the run directory.
+
+    :param mess_inp_name: Path to the MESS-PF input file, which is copied over
+    :param run_path: Run directory
+    :yield: MESS-PF program
+    :return: MESS-PF `.dat` output string
+    """
+    with stage("copy_input"):
+        mess_inp_path = Path(
+            shutil.copyfile(mess_inp_name, run_path / mess_inp_name.name)
+        )
+    yield Program(name="messpf", args=["messpf", mess_inp_path.name], cwd=run_path)
+    return mess_inp_path.with_suffix(".dat").read_text()
+
+
+def run_pac99(
+    pf_spc: "autochem.therm.Species",
+    pac_inp_name: Path,
+    run_path: Path,
+    pac_share_path: Path,
+    link: Link = "copy",
+) -> Generator[Program, None, str]:
+    """Run PAC99 in the run directory.
+
+    PAC99 requires its data files from the share/ directory, which are staged there.
+
+    :param pf_spc: Species thermo data from MESS-PF
+    :param pac_inp_name: Name of the PAC99 `.i97` input file
+    :param run_path: Run directory
+    :param pac_share_path: PAC99 share directory
+    :param link: Whether to symlink, hard-link, or copy the share files
+    :yield: PAC99 program
+    :return: PAC99 `.c97` output string
+    """
+    pac_inp_path = prepare_pac99(
+        pf_spc, pac_inp_name, run_path, pac_share_path, link=link
+    )
+    yield Program(
+        name="pac99",
+        args=["pac99"],
+        cwd=run_path,
+        input_=pac_inp_path.stem.encode(),
+        log_path=pac_inp_path.with_suffix(".log"),
+    )
+    return pac_inp_path.with_suffix(".c97").read_text()
+
+
+def prepare_pac99(
+    pf_spc: "autochem.therm.Species",
+    pac_inp_name: Path,
+    run_path: Path,
+    pac_share_path: Path,
+    link: Link = "copy",
+) -> Path:
+    """Write the PAC99 input and stage its data files in the run directory.
+
+    :param pf_spc: Species thermo data from MESS-PF
+    :param pac_inp_name: Name of the PAC99 `.i97` input file
+    :param run_path: Run directory
+    :param pac_share_path: PAC99 share directory
+    :param link: Whether to symlink, hard-link, or copy the share files
+    :return: Path to the PAC99 input file
+    """
+    pac_inp_path = run_path / pac_inp_name
+    with stage("write_pac99_input"):
+        pac_inp_path.write_text(autochem.therm.pac99_input_string(pf_spc))
+    with stage("stage_pac99_share"):
+        for pac_share_file in pac_share_path.iterdir():
+            stage_file(pac_share_file, run_path / pac_share_file.name, link=link)
+    return pac_inp_path
+
+
+def run_process(
+    args: Sequence[str],
+    cwd: Path,
+    timeout: float | None = None,
+    input_: bytes | None = None,
+    log_path: Path | None = None,
+) -> None:
+    """Run an external program, killing it if it times out.
+
+    Errors are raised as by `aio.run_process`, so that a species fails with the same
+    message in either batch mode.
+
+    :param args: Program and arguments
+    :param cwd: Working directory
+    :param timeout: Time limit, in seconds (no limit if `None`)
+    :param input_: Standard input
+    :param log_path: Path for standard output, with standard error going to the same
+        path with an `.err` suffix (discarded if `None`)
+    :raises TimeoutError: If the program times out
+    :raises subprocess.CalledProcessError: If the program fails
+    """
+    with contextlib.ExitStack() as stack:
+        stdout = stderr = subprocess.DEVNULL
+        if log_path is not None:
+            stdout = stack.enter_context(log_path.open("w"))
+            stderr = stack.enter_context(log_path.with_suffix(".err").open("w"))
+
+        try:
+            subprocess.run(
+                args,
+                input=input_,
+                stdin=subprocess.DEVNULL if input_ is None else None,
+                stdout=stdout,
+                stderr=stderr,
+                cwd=cwd,
+                timeout=timeout,
+                check=True,
+            )
+        except subprocess.TimeoutExpired:
+            msg = f"{args[0]} timed out after {timeout} s"
+            raise TimeoutError(msg) from None
@@ -0,0 +1,94 @@
+"""Staging of run directories, on scratch storage if requested."""
+
+import contextlib
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+from .instrument import stage
+
+# Suffixes of the files copied back from a scratch run directory that is kept
+KEEP_SUFFIXES = (".c97", ".log", ".err")
+
+Link = Literal["symlink", "hardlink", "copy"]
+Keep = Literal["all", "failed", "none"]
+
+
+class Scratch(BaseModel):
+    """Where run directories are staged, and which of them are kept.
+
+    If `root` is set, each run is staged in a uniquely named directory under it, such
+    as a tmpfs or node-local `$TMPDIR`, instead of the working directory. Scratch
+    directories are always removed afterwards; for the runs that are kept, only the
+    PAC99 output and logs are first copied back to a run directory in the working
+    directory.
+
+    :param root: Scratch directory (default: the working directory)
+    :param link: How the PAC99 share files are staged
+    :param keep: Which run directories to keep: all, those of failed runs, or none
+    """
+
+    root: Path | None = None
+    link: Link = "symlink"
+    keep: Keep = "all"
+
+    @contextlib.contextmanager
+    def run_directory(self, path: str | Path = ".") -> Iterator[Path]:
+        """Stage a run directory for the duration of a run.
+
+        :param path: Working directory
+        :yield: Run directory
+        """
+        path = Path(path)
+        run_path = run_directory(path if self.root is None else self.root)
+        ok = False
+        try:
+            yield run_path
+            ok = True
+        finally:
+            keep = self.keep == "all" or (self.keep == "failed" and not ok)
+            with stage("clean_up"):
+                if self.root is not None and keep:
+                    keep_path = run_directory(path)
+                    for file in run_path.iterdir():
+                        if file.suffix in KEEP_SUFFIXES:
+                            shutil.copyfile(file, keep_path / file.name)
+                if self.root is not None or not keep:
+                    shutil.rmtree(run_path, ignore_errors=True)
+
+
+def run_directory(path: str | Path = ".", base_name: str = "run") -> Path:
+    """Create a new, uniquely named run directory.
+
+    Safe to call concurrently, and takes a single attempt in the common case, without
+    scanning the directory for names already in use.
+
+    :param path: Parent directory
+    :param base_name: Prefix of the directory name
+    :return: Run directory
+    """
+    return Path(tempfile.mkdtemp(prefix=f"{base_name}_", dir=path))
+
+
+def stage_file(src_path: Path, dest_path: Path, link: Link = "copy") -> None:
+    """Stage a read-only data file in a run directory.
+
+    Falls back to a copy if the file cannot be linked, e.g. a hard link across
+    filesystems.
+
+    :param src_path: Source file
+    :param dest_path: Destination in the run directory
+    :param link: Whether to symlink, hard-link, or copy the file
+    """
+    with contextlib.suppress(OSError):
+        if link == "symlink":
+            dest_path.symlink_to(src_path.resolve())
+            return
+        if link == "hardlink":
+            dest_path.hardlink_to(src_path)
+            return
+    shutil.copyfile(src_path, dest_path)
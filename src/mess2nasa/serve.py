@@ -0,0 +1,287 @@
+"""Long-lived server that fits species sent as JSON lines."""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import signal
+import stat
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .batch import Job, Result, run_job
+from .cache import Cache
+from .pipeline import Input
+from .scratch import Scratch
+
+# Longest request line accepted on a socket, in bytes
+LINE_LIMIT = 16 * 1024**2
+
+
+class Request(Input):
+    """One species sent to the server.
+
+    The MESS-PF input is either sent inline as `mess_input_text`, in which case the
+    species is run in a temporary directory, or read from `mess_input` relative to
+    `path`, as for the `run` command.
+
+    :param id: Identifier echoed back as the label of the result
+    :param path: Working directory, against which input paths are resolved
+    :param mess_input_text: MESS-PF input file contents
+    """
+
+    id: str | int | None = None
+    path: Path = Path()
+    mess_input_text: str | None = None
+
+
+def warm_up() -> None:
+    """Load the thermo code in a worker, so the first request doesn't pay for it."""
+    import autochem.therm  # noqa: F401
+
+
+def run_request(
+    req: Request,
+    label: str,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+) -> Result:
+    """Run one request, capturing any error in the result.
+
+    :param req: Request
+    :param label: Result label
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :return: Result
+    """
+    inp = Input.model_validate(req.model_dump(include=set(Input.model_fields)))
+    if req.mess_input_text is None:
+        job = Job(label=label, inp=inp, path=req.path)
+        return run_job(job, cache=cache, scratch=scratch, refresh=refresh)
+
+    # Write inline input to a scratch directory, ignoring any directories in the names
+    inp = inp.model_copy(
+        update={
+            "mess_input": Path(inp.mess_input).name,
+            "nasa_output": Path(inp.nasa_output).name,
+        }
+    )
+    with tempfile.TemporaryDirectory(prefix="mess2nasa-") as tmp_dir:
+        (Path(tmp_dir) / inp.mess_input).write_text(req.mess_input_text)
+        job = Job(label=label, inp=inp, path=Path(tmp_dir))
+        return run_job(job, cache=cache, scratch=scratch, refresh=refresh)
+
+
+class Server:
+    """Dispatch JSON-lines requests to a pool of warm worker processes.
+
+    Each line read is a JSON-encoded `Request`, and each line written is the
+    JSON-encoded `Result`, in order of completion. Results are labeled by request `id`,
+    or by line number if no `id` was given. Malformed requests are reported as failed
+    results instead of stopping the server.
+
+    If a worker process dies, the pool is broken and its pending requests fail. The
+    pool is then replaced by `make_executor`, if given; otherwise, later requests fail
+    as well.
+
+    :param executor: Worker pool
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    :param make_executor: Function creating a replacement for a broken worker pool
+    """
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor,
+        cache: Cache | None = None,
+        scratch: Scratch | None = None,
+        *,
+        refresh: bool = False,
+        make_executor: Callable[[], concurrent.futures.Executor] | None = None,
+    ) -> None:
+        """Initialize server."""
+        self.executor = executor
+        self.make_executor = make_executor
+        self.run_request = functools.partial(
+            run_request, cache=cache, scratch=scratch, refresh=refresh
+        )
+
+    async def handle(
+        self,
+        line: bytes,
+        label: str,
+        write: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """Handle one request line.
+
+        :param line: Request line
+        :param label: Default result label
+        :param write: Function writing a response line
+        """
+        try:
+            req = Request.model_validate_json(line)
+        except ValidationError as err:
+            res = Result(label=label, ok=False, message=f"Invalid request: {err}")
+        else:
+            label = label if req.id is None else str(req.id)
+            res = await self.submit(req, label)
+        await write(res.model_dump_json().encode() + b"\n")
+
+    async def submit(self, req: Request, label: str) -> Result:
+        """Run one request on the worker pool, capturing any error in the result.
+
+        :param req: Request
+        :param label: Result label
+        :return: Result
+        """
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, self.run_request, req, label)
+        except Exception as err:  # noqa: BLE001
+            # Requests running on the same pool break together, so replace it once
+            broken = isinstance(err, concurrent.futures.BrokenExecutor)
+            if broken and self.make_executor is not None and executor is self.executor:
+                executor.shutdown(wait=False)
+                self.executor = self.make_executor()
+            message = f"{type(err).__name__}: {err}"
+            return Result(label=label, ok=False, message=message)
+
+    async def serve_stream(
+        self,
+        readline: Callable[[], Awaitable[bytes]],
+        write: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """Serve requests from a stream until it is closed.
+
+        A line too long for `readline` to return, which it signals by raising
+        `ValueError`, is reported as a failed result.
+
+        :param readline: Function reading a request line, or `b""` once closed
+        :param write: Function writing a response line
+        """
+        tasks = set()
+        count = 0
+        while True:
+            count += 1
+            try:
+                line = await readline()
+            except ValueError as err:
+                res = Result(
+                    label=f"line {count}", ok=False, message=f"Invalid request: {err}"
+                )
+                await write(res.model_dump_json().encode() + b"\n")
+                continue
+
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self.handle(line, f"line {count}", write))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+
+    async def serve_stdio(self) -> None:
+        """Serve requests from stdin, writing results to stdout."""
+
+        async def readline() -> bytes:
+            # Read in a thread, since stdin may be a file or terminal rather than a pipe
+            return await asyncio.to_thread(sys.stdin.buffer.readline)
+
+        async def write(data: bytes) -> None:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+
+        await self.serve_stream(readline, write)
+
+    async def serve_socket(self, socket_path: Path) -> None:
+        """Serve requests from each client connecting to a Unix socket.
+
+        :param socket_path: Socket path; a stale socket left here is replaced
+        """
+        with contextlib.suppress(FileNotFoundError):
+            if stat.S_ISSOCK(socket_path.stat().st_mode):
+                socket_path.unlink()
+
+        async def serve_client(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            lock = asyncio.Lock()
+
+            async def write(data: bytes) -> None:
+                async with lock:
+                    writer.write(data)
+                    await writer.drain()
+
+            try:
+                await self.serve_stream(reader.readline, write)
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(
+            serve_client, path=socket_path, limit=LINE_LIMIT
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+async def run_until_signal(coro: Awaitable[None]) -> None:
+    """Run a coroutine until it finishes or the process is interrupted or terminated.
+
+    :param coro: Coroutine
+    """
+    task = asyncio.ensure_future(coro)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def serve(
+    socket_path: Path | None = None,
+    nprocs: int | None = None,
+    cache: Cache | None = None,
+    scratch: Scratch | None = None,
+    *,
+    refresh: bool = False,
+) -> None:
+    """Serve requests until stdin is closed or the server is interrupted or terminated.
+
+    :param socket_path: Unix socket to listen on; if `None`, serve stdin/stdout
+    :param nprocs: Number of worker processes (default: number of CPUs)
+    :param cache: Result cache
+    :param scratch: Run directory staging and cleanup policy
+    :param refresh: Whether to re-run and overwrite cache entries on a hit
+    """
+    make_executor = functools.partial(
+        concurrent.futures.ProcessPoolExecutor, max_workers=nprocs, initializer=warm_up
+    )
+    server = Server(
+        make_executor(),
+        cache=cache,
+        scratch=scratch,
+        refresh=refresh,
+        make_executor=make_executor,
+    )
+    coro = (
+        server.serve_stdio()
+        if socket_path is None
+        else server.serve_socket(socket_path)
+    )
+    try:
+        asyncio.run(run_until_signal(coro))
+    finally:
+        server.executor.shutdown()
@@ -0,0 +1,67 @@
+"""Test mess2nasa.aio."""
+
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from mess2nasa import aio
+from mess2nasa.batch import Job, Result
+from mess2nasa.cache import Cache, CacheEntry
+from mess2nasa.pipeline import Input
+
+EXAMPLE_PATH = Path(__file__).parents[3] / "examples" / "NHNOH"
+
+
+def test__run_process(tmp_path):
+    log_path = tmp_path / "cat.log"
+    asyncio.run(aio.run_process(["cat"], tmp_path, input_=b"input", log_path=log_path))
+    assert log_path.read_text() == "input"
+    assert log_path.with_suffix(".err").read_text() == ""
+
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(aio.run_process(["false"], tmp_path))
+
+
+def test__run_process__timeout(tmp_path):
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError, match="sleep timed out"):
+        asyncio.run(aio.run_process(["sleep", "10"], tmp_path, timeout=0.05))
+    assert time.perf_counter() - start < 5
+
+
+def test__run_job(tmp_path):
+    async def run_job(job: Job, cache: Cache | None = None) -> Result:
+        stages = aio.Stages(aio.Limits(messpf_slots=1, pac99_slots=1))
+        return await aio.run_job(job, stages, cache=cache, profile=True)
+
+    # Errors are captured in the result
+    inp = Input(formula="NHNOH", Hf=88.5, Tf=0, fitter="native")
+    job = Job(label="NHNOH", inp=inp, path=tmp_path)
+    res = asyncio.run(run_job(job))
+    assert not res.ok
+    assert res.message.startswith("FileNotFoundError")
+    assert res.nasa is None
+
+    (tmp_path / "pf.inp").write_text((EXAMPLE_PATH / "pf.inp").read_text())
+    cache = Cache(path=tmp_path / "cache")
+    key = cache.key(inp, (tmp_path / "pf.inp").read_text(), Path())
+    cache.put(key, CacheEntry(pf_str=(EXAMPLE_PATH / "pf.dat").read_text()))
+    res = asyncio.run(run_job(job, cache=cache))
+    assert res.ok, res.message
+    assert res.nasa == (tmp_path / "fit.nasa").read_text()
+    assert {r.label for r in res.profile} == {"NHNOH"}
+
+
+def test__run_batch(tmp_path):
+    jobs = [
+        Job(label=str(i), inp=Input(formula="H2O", Hf=-241.8), path=tmp_path)
+        for i in range(3)
+    ]
+    labels = []
+    results = aio.run_batch(jobs, callback=lambda r: labels.append(r.label))
+    assert [r.label for r in results] == ["0", "1", "2"]
+    assert sorted(labels) == ["0", "1", "2"]
+    assert not any(r.ok for r in results)
@@ -0,0 +1,169 @@
+"""Test mess2nasa.batch."""
+
+import csv
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from mess2nasa import batch
+from mess2nasa.cache import Cache, CacheEntry
+from mess2nasa.pipeline import Input
+
+EXAMPLE_PATH = Path(__file__).parents[3] / "examples" / "NHNOH"
+
+INPUT_YAML = """
+formula: H2O
+Hf: -241.8
+"""
+
+
+def test__read_manifest__directory(tmp_path):
+    (tmp_path / "H2O.yaml").write_text(INPUT_YAML)
+    (tmp_path / "OH").mkdir()
+    (tmp_path / "OH" / "input.yaml").write_text("formula: OH\nHf: 37.3\n")
+    (tmp_path / "OH" / "other.yaml").write_text(INPUT_YAML)
+    (tmp_path / "notes.txt").write_text(INPUT_YAML)
+
+    jobs = batch.read_manifest(tmp_path)
+    assert [j.label for j in jobs] == ["H2O", "OH"]
+    assert [j.inp.formula for j in jobs] == ["H2O", "OH"]
+    assert [j.path for j in jobs] == [tmp_path, tmp_path / "OH"]
+
+
+def test__read_manifest__list(tmp_path):
+    manifest = tmp_path / "species.yaml"
+    manifest.write_text(
+        """
+        - {formula: H2O, Hf: -241.8}
+        - {formula: OH, Hf: 37.3, Tf: 0, mess_input: OH/pf.inp, nasa_output: OH.nasa}
+        """
+    )
+    jobs = batch.read_manifest(str(manifest))
+    assert [j.label for j in jobs] == ["species[0]", "species[1]"]
+    assert jobs[1].inp == Input(
+        formula="OH", Hf=37.3, Tf=0, mess_input="OH/pf.inp", nasa_output="OH.nasa"
+    )
+    assert all(j.path == tmp_path for j in jobs)
+
+
+def test__read_manifest__shared_paths(tmp_path):
+    # Records in one manifest can't share the default output file
+    manifest = tmp_path / "species.yaml"
+    manifest.write_text(
+        """
+        - {formula: H2O, Hf: -241.8, mess_input: H2O.inp}
+        - {formula: OH, Hf: 37.3, mess_input: OH.inp}
+        """
+    )
+    with pytest.raises(ValueError, match=r"species\[0\] and species\[1\].*nasa_output"):
+        batch.read_manifest(manifest)
+
+    # ... or input file
+    manifest.write_text(
+        """
+        - {formula: H2O, Hf: -241.8, nasa_output: H2O.nasa}
+        - {formula: OH, Hf: 37.3, nasa_output: OH.nasa}
+        """
+    )
+    with pytest.raises(ValueError, match="mess_input"):
+        batch.read_manifest(manifest)
+
+    # ... and neither can inputs in the same directory
+    manifest.unlink()
+    (tmp_path / "H2O.yaml").write_text(INPUT_YAML)
+    (tmp_path / "OH.yaml").write_text("formula: OH\nHf: 37.3\n")
+    with pytest.raises(ValueError, match="H2O and OH"):
+        batch.read_manifest(tmp_path)
+
+
+def test__read_manifest__invalid(tmp_path):
+    manifest = tmp_path / "species.yaml"
+    manifest.write_text(INPUT_YAML)
+    with pytest.raises(ValueError, match="does not contain a list"):
+        batch.read_manifest(manifest)
+
+    manifest.write_text("- {formula: H2O}\n")
+    with pytest.raises(ValidationError):
+        batch.read_manifest(manifest)
+
+    with pytest.raises(FileNotFoundError):
+        batch.read_manifest(tmp_path / "missing.yaml")
+
+
+def test__run_job(tmp_path):
+    inp = Input(formula="NHNOH", Hf=88.5, Tf=0, fitter="native")
+    (tmp_path / "pf.inp").write_text((EXAMPLE_PATH / "pf.inp").read_text())
+    cache = Cache(path=tmp_path / "cache")
+    key = cache.key(inp, (tmp_path / "pf.inp").read_text(), Path())
+    cache.put(key, CacheEntry(pf_str=(EXAMPLE_PATH / "pf.dat").read_text()))
+
+    res = batch.run_job(
+        batch.Job(label="NHNOH", inp=inp, path=tmp_path), cache=cache, profile=True
+    )
+    assert res.ok, res.message
+    assert res.nasa == (tmp_path / "fit.nasa").read_text()
+    assert "cache_get" in [r.stage for r in res.profile]
+
+    # Errors are captured in the result
+    inp = inp.model_copy(update={"mess_input": "missing.inp"})
+    res = batch.run_job(batch.Job(label="missing", inp=inp, path=tmp_path))
+    assert not res.ok
+    assert res.message.startswith("FileNotFoundError")
+    assert res.nasa is None
+    assert res.profile == []
+
+
+@pytest.mark.parametrize(
+    "script, timeout, message",
+    [
+        ("exit 1", None, "CalledProcessError"),
+        ("sleep 10", 0.05, "TimeoutError: messpf timed out"),
+    ],
+)
+def test__run_job__messpf_error(tmp_path, monkeypatch, script, timeout, message):
+    bin_path = tmp_path / "bin"
+    bin_path.mkdir()
+    (bin_path / "messpf").write_text(f"#!/bin/sh\n{script}\n")
+    (bin_path / "messpf").chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_path), prepend=os.pathsep)
+
+    (tmp_path / "pf.inp").write_text("")
+    inp = Input(formula="NHNOH", Hf=88.5, Tf=0)
+    job = batch.Job(label="NHNOH", inp=inp, path=tmp_path)
+    res = batch.run_job(job, timeout=timeout)
+    assert not res.ok
+    assert res.message.startswith(message)
+
+
+def test__run_batch(tmp_path):
+    jobs = [
+        batch.Job(label=str(i), inp=Input(formula="H2O", Hf=-241.8), path=tmp_path)
+        for i in range(3)
+    ]
+    labels = []
+    results = batch.run_batch(jobs, nprocs=2, callback=lambda r: labels.append(r.label))
+    assert [r.label for r in results] == ["0", "1", "2"]
+    assert sorted(labels) == ["0", "1", "2"]
+    assert not any(r.ok for r in results)
+
+
+def test__thermo_block_and_status(tmp_path):
+    results = [
+        batch.Result(label="H2O", ok=True, nasa="H2O fit"),
+        batch.Result(label="OH", ok=False, message="ValueError: bad"),
+        batch.Result(label="HO2", ok=True, nasa="HO2 fit"),
+    ]
+    assert batch.thermo_block(results) == "THERMO\nH2O fit\nHO2 fit\nEND\n"
+
+    status_file = tmp_path / "status.csv"
+    batch.write_status(results, status_file)
+    with status_file.open() as file:
+        rows = list(csv.reader(file))
+    assert rows == [
+        ["label", "status", "message"],
+        ["H2O", "ok", ""],
+        ["OH", "failed", "ValueError: bad"],
+        ["HO2", "ok", ""],
+    ]
@@ -0,0 +1,107 @@
+"""Test mess2nasa.cache."""
+
+import os
+
+import pytest
+
+from mess2nasa.cache import MESSPF_FILE, PAC99_FILE, Cache, CacheEntry
+from mess2nasa.pipeline import Input
+
+INP = Input(formula="H2O", Hf=-241.8, Tf=298, energy_unit="kJ")
+
+
+@pytest.fixture
+def pac_share_path(tmp_path):
+    path = tmp_path / "share"
+    path.mkdir()
+    (path / "new.groups").write_text("groups\n")
+    return path
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"formula": "HO2"},
+        {"Hf": -241.9},
+        {"Tf": 0},
+        {"energy_unit": "kcal"},
+        {"fitter": "native"},
+    ],
+)
+def test__key(tmp_path, pac_share_path, update):
+    cache = Cache(path=tmp_path / "cache")
+    key = cache.key(INP, "pf input", pac_share_path)
+    assert key == cache.key(INP.model_copy(), "pf input", pac_share_path)
+    assert key != cache.key(INP.model_copy(update=update), "pf input", pac_share_path)
+
+
+def test__key__inputs(tmp_path, pac_share_path):
+    cache = Cache(path=tmp_path / "cache")
+    key = cache.key(INP, "pf input", pac_share_path)
+    assert key != cache.key(INP, "other pf input", pac_share_path)
+
+    # Fields that don't enter the fit are ignored
+    inp = INP.model_copy(update={"mess_input": "other.inp", "nasa_output": "o.nasa"})
+    assert key == cache.key(inp, "pf input", pac_share_path)
+
+    # PAC99 share files are hashed by name, size, and modification time
+    share_file = pac_share_path / "new.groups"
+    keys = {key}
+    share_file.write_text("other groups\n")
+    keys.add(cache.key(INP, "pf input", pac_share_path))
+    os.utime(share_file, ns=(0, 0))
+    keys.add(cache.key(INP, "pf input", pac_share_path))
+    share_file.rename(pac_share_path / "old.groups")
+    keys.add(cache.key(INP, "pf input", pac_share_path))
+    assert len(keys) == 4
+
+    # ... but only for PAC99 fits
+    inp = INP.model_copy(update={"fitter": "native"})
+    key = cache.key(inp, "pf input", pac_share_path)
+    (pac_share_path / "old.groups").unlink()
+    assert key == cache.key(inp, "pf input", pac_share_path)
+
+
+@pytest.mark.parametrize("pac_out_str", [None, "pac99 output"])
+def test__get_put(tmp_path, pac_out_str):
+    cache = Cache(path=tmp_path / "cache")
+    entry = CacheEntry(pf_str="messpf output", pac_out_str=pac_out_str)
+    cache.put("key", entry)
+    assert cache.get("key") == entry
+    assert (cache.path / "key" / MESSPF_FILE).exists()
+    assert (cache.path / "key" / PAC99_FILE).exists() == (pac_out_str is not None)
+
+    # Putting an entry again replaces it
+    entry = CacheEntry(pf_str="new messpf output")
+    cache.put("key", entry)
+    assert cache.get("key") == entry
+
+
+def test__get__missing(tmp_path):
+    cache = Cache(path=tmp_path / "cache")
+    assert cache.get("key") is None
+
+    cache.put("other key", CacheEntry(pf_str="messpf output"))
+    assert cache.get("key") is None
+
+
+def test__evict(tmp_path):
+    # Each entry is 10 bytes, so only three fit
+    cache = Cache(path=tmp_path / "cache", max_size=30)
+    for i, key in enumerate("abc"):
+        cache.put(key, CacheEntry(pf_str="0123456789"))
+        os.utime(cache.path / key, (i, i))
+
+    # Using an entry protects it from eviction
+    assert cache.get("a") is not None
+    cache.put("d", CacheEntry(pf_str="0123456789"))
+    assert sorted(p.name for p in cache.path.iterdir()) == ["a", "c", "d"]
+
+    # Adding a larger entry evicts as many entries as needed
+    for i, key in enumerate("dca"):
+        os.utime(cache.path / key, (i, i))
+    cache.put("e", CacheEntry(pf_str="0123456789", pac_out_str="0123456789"))
+    assert sorted(p.name for p in cache.path.iterdir()) == ["a", "e"]
+
+    cache.clear()
+    assert not cache.path.exists()
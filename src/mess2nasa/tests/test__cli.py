@@ -0,0 +1,32 @@
+"""Test mess2nasa.cli."""
+
+import subprocess
+import sys
+import textwrap
+
+# Modules that should only be loaded once a species is actually fit
+HEAVY_MODULES = ("altair", "pandas", "xarray", "pint", "autochem.therm")
+
+# Cold-start budget for the command-line interface, in seconds
+CLI_IMPORT_BUDGET = 1.0
+
+
+def test__import_time():
+    code = textwrap.dedent(
+        """
+        import sys, time
+        t0 = time.perf_counter()
+        import mess2nasa.cli
+        print(time.perf_counter() - t0)
+        print(' '.join(sys.modules))
+        """
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    time_str, mods_str = out.splitlines()[-2:]
+    time, mods = float(time_str), mods_str.split()
+
+    loaded = [m for m in HEAVY_MODULES if m in mods]
+    assert not loaded, f"Modules loaded on CLI import: {loaded}"
+    assert time < CLI_IMPORT_BUDGET, f"CLI import took {time:.2f} s"
@@ -0,0 +1,99 @@
+"""Test mess2nasa.instrument."""
+
+import subprocess
+import time
+
+import pytest
+
+from mess2nasa import instrument
+from mess2nasa.instrument import StageRecord, labeled, recording, stage
+
+
+def test__stage():
+    # Nothing is recorded outside of a recording or collector
+    with stage("idle"):
+        pass
+
+    with recording() as records:
+        with stage("sleep"):
+            time.sleep(0.05)
+        with stage("child"):
+            subprocess.run(["sleep", "0.05"], check=True)
+
+    assert [r.stage for r in records] == ["sleep", "child"]
+    assert all(r.label is None for r in records)
+    assert records[0].wall >= 0.05
+    assert records[0].start <= records[1].start
+    assert records[1].child_max_rss > 0
+
+
+def test__stage__error():
+    with recording() as records:
+        with pytest.raises(RuntimeError), stage("fail"):
+            raise RuntimeError
+    assert [r.stage for r in records] == ["fail"]
+
+
+def test__recording():
+    with recording() as records:
+        with stage("a"):
+            pass
+        with recording() as inner_records:
+            with stage("b"):
+                pass
+        with stage("c"):
+            pass
+    assert [r.stage for r in records] == ["a", "c"]
+    assert [r.stage for r in inner_records] == ["b"]
+
+    with stage("d"):
+        pass
+    assert len(records) == 2
+
+
+def test__labeled():
+    with recording() as records:
+        with labeled("H2O"):
+            with stage("a"):
+                pass
+            with labeled("OH"), stage("b"):
+                pass
+            with stage("c"):
+                pass
+        with stage("d"):
+            pass
+    assert [(r.label, r.stage) for r in records] == [
+        ("H2O", "a"),
+        ("OH", "b"),
+        ("H2O", "c"),
+        (None, "d"),
+    ]
+
+
+def test__collectors():
+    records = []
+    instrument.add_collector(records.append)
+    try:
+        with labeled("H2O"), stage("a"):
+            pass
+    finally:
+        instrument.remove_collector(records.append)
+    with stage("b"):
+        pass
+    assert [(r.label, r.stage) for r in records] == [("H2O", "a")]
+
+
+def test__summary_table():
+    record = StageRecord(
+        stage="messpf",
+        start=0.0,
+        wall=1.0,
+        cpu=0.5,
+        child_cpu=2.0,
+        child_max_rss=2 * 1024**2,
+        read_bytes=1024**2,
+        write_bytes=1024**2,
+    )
+    lines = instrument.summary_table([record, record]).splitlines()
+    assert lines[0].split()[:2] == ["stage", "count"]
+    assert lines[1].split() == ["messpf", "2", "2.000", "1.000", "4.000", "2.0", "4.0"]
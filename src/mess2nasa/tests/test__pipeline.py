@@ -0,0 +1,80 @@
+"""Test mess2nasa.pipeline."""
+
+import asyncio
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from mess2nasa import aio, pipeline
+from mess2nasa.cache import Cache
+from mess2nasa.instrument import recording
+from mess2nasa.pipeline import Input
+from mess2nasa.scratch import Scratch
+
+EXAMPLE_PATH = Path(__file__).parents[3] / "examples" / "NHNOH"
+
+
+def test__run_process(tmp_path):
+    log_path = tmp_path / "cat.log"
+    pipeline.run_process(["cat"], tmp_path, input_=b"input", log_path=log_path)
+    assert log_path.read_text() == "input"
+    assert log_path.with_suffix(".err").read_text() == ""
+
+    with pytest.raises(subprocess.CalledProcessError):
+        pipeline.run_process(["false"], tmp_path)
+
+
+def test__run_process__timeout(tmp_path):
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError, match="sleep timed out"):
+        pipeline.run_process(["sleep", "10"], tmp_path, timeout=0.05)
+    assert time.perf_counter() - start < 5
+
+
+def fake_messpf(bin_path: Path, script: str) -> None:
+    """Put a fake MESS-PF script on the path."""
+    bin_path.mkdir()
+    (bin_path / "messpf").write_text(f"#!/bin/sh\n{script}\n")
+    (bin_path / "messpf").chmod(0o755)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test__run(tmp_path, monkeypatch, use_async):
+    # The fake MESS-PF writes the example output for its input
+    fake_messpf(tmp_path / "bin", f'cp {EXAMPLE_PATH / "pf.dat"} "${{1%.inp}}.dat"')
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"), prepend=os.pathsep)
+    (tmp_path / "pf.inp").write_text((EXAMPLE_PATH / "pf.inp").read_text())
+    inp = Input(formula="NHNOH", Hf=88.5, Tf=0, fitter="native")
+    cache = Cache(path=tmp_path / "cache")
+
+    def run(scratch: Scratch) -> str:
+        if use_async:
+            stages = aio.Stages(aio.Limits())
+            coro = aio.run(inp, stages, path=tmp_path, cache=cache, scratch=scratch)
+            return asyncio.run(coro)
+        return pipeline.run(inp, path=tmp_path, cache=cache, scratch=scratch)
+
+    with recording() as records:
+        nasa_str = run(Scratch(keep="none"))
+    assert nasa_str == (tmp_path / "fit.nasa").read_text()
+    assert [r.stage for r in records if r.stage in ("messpf", "cache_put")] == [
+        "messpf",
+        "cache_put",
+    ]
+    assert not list(tmp_path.glob("run_*"))
+
+    # A cache hit doesn't run MESS-PF
+    with recording() as records:
+        assert run(Scratch(keep="none")) == nasa_str
+    assert "messpf" not in [r.stage for r in records]
+
+    # A failed run raises its error and keeps its run directory
+    (tmp_path / "bin" / "messpf").write_text("#!/bin/sh\nexit 1\n")
+    cache.clear()
+    with pytest.raises(subprocess.CalledProcessError):
+        run(Scratch(keep="failed"))
+    (run_path,) = tmp_path.glob("run_*")
+    assert (run_path / "pf.inp").exists()
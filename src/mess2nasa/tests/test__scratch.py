@@ -0,0 +1,90 @@
+"""Test mess2nasa.scratch."""
+
+import pytest
+
+from mess2nasa.scratch import Scratch, run_directory, stage_file
+
+RUN_FILES = ["fit.i97", "fit.c97", "fit.log", "fit.err", "new.groups"]
+
+# Keep policy, whether the run fails, and whether its run directory is kept
+KEEP_CASES = [
+    ("all", False, True),
+    ("all", True, True),
+    ("failed", False, False),
+    ("failed", True, True),
+    ("none", False, False),
+    ("none", True, False),
+]
+
+
+def stage_run(scratch: Scratch, path, *, fail: bool) -> None:
+    """Write run files to a staged run directory, then succeed or fail."""
+    with scratch.run_directory(path) as run_path:
+        for name in RUN_FILES:
+            (run_path / name).write_text(name)
+        if fail:
+            raise RuntimeError
+
+
+@pytest.mark.parametrize("keep, fail, kept", KEEP_CASES)
+def test__run_directory(tmp_path, keep, fail, kept):
+    path = tmp_path / "work"
+    path.mkdir()
+    scratch = Scratch(keep=keep)
+    if fail:
+        with pytest.raises(RuntimeError):
+            stage_run(scratch, path, fail=fail)
+    else:
+        stage_run(scratch, path, fail=fail)
+
+    run_paths = list(path.iterdir())
+    assert len(run_paths) == int(kept)
+    if kept:
+        (run_path,) = run_paths
+        assert run_path.name.startswith("run_")
+        assert sorted(f.name for f in run_path.iterdir()) == sorted(RUN_FILES)
+
+
+@pytest.mark.parametrize("keep, fail, kept", KEEP_CASES)
+def test__run_directory__scratch(tmp_path, keep, fail, kept):
+    path = tmp_path / "work"
+    root = tmp_path / "scratch"
+    path.mkdir()
+    root.mkdir()
+    scratch = Scratch(root=root, keep=keep)
+    if fail:
+        with pytest.raises(RuntimeError):
+            stage_run(scratch, path, fail=fail)
+    else:
+        stage_run(scratch, path, fail=fail)
+
+    # Scratch directories are always removed, and only outputs and logs copied back
+    assert list(root.iterdir()) == []
+    run_paths = list(path.iterdir())
+    assert len(run_paths) == int(kept)
+    if kept:
+        (run_path,) = run_paths
+        assert sorted(f.name for f in run_path.iterdir()) == [
+            "fit.c97",
+            "fit.err",
+            "fit.log",
+        ]
+        assert (run_path / "fit.c97").read_text() == "fit.c97"
+
+
+def test__run_directory__unique(tmp_path):
+    run_paths = {run_directory(tmp_path) for _ in range(10)}
+    assert len(run_paths) == 10
+    assert all(p.parent == tmp_path and p.name.startswith("run_") for p in run_paths)
+
+
+@pytest.mark.parametrize("link", ["symlink", "hardlink", "copy"])
+def test__stage_file(tmp_path, link):
+    src_path = tmp_path / "new.groups"
+    src_path.write_text("groups")
+    dest_path = tmp_path / "run" / "new.groups"
+    dest_path.parent.mkdir()
+    stage_file(src_path, dest_path, link=link)
+    assert dest_path.read_text() == "groups"
+    assert dest_path.is_symlink() == (link == "symlink")
+    assert (dest_path.stat().st_nlink == 2) == (link == "hardlink")
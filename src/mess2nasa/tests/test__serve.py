@@ -0,0 +1,148 @@
+"""Test mess2nasa.serve."""
+
+import asyncio
+import concurrent.futures
+import json
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from mess2nasa.cache import Cache, CacheEntry
+from mess2nasa.serve import Request, Server, run_request
+
+EXAMPLE_PATH = Path(__file__).parents[3] / "examples" / "NHNOH"
+
+
+class BrokenExecutor(concurrent.futures.Executor):
+    """Worker pool whose workers have died."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenProcessPool("A worker died")
+
+
+def cached_request(cache: Cache, **kwargs) -> Request:
+    """Make an inline request whose MESS-PF output is already cached."""
+    mess_inp_str = (EXAMPLE_PATH / "pf.inp").read_text()
+    req = Request(
+        formula="NHNOH",
+        Hf=88.5,
+        Tf=0,
+        fitter="native",
+        mess_input_text=mess_inp_str,
+        **kwargs,
+    )
+    key = cache.key(req, mess_inp_str, Path())
+    cache.put(key, CacheEntry(pf_str=(EXAMPLE_PATH / "pf.dat").read_text()))
+    return req
+
+
+def serve_lines(server: Server, lines: list[bytes]) -> dict[str, dict]:
+    """Serve request lines, returning the results by label."""
+    lines = iter(lines)
+    results = {}
+
+    async def readline() -> bytes:
+        line = next(lines, b"")
+        if isinstance(line, Exception):
+            raise line
+        return line
+
+    async def write(data: bytes) -> None:
+        res = json.loads(data)
+        results[res["label"]] = res
+
+    asyncio.run(server.serve_stream(readline, write))
+    return results
+
+
+def test__request():
+    req = Request.model_validate_json(
+        '{"id": 1, "formula": "H2O", "Hf": -241.8, "Tf": 298.15}'
+    )
+    assert req.id == 1
+    assert req.Tf == 298
+    assert req.path == Path()
+    assert req.mess_input_text is None
+
+    with pytest.raises(ValidationError):
+        Request.model_validate_json('{"formula": "H2O"}')
+
+    with pytest.raises(ValidationError):
+        Request.model_validate_json('{"formula": "H2O", "Hf": -241.8, "Tf": 100}')
+
+
+def test__run_request(tmp_path):
+    cache = Cache(path=tmp_path / "cache")
+    req = cached_request(
+        cache, mess_input="sub/pf.inp", nasa_output="sub/fit.nasa", path=tmp_path
+    )
+    res = run_request(req, "NHNOH", cache=cache)
+    assert res.ok, res.message
+    assert res.label == "NHNOH"
+    assert "NHNOH" in res.nasa
+    # Inline inputs are run in a temporary directory, not the working directory
+    assert list(tmp_path.iterdir()) == [tmp_path / "cache"]
+
+    req = Request(formula="NHNOH", Hf=88.5, mess_input="missing.inp", path=tmp_path)
+    res = run_request(req, "missing")
+    assert not res.ok
+    assert res.message.startswith("FileNotFoundError")
+
+
+def test__serve_stream(tmp_path):
+    cache = Cache(path=tmp_path / "cache")
+    req = cached_request(cache, id="NHNOH")
+    lines = [
+        req.model_dump_json().encode() + b"\n",
+        b"\n",
+        b'{"formula": "H2O"}\n',
+        ValueError("Separator is not found, and chunk exceed the limit"),
+        b"not json\n",
+    ]
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        server = Server(executor, cache=cache)
+        results = serve_lines(server, lines)
+
+    assert sorted(results) == ["NHNOH", "line 3", "line 4", "line 5"]
+    assert results["NHNOH"]["ok"], results["NHNOH"]["message"]
+    assert not results["line 3"]["ok"]
+    assert not results["line 4"]["ok"]
+    assert "exceed the limit" in results["line 4"]["message"]
+    assert not results["line 5"]["ok"]
+
+
+def test__serve_stream__overlong_line():
+    async def serve() -> list[bytes]:
+        reader = asyncio.StreamReader(limit=16)
+        reader.feed_data(b'{"formula": "H2O", "Hf": -241.8}\n\n')
+        reader.feed_eof()
+        data = []
+
+        async def write(line: bytes) -> None:
+            data.append(line)
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            await Server(executor).serve_stream(reader.readline, write)
+        return data
+
+    (data,) = asyncio.run(serve())
+    res = json.loads(data)
+    assert res["label"] == "line 1"
+    assert not res["ok"]
+
+
+def test__serve_stream__broken_executor(tmp_path):
+    cache = Cache(path=tmp_path / "cache")
+    req = cached_request(cache)
+    line = req.model_dump_json().encode() + b"\n"
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        server = Server(BrokenExecutor(), cache=cache, make_executor=lambda: executor)
+        results = serve_lines(server, [line])
+        assert server.executor is executor
+        assert not results["line 1"]["ok"]
+        assert results["line 1"]["message"].startswith("BrokenProcessPool")
+
+        results = serve_lines(server, [line])
+        assert results["line 1"]["ok"], results["line 1"]["message"]